@@ -0,0 +1,134 @@
+"""Scope users, scores and configs per chat
+
+Revision ID: 3709c96fc5a8
+Revises: 68886637730e
+Create Date: 2026-10-18 04:28:33.485040
+
+"""
+import os
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3709c96fc5a8'
+down_revision: Union[str, Sequence[str], None] = '68886637730e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose existing rows are assigned to the legacy chat
+LEGACY_TABLES = ('users', 'attendances', 'chat_activities')
+
+
+def legacy_chat_id() -> str:
+    """Chat that owns the rows created before per-chat scoping.
+
+    Supplied by the operator with ``alembic -x legacy_chat_id=<chat id> upgrade head``
+    or the LEGACY_CHAT_ID environment variable. The upgrade is aborted when
+    legacy rows exist and no chat id was given, instead of parking them in a
+    chat that does not exist.
+    """
+    value = context.get_x_argument(as_dictionary=True).get('legacy_chat_id')
+    value = value or os.environ.get('LEGACY_CHAT_ID')
+    if value:
+        return str(int(value))
+
+    if context.is_offline_mode():
+        raise RuntimeError(
+            'Pass -x legacy_chat_id=<chat id> (or set LEGACY_CHAT_ID) to generate SQL for this '
+            'revision; existing users, attendances and chat activities are moved to that chat.'
+        )
+
+    bind = op.get_bind()
+    for table in LEGACY_TABLES:
+        if bind.execute(sa.text(f'SELECT 1 FROM {table} LIMIT 1')).first():
+            raise RuntimeError(
+                f'{table} has rows created before per-chat scoping. Re-run with '
+                '-x legacy_chat_id=<chat id> (or set LEGACY_CHAT_ID) to name the Telegram '
+                'group they belong to.'
+            )
+
+    # No legacy rows: the default only fills the new column of an empty table
+    return '0'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    chat_id = legacy_chat_id()
+
+    # Batch mode so SQLite can rebuild the tables for the constraint changes
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(
+            sa.Column('chat_id', sa.BigInteger(), nullable=False, server_default=chat_id)
+        )
+        batch_op.drop_index('ix_users_telegram_id')
+        batch_op.create_unique_constraint('uq_users_chat_id_telegram_id', ['chat_id', 'telegram_id'])
+        batch_op.drop_index('ix_users_total_score_id')
+        batch_op.drop_index('ix_users_chat_count_id')
+        batch_op.drop_index('ix_users_jackpot_ranking')
+        batch_op.drop_index('ix_users_consecutive_ranking')
+        batch_op.create_index('ix_users_chat_total_score_id', ['chat_id', 'total_score', 'id'], unique=False)
+        batch_op.create_index('ix_users_chat_chat_count_id', ['chat_id', 'chat_count', 'id'], unique=False)
+        batch_op.create_index('ix_users_chat_jackpot_ranking', ['chat_id', 'jackpot_count', 'max_jackpot', 'id'], unique=False)
+        batch_op.create_index('ix_users_chat_consecutive_ranking', ['chat_id', 'consecutive_days', 'total_attendance', 'id'], unique=False)
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('chat_id', server_default=None)
+
+    with op.batch_alter_table('attendances') as batch_op:
+        batch_op.add_column(
+            sa.Column('chat_id', sa.BigInteger(), nullable=False, server_default=chat_id)
+        )
+        batch_op.create_index('ix_attendances_chat_id_date', ['chat_id', 'date'], unique=False)
+        batch_op.create_foreign_key('fk_attendances_user_id_users', 'users', ['user_id'], ['id'])
+    with op.batch_alter_table('attendances') as batch_op:
+        batch_op.alter_column('chat_id', server_default=None)
+
+    with op.batch_alter_table('chat_activities') as batch_op:
+        batch_op.add_column(
+            sa.Column('chat_id', sa.BigInteger(), nullable=False, server_default=chat_id)
+        )
+        batch_op.create_index('ix_chat_activities_chat_id_created_at', ['chat_id', 'created_at'], unique=False)
+        batch_op.create_foreign_key('fk_chat_activities_user_id_users', 'users', ['user_id'], ['id'])
+    with op.batch_alter_table('chat_activities') as batch_op:
+        batch_op.alter_column('chat_id', server_default=None)
+
+    # NULL keeps the existing row (id=1) as the global default config
+    with op.batch_alter_table('score_configs') as batch_op:
+        batch_op.add_column(sa.Column('chat_id', sa.BigInteger(), nullable=True))
+        batch_op.create_unique_constraint('uq_score_configs_chat_id', ['chat_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Fails if the same Telegram user is registered in more than one chat,
+    since telegram_id becomes globally unique again.
+    """
+    with op.batch_alter_table('score_configs') as batch_op:
+        batch_op.drop_constraint('uq_score_configs_chat_id', type_='unique')
+        batch_op.drop_column('chat_id')
+
+    with op.batch_alter_table('chat_activities') as batch_op:
+        batch_op.drop_constraint('fk_chat_activities_user_id_users', type_='foreignkey')
+        batch_op.drop_index('ix_chat_activities_chat_id_created_at')
+        batch_op.drop_column('chat_id')
+
+    with op.batch_alter_table('attendances') as batch_op:
+        batch_op.drop_constraint('fk_attendances_user_id_users', type_='foreignkey')
+        batch_op.drop_index('ix_attendances_chat_id_date')
+        batch_op.drop_column('chat_id')
+
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_index('ix_users_chat_consecutive_ranking')
+        batch_op.drop_index('ix_users_chat_jackpot_ranking')
+        batch_op.drop_index('ix_users_chat_chat_count_id')
+        batch_op.drop_index('ix_users_chat_total_score_id')
+        batch_op.create_index('ix_users_consecutive_ranking', ['consecutive_days', 'total_attendance', 'id'], unique=False)
+        batch_op.create_index('ix_users_jackpot_ranking', ['jackpot_count', 'max_jackpot', 'id'], unique=False)
+        batch_op.create_index('ix_users_chat_count_id', ['chat_count', 'id'], unique=False)
+        batch_op.create_index('ix_users_total_score_id', ['total_score', 'id'], unique=False)
+        batch_op.drop_constraint('uq_users_chat_id_telegram_id', type_='unique')
+        batch_op.create_index('ix_users_telegram_id', ['telegram_id'], unique=True)
+        batch_op.drop_column('chat_id')
@@ -0,0 +1,30 @@
+"""Add user sketch to daily chat stats
+
+Revision ID: 554a214236dc
+Revises: a96727cc43bd
+Create Date: 2026-10-18 04:42:02.225170
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '554a214236dc'
+down_revision: Union[str, Sequence[str], None] = 'a96727cc43bd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Days rolled up before this revision keep a NULL sketch; range counts
+    # fall back to exact DISTINCT for them and the next activity rebuilds it
+    op.add_column('daily_chat_stats', sa.Column('user_sketch', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('daily_chat_stats', 'user_sketch')
@@ -0,0 +1,32 @@
+"""Purge stats snapshots with all-time top users
+
+Revision ID: 60a643a65601
+Revises: 554a214236dc
+Create Date: 2026-10-18 04:44:29.917264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '60a643a65601'
+down_revision: Union[str, Sequence[str], None] = '554a214236dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Snapshots frozen so far list the all-time ranking as the period's top
+    # users. They are derived data, so drop them and let the next request
+    # recompute each closed period from the rollups.
+    op.execute("DELETE FROM stats_snapshots")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Snapshots are recomputed on demand; nothing to restore
+    pass
@@ -0,0 +1,57 @@
+"""Add composite indexes for rankings and history queries
+
+Revision ID: 68886637730e
+Revises: 53cb0434c044
+Create Date: 2026-10-18 10:12:41.218374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '68886637730e'
+down_revision: Union[str, Sequence[str], None] = '53cb0434c044'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rankings: sort key + id so ORDER BY ... LIMIT and keyset/rank
+    # comparisons on (key, id) are served by one index range scan
+    op.create_index('ix_users_total_score_id', 'users', ['total_score', 'id'], unique=False)
+    op.create_index('ix_users_chat_count_id', 'users', ['chat_count', 'id'], unique=False)
+    op.create_index('ix_users_jackpot_ranking', 'users', ['jackpot_count', 'max_jackpot', 'id'], unique=False)
+    op.create_index('ix_users_consecutive_ranking', 'users', ['consecutive_days', 'total_attendance', 'id'], unique=False)
+    op.drop_index(op.f('ix_users_total_score'), table_name='users')
+    op.drop_index(op.f('ix_users_chat_count'), table_name='users')
+
+    # Per-user history (user_id prefix also covers the old single-column index)
+    op.create_index('ix_attendances_user_id_date', 'attendances', ['user_id', 'date'], unique=False)
+    op.drop_index(op.f('ix_attendances_user_id'), table_name='attendances')
+
+    op.create_index('ix_chat_activities_user_id_created_at', 'chat_activities', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_chat_activities_user_jackpots', 'chat_activities', ['user_id', 'is_jackpot', 'final_score'], unique=False)
+    op.drop_index(op.f('ix_chat_activities_user_id'), table_name='chat_activities')
+    op.drop_index(op.f('ix_chat_activities_is_jackpot'), table_name='chat_activities')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_chat_activities_is_jackpot'), 'chat_activities', ['is_jackpot'], unique=False)
+    op.create_index(op.f('ix_chat_activities_user_id'), 'chat_activities', ['user_id'], unique=False)
+    op.drop_index('ix_chat_activities_user_jackpots', table_name='chat_activities')
+    op.drop_index('ix_chat_activities_user_id_created_at', table_name='chat_activities')
+
+    op.create_index(op.f('ix_attendances_user_id'), 'attendances', ['user_id'], unique=False)
+    op.drop_index('ix_attendances_user_id_date', table_name='attendances')
+
+    op.create_index(op.f('ix_users_chat_count'), 'users', ['chat_count'], unique=False)
+    op.create_index(op.f('ix_users_total_score'), 'users', ['total_score'], unique=False)
+    op.drop_index('ix_users_consecutive_ranking', table_name='users')
+    op.drop_index('ix_users_jackpot_ranking', table_name='users')
+    op.drop_index('ix_users_chat_count_id', table_name='users')
+    op.drop_index('ix_users_total_score_id', table_name='users')
@@ -0,0 +1,53 @@
+"""Add hourly chat stats rollup
+
+Revision ID: a96727cc43bd
+Revises: f0c5d2c0587a
+Create Date: 2026-10-18 04:38:48.591452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a96727cc43bd'
+down_revision: Union[str, Sequence[str], None] = 'f0c5d2c0587a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('hourly_chat_stats',
+    sa.Column('chat_id', sa.BigInteger(), nullable=False),
+    sa.Column('bucket', sa.DateTime(), nullable=False),
+    sa.Column('message_count', sa.Integer(), nullable=False),
+    sa.Column('chat_score', sa.Integer(), nullable=False),
+    sa.Column('jackpot_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('chat_id', 'bucket')
+    )
+
+    # Backfill hour buckets from the existing activity rows. SQLite keeps
+    # DateTime values as text, so emit the same format SQLAlchemy writes.
+    if op.get_bind().dialect.name == 'sqlite':
+        bucket = "strftime('%Y-%m-%d %H:00:00.000000', created_at)"
+    else:
+        bucket = "date_trunc('hour', created_at)"
+    op.execute(
+        f"""
+        INSERT INTO hourly_chat_stats (
+            chat_id, bucket, message_count, chat_score, jackpot_count
+        )
+        SELECT chat_id, {bucket}, COUNT(*), SUM(final_score),
+               SUM(CASE WHEN is_jackpot THEN 1 ELSE 0 END)
+        FROM chat_activities
+        GROUP BY chat_id, {bucket}
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('hourly_chat_stats')
@@ -0,0 +1,114 @@
+"""Unique attendance per user and date
+
+Revision ID: a9d1f7ca22f1
+Revises: 60a643a65601
+Create Date: 2026-10-18 04:47:28.974088
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d1f7ca22f1'
+down_revision: Union[str, Sequence[str], None] = '60a643a65601'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every attendance after the first one of the same user and day
+DUPLICATE = (
+    "a.id > (SELECT MIN(b.id) FROM attendances b "
+    "WHERE b.user_id = a.user_id AND b.date = a.date)"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Concurrent check-ins could record the same day twice. Take the extra
+    # points and attendance counts back out of the user totals and the daily
+    # rollups, then delete the duplicate rows (keeping the first one).
+    op.execute(
+        f"""
+        UPDATE users SET
+            total_score = total_score - (
+                SELECT COALESCE(SUM(a.score), 0) FROM attendances a
+                WHERE a.user_id = users.id AND {DUPLICATE}
+            ),
+            total_attendance = total_attendance - (
+                SELECT COUNT(*) FROM attendances a
+                WHERE a.user_id = users.id AND {DUPLICATE}
+            )
+        WHERE id IN (SELECT a.user_id FROM attendances a WHERE {DUPLICATE})
+        """
+    )
+    op.execute(
+        f"""
+        UPDATE daily_user_stats SET
+            check_in_count = check_in_count - (
+                SELECT COUNT(*) FROM attendances a
+                WHERE a.chat_id = daily_user_stats.chat_id
+                  AND a.date = daily_user_stats.date
+                  AND a.user_id = daily_user_stats.user_id
+                  AND {DUPLICATE}
+            ),
+            attendance_score = attendance_score - (
+                SELECT COALESCE(SUM(a.score), 0) FROM attendances a
+                WHERE a.chat_id = daily_user_stats.chat_id
+                  AND a.date = daily_user_stats.date
+                  AND a.user_id = daily_user_stats.user_id
+                  AND {DUPLICATE}
+            )
+        WHERE EXISTS (
+            SELECT 1 FROM attendances a
+            WHERE a.chat_id = daily_user_stats.chat_id
+              AND a.date = daily_user_stats.date
+              AND a.user_id = daily_user_stats.user_id
+              AND {DUPLICATE}
+        )
+        """
+    )
+    op.execute(
+        f"""
+        UPDATE daily_chat_stats SET
+            check_in_count = check_in_count - (
+                SELECT COUNT(*) FROM attendances a
+                WHERE a.chat_id = daily_chat_stats.chat_id
+                  AND a.date = daily_chat_stats.date
+                  AND {DUPLICATE}
+            ),
+            attendance_score = attendance_score - (
+                SELECT COALESCE(SUM(a.score), 0) FROM attendances a
+                WHERE a.chat_id = daily_chat_stats.chat_id
+                  AND a.date = daily_chat_stats.date
+                  AND {DUPLICATE}
+            )
+        WHERE EXISTS (
+            SELECT 1 FROM attendances a
+            WHERE a.chat_id = daily_chat_stats.chat_id
+              AND a.date = daily_chat_stats.date
+              AND {DUPLICATE}
+        )
+        """
+    )
+    op.execute(
+        f"DELETE FROM attendances WHERE id IN (SELECT a.id FROM attendances a WHERE {DUPLICATE})"
+    )
+    # Frozen snapshots may include the removed check-ins; they are recomputed on demand
+    op.execute("DELETE FROM stats_snapshots")
+
+    # The unique constraint's index also serves the per-user history lookups
+    with op.batch_alter_table('attendances') as batch_op:
+        batch_op.drop_index('ix_attendances_user_id_date')
+        batch_op.create_unique_constraint('uq_attendances_user_id_date', ['user_id', 'date'])
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Deleted duplicate attendances are not restored.
+    """
+    with op.batch_alter_table('attendances') as batch_op:
+        batch_op.drop_constraint('uq_attendances_user_id_date', type_='unique')
+        batch_op.create_index('ix_attendances_user_id_date', ['user_id', 'date'], unique=False)
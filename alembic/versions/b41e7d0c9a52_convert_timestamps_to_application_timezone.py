@@ -0,0 +1,145 @@
+"""Convert stored timestamps to the application timezone
+
+Revision ID: b41e7d0c9a52
+Revises: 3709c96fc5a8
+Create Date: 2026-10-18 04:31:12.603118
+
+Timestamps used to be written as naive server-local time and are now naive
+wall-clock time in settings.timezone. This rewrites the existing values so
+day and month boundaries (and the rollups backfilled by the next revisions)
+line up with the new ones.
+
+The zone the bot used to run in is supplied by the operator with
+``alembic -x timestamp_source_tz=<zone> upgrade head`` or the
+TIMESTAMP_SOURCE_TZ environment variable, e.g. ``UTC``. Passing the same
+zone as TIMEZONE keeps the stored values as they are.
+
+attendances.date is left untouched: it is the attendance day that was
+granted at the time, and re-dating it could put two check-ins of one user on
+the same day. users.last_checkin is left untouched with it, because only its
+date is read (to allow one check-in per day and count streaks) and that date
+must stay the date of the user's latest attendance.
+"""
+import os
+from typing import Optional, Sequence, Union
+
+from alembic import context, op
+import pytz
+import sqlalchemy as sa
+
+from config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41e7d0c9a52'
+down_revision: Union[str, Sequence[str], None] = '3709c96fc5a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Naive timestamp columns written before this revision
+TIMESTAMP_COLUMNS = {
+    'users': ('created_at', 'updated_at'),
+    'attendances': ('created_at',),
+    'chat_activities': ('created_at',),
+    'score_configs': ('updated_at',),
+}
+
+# Rows converted per round trip on databases without AT TIME ZONE
+BATCH_SIZE = 10_000
+
+
+def source_timezone() -> Optional[str]:
+    """Zone the stored timestamps were written in (None when there is nothing to convert)."""
+    value = context.get_x_argument(as_dictionary=True).get('timestamp_source_tz')
+    value = value or os.environ.get('TIMESTAMP_SOURCE_TZ')
+    if value:
+        return str(pytz.timezone(value).zone)
+
+    if context.is_offline_mode():
+        raise RuntimeError(
+            'Pass -x timestamp_source_tz=<zone> (or set TIMESTAMP_SOURCE_TZ) to generate SQL '
+            'for this revision; use the zone the bot ran in before, e.g. UTC.'
+        )
+
+    bind = op.get_bind()
+    for table in TIMESTAMP_COLUMNS:
+        if bind.execute(sa.text(f'SELECT 1 FROM {table} LIMIT 1')).first():
+            raise RuntimeError(
+                f'{table} has timestamps written in server-local time. Re-run with '
+                '-x timestamp_source_tz=<zone> (or set TIMESTAMP_SOURCE_TZ) naming the zone '
+                f'the bot ran in, e.g. UTC; pass {settings.timezone} to keep them as they are.'
+            )
+    return None
+
+
+def convert(source: str, target: str) -> None:
+    """Rewrite every timestamp column from wall-clock time in source to target."""
+    if source == target:
+        return
+
+    if op.get_context().dialect.name == 'postgresql':
+        for table_name, columns in TIMESTAMP_COLUMNS.items():
+            assignments = ', '.join(
+                f'{column} = ({column} AT TIME ZONE :source) AT TIME ZONE :target'
+                for column in columns
+            )
+            op.execute(
+                sa.text(f'UPDATE {table_name} SET {assignments}').bindparams(
+                    source=source, target=target
+                )
+            )
+        return
+
+    # No portable zone conversion in SQL; convert in batches of rows by id
+    source_zone, target_zone = pytz.timezone(source), pytz.timezone(target)
+
+    def shift(value):
+        if value is None:
+            return None
+        return source_zone.localize(value).astimezone(target_zone).replace(tzinfo=None)
+
+    bind = op.get_bind()
+    for table_name, columns in TIMESTAMP_COLUMNS.items():
+        table = sa.table(
+            table_name, sa.column('id'), *(sa.column(column, sa.DateTime()) for column in columns)
+        )
+        stmt = (
+            table.update()
+            .where(table.c.id == sa.bindparam('row_id'))
+            .values({column: sa.bindparam(f'new_{column}') for column in columns})
+        )
+        last_id = 0
+        while True:
+            rows = bind.execute(
+                sa.select(table).where(table.c.id > last_id).order_by(table.c.id).limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            bind.execute(
+                stmt,
+                [
+                    {
+                        'row_id': row.id,
+                        **{f'new_{column}': shift(getattr(row, column)) for column in columns},
+                    }
+                    for row in rows
+                ],
+            )
+            last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    source = source_timezone()
+    if source is not None:
+        convert(source, settings.timezone)
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Needs the same timestamp_source_tz to convert the values back.
+    """
+    source = source_timezone()
+    if source is not None:
+        convert(settings.timezone, source)
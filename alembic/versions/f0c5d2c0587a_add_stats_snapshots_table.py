@@ -0,0 +1,35 @@
+"""Add stats snapshots table
+
+Revision ID: f0c5d2c0587a
+Revises: f8527bcdce00
+Create Date: 2026-10-18 04:35:57.333815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f0c5d2c0587a'
+down_revision: Union[str, Sequence[str], None] = 'f8527bcdce00'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('stats_snapshots',
+    sa.Column('chat_id', sa.BigInteger(), nullable=False),
+    sa.Column('period', sa.String(length=16), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('chat_id', 'period', 'period_start')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('stats_snapshots')
@@ -0,0 +1,87 @@
+"""Add daily stats rollup tables
+
+Revision ID: f8527bcdce00
+Revises: b41e7d0c9a52
+Create Date: 2026-10-18 04:31:39.878329
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8527bcdce00'
+down_revision: Union[str, Sequence[str], None] = 'b41e7d0c9a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('daily_chat_stats',
+    sa.Column('chat_id', sa.BigInteger(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('message_count', sa.Integer(), nullable=False),
+    sa.Column('chat_score', sa.Integer(), nullable=False),
+    sa.Column('jackpot_count', sa.Integer(), nullable=False),
+    sa.Column('check_in_count', sa.Integer(), nullable=False),
+    sa.Column('attendance_score', sa.Integer(), nullable=False),
+    sa.Column('active_users', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('chat_id', 'date')
+    )
+    op.create_table('daily_user_stats',
+    sa.Column('chat_id', sa.BigInteger(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('message_count', sa.Integer(), nullable=False),
+    sa.Column('chat_score', sa.Integer(), nullable=False),
+    sa.Column('jackpot_count', sa.Integer(), nullable=False),
+    sa.Column('check_in_count', sa.Integer(), nullable=False),
+    sa.Column('attendance_score', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('chat_id', 'date', 'user_id')
+    )
+
+    # Backfill the rollups from the existing activity and attendance rows
+    op.execute(
+        """
+        INSERT INTO daily_user_stats (
+            chat_id, date, user_id, message_count, chat_score,
+            jackpot_count, check_in_count, attendance_score
+        )
+        SELECT chat_id, day, user_id, SUM(message_count), SUM(chat_score),
+               SUM(jackpot_count), SUM(check_in_count), SUM(attendance_score)
+        FROM (
+            SELECT chat_id, DATE(created_at) AS day, user_id,
+                   1 AS message_count, final_score AS chat_score,
+                   CASE WHEN is_jackpot THEN 1 ELSE 0 END AS jackpot_count,
+                   0 AS check_in_count, 0 AS attendance_score
+            FROM chat_activities
+            UNION ALL
+            SELECT chat_id, date AS day, user_id, 0, 0, 0, 1, score
+            FROM attendances
+        ) AS events
+        GROUP BY chat_id, day, user_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO daily_chat_stats (
+            chat_id, date, message_count, chat_score, jackpot_count,
+            check_in_count, attendance_score, active_users
+        )
+        SELECT chat_id, date, SUM(message_count), SUM(chat_score), SUM(jackpot_count),
+               SUM(check_in_count), SUM(attendance_score),
+               SUM(CASE WHEN message_count > 0 THEN 1 ELSE 0 END)
+        FROM daily_user_stats
+        GROUP BY chat_id, date
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('daily_user_stats')
+    op.drop_table('daily_chat_stats')
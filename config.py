@@ -30,6 +30,70 @@ class Settings(BaseSettings):
     timezone: str = Field(default="Asia/Seoul", description="Application timezone")
     debug: bool = Field(default=False, description="Debug mode")
 
+    # Update Delivery
+    run_mode: str = Field(default="polling", description="Update delivery mode (polling/webhook)")
+    webhook_base_url: str = Field(default="", description="Public base URL for the webhook")
+    webhook_path: str = Field(default="/webhook", description="Webhook route path")
+    webhook_host: str = Field(default="0.0.0.0", description="Webhook server bind host")
+    webhook_port: int = Field(default=8080, description="Webhook server bind port")
+    webhook_secret: str = Field(
+        default="", description="Webhook secret token (required in webhook mode)"
+    )
+    max_concurrent_updates: int = Field(
+        default=64, description="Max updates in flight before update intake is throttled"
+    )
+    max_queued_updates_per_user: int = Field(
+        default=20, description="Max updates one user may have waiting before new ones are dropped"
+    )
+
+    # Chat Ingestion
+    chat_ingestion_mode: str = Field(
+        default="direct", description="Chat activity ingestion mode (direct/batched)"
+    )
+    chat_flush_interval_ms: int = Field(
+        default=200, description="Batched ingestion flush interval in milliseconds"
+    )
+    chat_flush_batch_size: int = Field(
+        default=500, description="Batched ingestion rows per flush"
+    )
+    chat_flush_max_retries: int = Field(
+        default=5, description="Batched ingestion attempts per batch before it is dead-lettered"
+    )
+
+    # Caching
+    user_cache_size: int = Field(default=50_000, description="Max cached users")
+    user_cache_ttl: float = Field(default=300.0, description="Registered user cache TTL (s)")
+    user_cache_negative_ttl: float = Field(
+        default=60.0, description="Unregistered sender cache TTL (s)"
+    )
+    score_config_check_interval: float = Field(
+        default=30.0, description="Score config version re-check interval (s)"
+    )
+    leaderboard_max_chats: int = Field(
+        default=1000, description="Max chats with in-memory leaderboards"
+    )
+    leaderboard_reload_interval: float = Field(
+        default=60.0,
+        description="Reload in-memory leaderboards from the database after this long (s, 0: never)",
+    )
+    ranking_page_size: int = Field(default=10, description="Users per ranking page")
+    ranking_page_cache_size: int = Field(default=1024, description="Max cached ranking pages")
+    ranking_page_cache_ttl: float = Field(default=5.0, description="Ranking page cache TTL (s)")
+    response_cache_size: int = Field(default=2048, description="Max cached rendered responses")
+    response_cache_ttl: float = Field(
+        default=30.0, description="Rendered response freshness window (s)"
+    )
+    stats_cache_size: int = Field(default=4096, description="Max cached period stats")
+    stats_open_period_ttl: float = Field(
+        default=10.0, description="Cache TTL for stats of the current day/month (s)"
+    )
+    stats_period_close_delay: float = Field(
+        default=300.0, description="Delay after a period ends before its stats are frozen (s)"
+    )
+    stats_exact_distinct_rows: int = Field(
+        default=20000, description="Max daily user rows for exact active user counts"
+    )
+
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
     log_file: str = Field(default="logs/bot.log", description="Log file path")
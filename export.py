@@ -0,0 +1,165 @@
+"""
+Export chat activity and attendance history to CSV.
+
+Rows are streamed through a server-side cursor and written in id-range
+chunks, one file per chunk, so memory stays flat on multi-million-row
+tables. Chunks sit on a fixed grid of --chunk-size ids ([0, n), [n, 2n), ...)
+and a file is named after its grid cell, never after the export bounds, so
+re-running the command never writes two files covering the same ids.
+
+A cell whose whole id range was exported is written as
+``<prefix>_<start>-<end>.csv`` and skipped on later runs. Ids are handed out
+before commit, so a row with a lower id can still appear after a higher one
+(e.g. a slow multi-row insert from the batched writer); a cell is therefore
+final only once it ends at least --settle-ids ids below the current max id.
+Any other cell (near the max id, or cut by --start-id/--end-id) is written as
+``<prefix>_<start>-<end>.partial.csv`` and rewritten on every run until it is
+final, when the partial file is removed. Keep --chunk-size fixed for an output
+directory, or the grids will overlap.
+
+Each file is written to a temporary file and renamed when complete. The export
+runs in its own process and connection, so it never blocks the bot's event
+loop.
+
+Usage:
+    python export.py chat_activities --out exports/
+    python export.py attendances --out exports/ --chat-id -1001234567890
+    python export.py chat_activities --out exports/ --start-id 1000000 --chunk-size 500000
+"""
+import argparse
+import asyncio
+import csv
+import logging
+import os
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from src.infrastructure.database.connection import db_manager
+from src.repositories.export_repository import EXPORT_TABLES, ExportRepository
+
+logger = logging.getLogger("export")
+
+# Row ids start at 1, so a cell is complete once it covers ids from max(cell start, 1)
+FIRST_ID = 1
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Export history tables to CSV")
+    parser.add_argument("table", choices=sorted(EXPORT_TABLES), help="Table to export")
+    parser.add_argument("--out", type=Path, required=True, help="Output directory")
+    parser.add_argument("--chat-id", type=int, help="Only export rows of this chat")
+    parser.add_argument("--start-id", type=int, default=1, help="First id to export")
+    parser.add_argument(
+        "--end-id", type=int, help="Stop before this id (default: current max id + 1)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="Ids per output file")
+    parser.add_argument("--batch-size", type=int, default=5_000, help="Rows per cursor fetch")
+    parser.add_argument(
+        "--settle-ids",
+        type=int,
+        default=10_000,
+        help="How far below the max id a chunk must end before it is written as final",
+    )
+    return parser.parse_args()
+
+
+def grid_cells(
+    start_id: int, end_id: int, chunk_size: int, settled_id: Optional[int] = None
+) -> Iterator[Tuple[int, int, bool]]:
+    """Yield (cell start, cell end, complete) for grid cells overlapping [start_id, end_id).
+
+    A cell is complete when it lies inside the range and ends at or below settled_id
+    (ids above it may still gain rows from transactions that have not committed yet).
+    """
+    final_end = end_id if settled_id is None else min(end_id, settled_id)
+    cell_start = start_id // chunk_size * chunk_size
+    while cell_start < end_id:
+        cell_end = cell_start + chunk_size
+        complete = start_id <= max(cell_start, FIRST_ID) and cell_end <= final_end
+        yield cell_start, cell_end, complete
+        cell_start = cell_end
+
+
+async def export_chunk(
+    args: argparse.Namespace, columns: List[str], start_id: int, end_id: int, path: Path
+) -> int:
+    """Stream one id range into a CSV file, returning the number of rows written."""
+    model = EXPORT_TABLES[args.table]
+    part_path = path.with_name(path.name + ".part")
+    rows = 0
+
+    # One short transaction per chunk, so no cursor stays open for the whole export
+    async with db_manager.session() as session:
+        repo = ExportRepository(session)
+        with part_path.open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            async for row in repo.stream_rows(
+                model, start_id, end_id, chat_id=args.chat_id, batch_size=args.batch_size
+            ):
+                writer.writerow(row)
+                rows += 1
+
+    os.replace(part_path, path)
+    return rows
+
+
+async def export(args: argparse.Namespace) -> None:
+    """Export the requested id range chunk by chunk."""
+    model = EXPORT_TABLES[args.table]
+    columns = ExportRepository.columns(model)
+
+    async with db_manager.session() as session:
+        max_id = await ExportRepository(session).max_id(model)
+    # Pin the upper bound so rows written during the export are left for the next run
+    end_id = max_id + 1 if args.end_id is None else args.end_id
+    settled_id = max_id + 1 - args.settle_ids
+
+    prefix = args.table if args.chat_id is None else f"{args.table}_chat{args.chat_id}"
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    total = 0
+    cells = grid_cells(args.start_id, end_id, args.chunk_size, settled_id)
+    for cell_start, cell_end, complete in cells:
+        name = f"{prefix}_{cell_start:012d}-{cell_end:012d}"
+        path = args.out / f"{name}.csv"
+        partial_path = args.out / f"{name}.partial.csv"
+        if path.exists():
+            logger.info("Skipping %s (already exported)", path.name)
+            partial_path.unlink(missing_ok=True)
+            continue
+
+        if complete:
+            rows = await export_chunk(args, columns, cell_start, cell_end, path)
+            partial_path.unlink(missing_ok=True)
+        else:
+            # Only the part inside the requested range; rewritten until the cell is complete
+            rows = await export_chunk(
+                args,
+                columns,
+                max(cell_start, args.start_id),
+                min(cell_end, end_id),
+                partial_path,
+            )
+            path = partial_path
+        total += rows
+        logger.info("Exported %s rows to %s", rows, path.name)
+
+    logger.info(
+        "Export of %s finished: %s rows in ids [%s, %s)", args.table, total, args.start_id, end_id
+    )
+
+
+async def main():
+    """Export entry point."""
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    try:
+        await export(args)
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,27 +10,21 @@ from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 
 from config import settings
+from src.container import ServiceContainer
+from src.infrastructure.cache.leaderboard import leaderboards
+from src.infrastructure.cache.ranking_page_cache import ranking_page_cache
+from src.infrastructure.cache.score_config_cache import score_config_cache
+from src.infrastructure.cache.stats_cache import stats_cache
+from src.infrastructure.cache.user_cache import user_cache
 from src.infrastructure.database.connection import db_manager
+from src.infrastructure.locks import user_locks
+from src.infrastructure.metrics import metrics
+from src.infrastructure.webhook import run_webhook
+from src.repositories.chat_activity_writer import ChatActivityWriter
 
-# Repositories
-from src.repositories.user_repository import UserRepository
-from src.repositories.attendance_repository import AttendanceRepository
-from src.repositories.chat_activity_repository import ChatActivityRepository
-from src.repositories.score_config_repository import ScoreConfigRepository
-
-# Use Cases
-from src.core.use_cases.check_in_usecase import CheckInUseCase
-from src.core.use_cases.process_message_usecase import ProcessMessageUseCase
-from src.core.use_cases.get_user_info_usecase import GetUserInfoUseCase
-from src.core.use_cases.get_ranking_usecase import GetRankingUseCase
-from src.core.use_cases.get_daily_stats_usecase import GetDailyStatsUseCase
-from src.core.use_cases.get_monthly_stats_usecase import GetMonthlyStatsUseCase
-
-# Services
-from src.services.attendance_service import AttendanceService
-from src.services.chat_activity_service import ChatActivityService
-from src.services.user_service import UserService
-from src.services.stats_service import StatsService
+# Middlewares
+from src.middlewares.scheduling_middleware import UpdateSchedulerMiddleware
+from src.middlewares.services_middleware import ContainerMiddleware, DependencyMiddleware
 
 # Handlers
 from src.handlers import (
@@ -58,47 +52,42 @@ def setup_logging():
 
 async def setup_dependencies(dp: Dispatcher):
     """Setup dependency injection"""
+    activity_writer = None
+    if settings.chat_ingestion_mode == "batched":
+        activity_writer = ChatActivityWriter(
+            db_manager.session,
+            flush_interval_ms=settings.chat_flush_interval_ms,
+            batch_size=settings.chat_flush_batch_size,
+            max_retries=settings.chat_flush_max_retries,
+            leaderboards=leaderboards,
+        )
+
+    def create_container() -> ServiceContainer:
+        """Create per-update lazy service container"""
+        return ServiceContainer(
+            db_manager.session_factory,
+            user_cache=user_cache,
+            score_config_cache=score_config_cache,
+            activity_writer=activity_writer,
+            leaderboards=leaderboards,
+            ranking_page_cache=ranking_page_cache,
+            stats_cache=stats_cache,
+        )
+
+    # Bounded, per-user ordered update processing (must be the outermost)
+    scheduler = UpdateSchedulerMiddleware(
+        max_in_flight=settings.max_concurrent_updates,
+        max_queued_per_user=settings.max_queued_updates_per_user,
+    )
+    dp.update.outer_middleware(scheduler)
+
+    # Container per update, services resolved only for matched handlers
+    dp.update.outer_middleware(ContainerMiddleware(create_container, user_locks))
+    dp.message.middleware(DependencyMiddleware())
+    dp.callback_query.middleware(DependencyMiddleware())
 
-    async def get_services():
-        """Create services with repositories"""
-        async with db_manager.session() as session:
-            # Repositories
-            user_repo = UserRepository(session)
-            attendance_repo = AttendanceRepository(session)
-            chat_activity_repo = ChatActivityRepository(session)
-            config_repo = ScoreConfigRepository(session)
-
-            # Use Cases
-            checkin_usecase = CheckInUseCase(user_repo, attendance_repo, config_repo)
-            process_message_usecase = ProcessMessageUseCase(
-                user_repo, chat_activity_repo, config_repo
-            )
-            get_user_info_usecase = GetUserInfoUseCase(
-                user_repo, attendance_repo, chat_activity_repo
-            )
-            get_ranking_usecase = GetRankingUseCase(user_repo)
-            daily_stats_usecase = GetDailyStatsUseCase(
-                user_repo, attendance_repo, chat_activity_repo
-            )
-            monthly_stats_usecase = GetMonthlyStatsUseCase(
-                user_repo, attendance_repo, chat_activity_repo
-            )
-
-            # Services
-            attendance_service = AttendanceService(checkin_usecase)
-            chat_activity_service = ChatActivityService(process_message_usecase)
-            user_service = UserService(get_user_info_usecase, get_ranking_usecase)
-            stats_service = StatsService(daily_stats_usecase, monthly_stats_usecase)
-
-            return {
-                "attendance_service": attendance_service,
-                "chat_activity_service": chat_activity_service,
-                "user_service": user_service,
-                "stats_service": stats_service,
-            }
-
-    # Store services factory in dispatcher
-    dp["get_services"] = get_services
+    dp["chat_activity_writer"] = activity_writer
+    dp["update_scheduler"] = scheduler
 
 
 def register_handlers(dp: Dispatcher):
@@ -148,19 +137,24 @@ async def main():
     # Startup
     await on_startup()
 
+    activity_writer = dp["chat_activity_writer"]
+    if activity_writer:
+        activity_writer.start()
+        logger.info("Batched chat ingestion enabled")
+
     try:
         logger.info("Bot is running. Press Ctrl+C to stop.")
 
-        # Middleware to inject services
-        @dp.update.outer_middleware()
-        async def services_middleware(handler, event, data):
-            get_services = dp["get_services"]
-            services = await get_services()
-            data.update(services)
-            return await handler(event, data)
-
-        await dp.start_polling(bot)
+        if settings.run_mode == "webhook":
+            await run_webhook(dp, bot)
+        else:
+            # Handle updates inline so the scheduler can throttle the polling loop
+            await dp.start_polling(bot, handle_as_tasks=False)
     finally:
+        await dp["update_scheduler"].drain()
+        if activity_writer:
+            await activity_writer.stop()
+        logger.info("Metrics: %s", metrics.snapshot())
         await on_shutdown()
         await bot.session.close()
         logger.info("Bot stopped.")
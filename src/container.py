@@ -0,0 +1,247 @@
+"""
+Service Container - 업데이트 단위 지연(lazy) 의존성 컨테이너
+"""
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.use_cases.check_in_usecase import CheckInUseCase
+from src.core.use_cases.get_activity_series_usecase import GetActivitySeriesUseCase
+from src.core.use_cases.get_daily_stats_usecase import GetDailyStatsUseCase
+from src.core.use_cases.get_monthly_stats_usecase import GetMonthlyStatsUseCase
+from src.core.use_cases.get_my_rank_usecase import GetMyRankUseCase
+from src.core.use_cases.get_ranking_usecase import GetRankingUseCase
+from src.core.use_cases.get_user_info_usecase import GetUserInfoUseCase
+from src.core.use_cases.process_message_usecase import ProcessMessageUseCase
+from src.infrastructure.cache.leaderboard import LeaderboardRegistry
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.cache.score_config_cache import ScoreConfigCache
+from src.infrastructure.cache.stats_cache import StatsCache
+from src.infrastructure.cache.user_cache import UserCache
+from src.infrastructure.metrics import metrics
+from src.repositories.attendance_repository import AttendanceRepository
+from src.repositories.chat_activity_repository import ChatActivityRepository
+from src.repositories.chat_activity_writer import ChatActivityWriter
+from src.repositories.daily_stats_repository import DailyStatsRepository
+from src.repositories.score_config_repository import ScoreConfigRepository
+from src.repositories.stats_snapshot_repository import StatsSnapshotRepository
+from src.repositories.user_repository import UserRepository
+from src.services.attendance_service import AttendanceService
+from src.services.chat_activity_service import ChatActivityService
+from src.services.stats_service import StatsService
+from src.services.user_service import UserService
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AsyncSession]
+
+
+class ServiceContainer:
+    """업데이트 1건 동안 사용하는 의존성 컨테이너 (작업 단위)
+
+    세션, 저장소, 유스케이스, 서비스는 핸들러가 처음 요청할 때 생성되고 같은
+    업데이트 안에서는 재사용된다. 아무것도 요청하지 않으면 DB 작업도 없다.
+    세션이 열렸다면 컨테이너 종료 시 한 번 커밋하고, 예외가 있으면 롤백한다.
+    캐시/리더보드에는 커밋된 사용자 상태만 반영한다.
+    """
+
+    # 핸들러 인자로 주입 가능한 서비스 이름
+    SERVICES = frozenset(
+        {"attendance_service", "chat_activity_service", "user_service", "stats_service"}
+    )
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        user_cache: Optional[UserCache] = None,
+        score_config_cache: Optional[ScoreConfigCache] = None,
+        activity_writer: Optional[ChatActivityWriter] = None,
+        leaderboards: Optional[LeaderboardRegistry] = None,
+        ranking_page_cache: Optional[LRUCache] = None,
+        stats_cache: Optional[StatsCache] = None,
+    ):
+        """
+        Args:
+            session_factory: 세션 팩토리 (async_sessionmaker)
+            user_cache: 사용자 캐시
+            score_config_cache: 점수 설정 캐시
+            activity_writer: 채팅 활동 배치 저장기 (배치 모드일 때만)
+            leaderboards: 메모리 리더보드
+            ranking_page_cache: 랭킹 페이지 캐시
+            stats_cache: 기간 통계 캐시
+        """
+        self.session_factory = session_factory
+        self.user_cache = user_cache
+        self.score_config_cache = score_config_cache
+        self.activity_writer = activity_writer
+        self.leaderboards = leaderboards
+        self.ranking_page_cache = ranking_page_cache
+        self.stats_cache = stats_cache
+
+        self._session: Optional[AsyncSession] = None
+        self._instances: Dict[str, Any] = {}
+
+    async def __aenter__(self) -> "ServiceContainer":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """세션이 열렸다면 커밋(정상) 또는 롤백(예외) 후 닫기
+
+        사용자 상태는 커밋 후 캐시/리더보드에 반영한다 (버전이 바뀐 시점에는 롤업도
+        커밋된 상태).
+        """
+        await self._finish(exc_type)
+        if exc_type is None:
+            user_repo: Optional[UserRepository] = self._instances.get("user_repo")
+            if user_repo is not None:
+                user_repo.publish()
+
+    async def _finish(self, exc_type) -> None:
+        """세션 커밋 또는 롤백 후 닫기
+
+        채팅 롤업 증분은 커밋 직전에 같은 트랜잭션의 마지막 쓰기로 반영한다. 원본
+        기록과 함께 커밋되거나 함께 롤백되고, 채팅의 모든 쓰기가 갱신하는 롤업 행의
+        락은 반영부터 커밋까지만 유지된다.
+        """
+        session, self._session = self._session, None
+        if session is None:
+            return
+
+        try:
+            if exc_type is None:
+                try:
+                    await self._apply_rollups()
+                    await session.commit()
+                except Exception:
+                    metrics.increment("uow_commit_failed")
+                    logger.exception("Failed to commit unit of work")
+                    await session.rollback()
+                    raise
+                metrics.increment("uow_committed")
+            else:
+                await session.rollback()
+                metrics.increment("uow_rolled_back")
+        finally:
+            await session.close()
+
+    async def _apply_rollups(self) -> None:
+        """미뤄둔 롤업 증분을 작업 단위 트랜잭션에 반영"""
+        daily_stats_repo: Optional[DailyStatsRepository] = self._instances.get("daily_stats_repo")
+        if daily_stats_repo is not None and daily_stats_repo.has_deferred:
+            await daily_stats_repo.apply_deferred()
+
+    @property
+    def session_opened(self) -> bool:
+        """세션 생성 여부"""
+        return self._session is not None
+
+    def provides(self, name: str) -> bool:
+        """핸들러에 주입 가능한 이름인지 확인"""
+        return name in self.SERVICES
+
+    async def resolve(self, name: str) -> Any:
+        """의존성 조회 (최초 요청 시 생성)"""
+        instance = self._instances.get(name)
+        if instance is None:
+            instance = self._instances[name] = await getattr(self, f"_build_{name}")()
+        return instance
+
+    async def get_session(self) -> AsyncSession:
+        """세션 조회 (최초 요청 시 생성)"""
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
+
+    # Repositories
+    async def _build_user_repo(self) -> UserRepository:
+        return UserRepository(
+            await self.get_session(), self.user_cache, self.leaderboards, defer_publish=True
+        )
+
+    async def _build_attendance_repo(self) -> AttendanceRepository:
+        return AttendanceRepository(await self.get_session())
+
+    async def _build_chat_activity_repo(self) -> ChatActivityRepository:
+        return ChatActivityRepository(await self.get_session())
+
+    async def _build_daily_stats_repo(self) -> DailyStatsRepository:
+        return DailyStatsRepository(await self.get_session(), defer_writes=True)
+
+    async def _build_snapshot_repo(self) -> StatsSnapshotRepository:
+        return StatsSnapshotRepository(await self.get_session(), self.stats_cache)
+
+    async def _build_config_repo(self) -> ScoreConfigRepository:
+        return ScoreConfigRepository(await self.get_session(), self.score_config_cache)
+
+    # Use Cases
+    async def _build_checkin_usecase(self) -> CheckInUseCase:
+        return CheckInUseCase(
+            await self.resolve("user_repo"),
+            await self.resolve("attendance_repo"),
+            await self.resolve("config_repo"),
+            await self.resolve("daily_stats_repo"),
+            self.activity_writer,
+        )
+
+    async def _build_process_message_usecase(self) -> ProcessMessageUseCase:
+        return ProcessMessageUseCase(
+            await self.resolve("user_repo"),
+            await self.resolve("chat_activity_repo"),
+            await self.resolve("config_repo"),
+            await self.resolve("daily_stats_repo"),
+            self.activity_writer,
+        )
+
+    async def _build_get_user_info_usecase(self) -> GetUserInfoUseCase:
+        return GetUserInfoUseCase(
+            await self.resolve("user_repo"),
+            await self.resolve("attendance_repo"),
+            await self.resolve("chat_activity_repo"),
+            await self.resolve("get_my_rank_usecase"),
+        )
+
+    async def _build_get_my_rank_usecase(self) -> GetMyRankUseCase:
+        return GetMyRankUseCase(await self.resolve("user_repo"), self.leaderboards)
+
+    async def _build_get_ranking_usecase(self) -> GetRankingUseCase:
+        return GetRankingUseCase(
+            await self.resolve("user_repo"), self.leaderboards, self.ranking_page_cache
+        )
+
+    async def _build_daily_stats_usecase(self) -> GetDailyStatsUseCase:
+        return GetDailyStatsUseCase(
+            await self.resolve("daily_stats_repo"),
+            await self.resolve("snapshot_repo"),
+        )
+
+    async def _build_monthly_stats_usecase(self) -> GetMonthlyStatsUseCase:
+        return GetMonthlyStatsUseCase(
+            await self.resolve("daily_stats_repo"),
+            await self.resolve("snapshot_repo"),
+        )
+
+    async def _build_activity_series_usecase(self) -> GetActivitySeriesUseCase:
+        return GetActivitySeriesUseCase(await self.resolve("daily_stats_repo"))
+
+    # Services
+    async def _build_attendance_service(self) -> AttendanceService:
+        return AttendanceService(await self.resolve("checkin_usecase"))
+
+    async def _build_chat_activity_service(self) -> ChatActivityService:
+        return ChatActivityService(await self.resolve("process_message_usecase"))
+
+    async def _build_user_service(self) -> UserService:
+        return UserService(
+            await self.resolve("get_user_info_usecase"),
+            await self.resolve("get_ranking_usecase"),
+            await self.resolve("get_my_rank_usecase"),
+        )
+
+    async def _build_stats_service(self) -> StatsService:
+        return StatsService(
+            await self.resolve("daily_stats_usecase"),
+            await self.resolve("monthly_stats_usecase"),
+            await self.resolve("activity_series_usecase"),
+            self.leaderboards,
+        )
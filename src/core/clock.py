@@ -0,0 +1,44 @@
+"""
+Clock - 설정 시간대 기준 현재 시각과 날짜 구간
+
+DB 타임스탬프는 설정 시간대(settings.timezone)의 naive 벽시계 시각으로
+저장한다 (이전 서버 로컬 시각 데이터는 마이그레이션 b41e7d0c9a52가 변환).
+기간 조회는 현지 날짜/월을 [start, end) 구간으로 바꿔 컬럼에 그대로 비교하므로
+인덱스 범위 스캔을 사용할 수 있다.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Tuple
+
+import pytz
+
+from config import settings
+
+_tz = pytz.timezone(settings.timezone)
+
+
+def now() -> datetime:
+    """설정 시간대의 현재 시각 (naive)"""
+    return datetime.now(_tz).replace(tzinfo=None)
+
+
+def today() -> date:
+    """설정 시간대의 오늘 날짜"""
+    return now().date()
+
+
+def month_range(year: int, month: int) -> Tuple[date, date]:
+    """월의 [첫날, 다음 달 첫날) 날짜 구간"""
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+def is_period_closed(end: date) -> bool:
+    """end(다음 기간 첫날) 0시가 지나고 마감 유예 시간도 지났는지
+
+    유예 시간은 쓰기 지연 모드에서 기간 직후 flush되는 기록을 기다린다.
+    """
+    closes_at = datetime.combine(end, time.min) + timedelta(
+        seconds=settings.stats_period_close_delay
+    )
+    return now() >= closes_at
@@ -11,6 +11,7 @@ class Attendance:
 
     id: int
     user_id: int
+    chat_id: int
     date: date
     score: int
     consecutive_days: int
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from src.core import clock
+
 if TYPE_CHECKING:
     from .score_config import ScoreConfig
 
@@ -16,6 +18,7 @@ class ChatActivity:
 
     id: int
     user_id: int
+    chat_id: int
     message_id: int
     base_score: int
     is_jackpot: bool
@@ -26,6 +29,7 @@ class ChatActivity:
     @staticmethod
     def create_activity(
         user_id: int,
+        chat_id: int,
         message_id: int,
         config: "ScoreConfig",
     ) -> "ChatActivity":
@@ -33,6 +37,7 @@ class ChatActivity:
 
         Args:
             user_id: 사용자 ID
+            chat_id: 채팅 ID
             message_id: 메시지 ID
             config: 점수 설정
 
@@ -56,12 +61,13 @@ class ChatActivity:
         return ChatActivity(
             id=0,  # DB에서 할당됨
             user_id=user_id,
+            chat_id=chat_id,
             message_id=message_id,
             base_score=base_score,
             is_jackpot=is_jackpot,
             multiplier=multiplier,
             final_score=final_score,
-            created_at=datetime.now(),
+            created_at=clock.now(),
         )
 
     def __str__(self) -> str:
@@ -0,0 +1,37 @@
+"""
+Ranking entity - 랭킹 타입과 정렬 기준
+"""
+from enum import Enum
+from typing import Tuple
+
+from .user import User
+
+
+class RankingType(Enum):
+    """랭킹 타입"""
+
+    SCORE = "score"  # 점수 랭킹
+    CHAT_COUNT = "chat_count"  # 채팅 수 랭킹
+    JACKPOT = "jackpot"  # 잭팟 횟수 랭킹
+    CONSECUTIVE_DAYS = "consecutive_days"  # 연속 출석 랭킹
+
+    def sort_key(self, user: User) -> Tuple[int, ...]:
+        """정렬 키 (클수록 상위, 동점이면 다음 항목으로 비교)
+
+        Args:
+            user: 사용자
+
+        Returns:
+            Tuple[int, ...]: 정렬 키
+        """
+        if self is RankingType.SCORE:
+            return (user.total_score,)
+        if self is RankingType.CHAT_COUNT:
+            return (user.chat_count,)
+        if self is RankingType.JACKPOT:
+            return (user.jackpot_count, user.max_jackpot)
+        return (user.consecutive_days, user.total_attendance)
+
+    def is_ranked(self, user: User) -> bool:
+        """랭킹 대상 여부 (첫 정렬 기준이 0보다 커야 함)"""
+        return self.sort_key(user)[0] > 0
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from src.core import clock
+
 
 @dataclass
 class ScoreConfig:
@@ -19,6 +21,7 @@ class ScoreConfig:
     multiplier_max: int
     max_consecutive_bonus: int
     updated_at: Optional[datetime]
+    chat_id: Optional[int] = None  # None이면 전체 기본 설정
 
     @staticmethod
     def default() -> "ScoreConfig":
@@ -36,7 +39,7 @@ class ScoreConfig:
             multiplier_min=1,
             multiplier_max=7,
             max_consecutive_bonus=7,
-            updated_at=datetime.now(),
+            updated_at=clock.now(),
         )
 
     def validate(self) -> bool:
@@ -1,9 +1,10 @@
 """
 Statistics Entities
 """
-from dataclasses import dataclass
-from datetime import date
-from typing import List, Optional
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from typing import List, Optional, Tuple
 
 
 @dataclass
@@ -16,6 +17,91 @@ class UserStats:
     chat_count: int
 
 
+@dataclass
+class DailyRollup:
+    """채팅 일일 롤업 (daily_chat_stats 1행)"""
+
+    date: date
+    message_count: int = 0  # 채팅 수
+    chat_score: int = 0  # 채팅으로 획득한 점수
+    jackpot_count: int = 0  # 잭팟 횟수
+    check_in_count: int = 0  # 출석 횟수
+    attendance_score: int = 0  # 출석으로 획득한 점수
+    active_users: int = 0  # 채팅한 사용자 수
+
+
+class Granularity(Enum):
+    """활동 시계열 버킷 단위"""
+
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"  # 월요일 시작
+    MONTH = "month"
+
+    def floor(self, moment: datetime) -> datetime:
+        """moment가 속한 버킷의 시작 시각"""
+        if self is Granularity.HOUR:
+            return moment.replace(minute=0, second=0, microsecond=0)
+        day = datetime.combine(moment.date(), time.min)
+        if self is Granularity.DAY:
+            return day
+        if self is Granularity.WEEK:
+            return day - timedelta(days=day.weekday())
+        return day.replace(day=1)
+
+    def next(self, start: datetime) -> datetime:
+        """버킷 시작 시각 start 다음 버킷의 시작 시각"""
+        if self is Granularity.HOUR:
+            return start + timedelta(hours=1)
+        if self is Granularity.DAY:
+            return start + timedelta(days=1)
+        if self is Granularity.WEEK:
+            return start + timedelta(weeks=1)
+        if start.month == 12:
+            return start.replace(year=start.year + 1, month=1)
+        return start.replace(month=start.month + 1)
+
+
+@dataclass
+class ActivityBucket:
+    """채팅 활동 시계열 버킷 1개 ([start, 다음 버킷 시작) 구간 합계)"""
+
+    start: datetime
+    message_count: int = 0  # 채팅 수
+    chat_score: int = 0  # 채팅으로 획득한 점수
+    jackpot_count: int = 0  # 잭팟 횟수
+
+    def add(self, other: "ActivityBucket") -> None:
+        """다른 버킷의 카운터를 더함"""
+        self.message_count += other.message_count
+        self.chat_score += other.chat_score
+        self.jackpot_count += other.jackpot_count
+
+
+@dataclass
+class ActivityHeatmap:
+    """요일 x 시간대 채팅 수 (counts[요일][시], 월요일=0)"""
+
+    start: datetime
+    end: datetime
+    counts: List[List[int]] = field(default_factory=lambda: [[0] * 24 for _ in range(7)])
+
+    @property
+    def total(self) -> int:
+        return sum(sum(row) for row in self.counts)
+
+    @property
+    def peak(self) -> Optional[Tuple[int, int]]:
+        """가장 활발한 (요일, 시) - 기록이 없으면 None"""
+        best: Optional[Tuple[int, int]] = None
+        best_count = 0
+        for weekday, row in enumerate(self.counts):
+            for hour, count in enumerate(row):
+                if count > best_count:
+                    best, best_count = (weekday, hour), count
+        return best
+
+
 @dataclass
 class DailyStats:
     """일일 통계"""
@@ -43,3 +129,4 @@ class MonthlyStats:
     most_active_date: Optional[date]  # 가장 활발했던 날
     most_active_count: int  # 가장 활발했던 날의 채팅 수
     top_users: List[UserStats]  # 이번 달 TOP 사용자
+    total_users_estimated: bool = False  # 활동 사용자 수가 스케치 추정값인지
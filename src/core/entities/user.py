@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from src.core import clock
+
 
 @dataclass
 class User:
@@ -12,6 +14,7 @@ class User:
 
     id: int
     telegram_id: int
+    chat_id: int  # 사용자가 속한 채팅(그룹) ID
     username: str
     total_score: int
     chat_count: int
@@ -32,7 +35,7 @@ class User:
         if not self.last_checkin:
             return True
 
-        today = datetime.now().date()
+        today = clock.today()
         last_checkin_date = self.last_checkin.date()
 
         return last_checkin_date < today
@@ -46,7 +49,7 @@ class User:
         if not self.last_checkin:
             return 1
 
-        today = datetime.now().date()
+        today = clock.today()
         last_checkin_date = self.last_checkin.date()
         days_diff = (today - last_checkin_date).days
 
@@ -64,12 +67,12 @@ class User:
             score: 추가할 점수
         """
         self.total_score += score
-        self.updated_at = datetime.now()
+        self.updated_at = clock.now()
 
     def increment_chat_count(self) -> None:
         """채팅 수 증가"""
         self.chat_count += 1
-        self.updated_at = datetime.now()
+        self.updated_at = clock.now()
 
     def record_jackpot(self, jackpot_score: int) -> None:
         """잭팟 기록
@@ -80,7 +83,7 @@ class User:
         self.jackpot_count += 1
         if jackpot_score > self.max_jackpot:
             self.max_jackpot = jackpot_score
-        self.updated_at = datetime.now()
+        self.updated_at = clock.now()
 
     def update_checkin(self, consecutive_days: int) -> None:
         """출석 정보 업데이트
@@ -90,8 +93,8 @@ class User:
         """
         self.consecutive_days = consecutive_days
         self.total_attendance += 1
-        self.last_checkin = datetime.now()
-        self.updated_at = datetime.now()
+        self.last_checkin = clock.now()
+        self.updated_at = clock.now()
 
     @property
     def average_score_per_chat(self) -> float:
@@ -2,12 +2,15 @@
 CheckIn Use Case - 출석 체크 비즈니스 로직
 """
 from dataclasses import dataclass
-from datetime import datetime
+from typing import Optional
 
+from src.core import clock
 from src.core.entities.attendance import Attendance
 from src.core.entities.user import User
 from src.core.exceptions import AlreadyCheckedInError
 from src.repositories.attendance_repository import AttendanceRepository
+from src.repositories.chat_activity_writer import ChatActivityWriter
+from src.repositories.daily_stats_repository import DailyStatsRepository
 from src.repositories.score_config_repository import ScoreConfigRepository
 from src.repositories.user_repository import UserRepository
 
@@ -31,16 +34,21 @@ class CheckInUseCase:
         user_repo: UserRepository,
         attendance_repo: AttendanceRepository,
         config_repo: ScoreConfigRepository,
+        daily_stats_repo: DailyStatsRepository,
+        activity_writer: Optional[ChatActivityWriter] = None,
     ):
         self.user_repo = user_repo
         self.attendance_repo = attendance_repo
         self.config_repo = config_repo
+        self.daily_stats_repo = daily_stats_repo
+        self.activity_writer = activity_writer
 
-    async def execute(self, telegram_id: int, username: str) -> CheckInResult:
+    async def execute(self, telegram_id: int, chat_id: int, username: str) -> CheckInResult:
         """출석 체크 실행
 
         Args:
             telegram_id: 텔레그램 사용자 ID
+            chat_id: 채팅(그룹) ID
             username: 사용자 이름
 
         Returns:
@@ -49,15 +57,18 @@ class CheckInUseCase:
         Raises:
             AlreadyCheckedInError: 이미 오늘 출석한 경우
         """
-        # 1. 사용자 조회 또는 생성
-        user = await self.user_repo.get_by_telegram_id(telegram_id)
+        # 중복 출석은 (user_id, date) 유니크 제약이 막는다. 같은 프로세스에서 첫 출석의
+        # 사용자 생성이 겹치지 않는 것은 ContainerMiddleware의 사용자 락이 커밋과 캐시
+        # 반영까지 보유되기 때문이다
+        # 1. 채팅 멤버 사용자 조회 또는 생성
+        user = await self.user_repo.get_by_telegram_id(telegram_id, chat_id)
         is_new_user = False
 
         if not user:
-            user = await self.user_repo.create(telegram_id, username)
+            user = await self.user_repo.create(telegram_id, chat_id, username)
             is_new_user = True
 
-        # 2. 오늘 출석 가능 여부 확인
+        # 2. 오늘 출석 가능 여부 확인 (이미 읽은 사용자 상태로 빠르게 거절)
         if not user.can_checkin_today():
             raise AlreadyCheckedInError("이미 오늘 출석했습니다!")
 
@@ -65,25 +76,35 @@ class CheckInUseCase:
         consecutive_days = user.calculate_consecutive_days()
 
         # 4. 출석 점수 계산
-        config = await self.config_repo.get_config()
+        config = await self.config_repo.get_config(chat_id)
         score = Attendance.calculate_score(
             base_score=config.attendance_score,
             consecutive_days=consecutive_days,
             max_bonus=config.max_consecutive_bonus,
         )
 
-        # 5. 출석 기록 저장
-        attendance = await self.attendance_repo.create(
+        # 5. 출석 기록 저장 (그날 기록이 이미 있으면 아무것도 쓰지 않고 거절)
+        attendance = await self.attendance_repo.create_if_absent(
             user_id=user.id,
-            attendance_date=datetime.now().date(),
+            chat_id=chat_id,
+            attendance_date=clock.today(),
             score=score,
             consecutive_days=consecutive_days,
         )
+        if attendance is None:
+            raise AlreadyCheckedInError("이미 오늘 출석했습니다!")
 
-        # 6. 사용자 정보 업데이트
-        user.add_score(score)
-        user.update_checkin(consecutive_days)
-        await self.user_repo.update(user)
+        # 6. 사용자 정보 업데이트 (원자적 증가, 같은 트랜잭션)
+        user = await self.user_repo.record_checkin(user.id, score, consecutive_days)
+        if self.activity_writer:
+            # 배치 모드: DB 값에는 아직 큐에 있는 채팅 증분이 빠져 있으므로 더해서
+            # 캐시/리더보드의 점수가 뒤로 가지 않게 한다
+            delta = self.activity_writer.pending_delta(user.id)
+            if delta is not None:
+                user = self.user_repo.remember(delta.apply_to(user))
+        await self.daily_stats_repo.record_check_in(
+            chat_id, user.id, attendance.date, score
+        )
 
         return CheckInResult(
             user=user,
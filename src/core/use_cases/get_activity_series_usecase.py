@@ -0,0 +1,91 @@
+"""
+Get Activity Series Use Case - 구간/단위별 채팅 활동 시계열 조회
+"""
+from datetime import date, datetime, time
+from typing import Dict, List, Tuple
+
+from src.core.entities.stats import ActivityBucket, ActivityHeatmap, Granularity
+from src.repositories.daily_stats_repository import DailyStatsRepository
+
+
+class GetActivitySeriesUseCase:
+    """채팅 활동 시계열 조회 유스케이스
+
+    임의의 [start, end) 구간을 원하는 단위(시/일/주/월)로 나눠 롤업 버킷을
+    병합한다. 구간이 날짜 경계에 맞고 단위가 하루 이상이면 일별 롤업을,
+    그 밖에는 시간대 롤업을 읽으므로 원본 테이블은 집계하지 않는다.
+
+    롤업 해상도가 1시간이므로 구간 경계는 정시로 내림해 적용한다
+    (맞닿은 두 구간이 같은 시간 버킷을 중복 집계하지 않음).
+    """
+
+    def __init__(self, daily_stats_repo: DailyStatsRepository):
+        self.daily_stats_repo = daily_stats_repo
+
+    async def execute(
+        self, chat_id: int, start: datetime, end: datetime, granularity: Granularity
+    ) -> List[ActivityBucket]:
+        """구간 시계열 조회 (기록이 없는 버킷도 0으로 채워 시각순으로 반환)
+
+        첫/마지막 버킷은 구간 밖을 포함하지 않는다 (예: 수요일부터의 주 단위 조회는
+        첫 버킷이 수~일 합계).
+        """
+        start, end = self._hour_range(start, end)
+        series: Dict[datetime, ActivityBucket] = {}
+        bucket_start = granularity.floor(start)
+        while bucket_start < end:
+            series[bucket_start] = ActivityBucket(start=bucket_start)
+            bucket_start = granularity.next(bucket_start)
+
+        for source in await self._source_buckets(chat_id, start, end, granularity):
+            series[granularity.floor(source.start)].add(source)
+
+        return list(series.values())
+
+    async def heatmap(self, chat_id: int, start: datetime, end: datetime) -> ActivityHeatmap:
+        """[start, end) 구간의 요일 x 시간대 채팅 수"""
+        start, end = self._hour_range(start, end)
+        heatmap = ActivityHeatmap(start=start, end=end)
+        for bucket in await self.daily_stats_repo.get_hour_buckets(chat_id, start, end):
+            heatmap.counts[bucket.start.weekday()][bucket.start.hour] += bucket.message_count
+        return heatmap
+
+    async def total(self, chat_id: int, start: datetime, end: datetime) -> ActivityBucket:
+        """[start, end) 구간 합계 (주간 비교 등)"""
+        start, end = self._hour_range(start, end)
+        total = ActivityBucket(start=start)
+        for source in await self._source_buckets(chat_id, start, end, Granularity.DAY):
+            total.add(source)
+        return total
+
+    async def active_users(self, chat_id: int, start: date, end: date) -> Tuple[int, bool]:
+        """[start, end) 기간에 채팅한 사용자 수
+
+        Returns:
+            Tuple[int, bool]: (사용자 수, 스케치 추정값 여부)
+        """
+        return await self.daily_stats_repo.count_active_users(chat_id, start, end)
+
+    @staticmethod
+    def _hour_range(start: datetime, end: datetime) -> Tuple[datetime, datetime]:
+        """구간 경계를 정시로 내림"""
+        return Granularity.HOUR.floor(start), Granularity.HOUR.floor(end)
+
+    async def _source_buckets(
+        self, chat_id: int, start: datetime, end: datetime, granularity: Granularity
+    ) -> List[ActivityBucket]:
+        """병합할 원천 버킷 (가능하면 일별 롤업, 아니면 시간대 롤업)"""
+        day_aligned = start.time() == time.min and end.time() == time.min
+        if granularity is Granularity.HOUR or not day_aligned:
+            return await self.daily_stats_repo.get_hour_buckets(chat_id, start, end)
+
+        days = await self.daily_stats_repo.get_chat_days(chat_id, start.date(), end.date())
+        return [
+            ActivityBucket(
+                start=datetime.combine(day.date, time.min),
+                message_count=day.message_count,
+                chat_score=day.chat_score,
+                jackpot_count=day.jackpot_count,
+            )
+            for day in days
+        ]
@@ -1,62 +1,63 @@
 """
 Get Daily Stats Use Case - 일일 통계 조회
 """
-from datetime import date
-from typing import Dict, Any
+from datetime import date, timedelta
+from typing import Dict, Any, Optional
 
-from src.core.entities.stats import DailyStats, UserStats
-from src.repositories.user_repository import UserRepository
-from src.repositories.attendance_repository import AttendanceRepository
-from src.repositories.chat_activity_repository import ChatActivityRepository
+from src.core import clock
+from src.core.entities.stats import DailyStats
+from src.repositories.daily_stats_repository import DailyStatsRepository
+from src.repositories.stats_snapshot_repository import StatsSnapshotRepository
 
 
 class GetDailyStatsUseCase:
-    """일일 통계 조회 유스케이스"""
+    """일일 통계 조회 유스케이스
+
+    쓰기 시 갱신되는 일별 롤업(채팅 1행과 그날 사용자 행)으로 계산하고,
+    끝난 날의 결과는 스냅샷으로 남겨 다시 계산하지 않는다.
+    """
 
     def __init__(
         self,
-        user_repo: UserRepository,
-        attendance_repo: AttendanceRepository,
-        chat_activity_repo: ChatActivityRepository,
+        daily_stats_repo: DailyStatsRepository,
+        snapshot_repo: StatsSnapshotRepository,
     ):
-        self.user_repo = user_repo
-        self.attendance_repo = attendance_repo
-        self.chat_activity_repo = chat_activity_repo
-
-    async def execute(self, target_date: date) -> Dict[str, Any]:
-        """일일 통계 조회 실행"""
-        # 1. 출석 횟수
-        check_in_count = await self.attendance_repo.get_daily_count(target_date)
-
-        # 2. 채팅 통계 (메시지 수, 총 점수, 잭팟 횟수, 활동 사용자 수)
-        (
-            total_messages,
-            total_score,
-            jackpot_count,
-            total_users,
-        ) = await self.chat_activity_repo.get_daily_stats(target_date)
-
-        # 3. TOP 사용자 (점수 기준 TOP 3)
-        top_users_models = await self.user_repo.get_ranking_by_score(limit=3)
-        top_users = [
-            UserStats(
-                telegram_id=user.telegram_id,
-                username=user.username,
-                total_score=user.total_score,
-                chat_count=user.chat_count,
-            )
-            for user in top_users_models
-        ]
-
-        # 4. DailyStats 엔티티 생성
-        daily_stats = DailyStats(
+        self.daily_stats_repo = daily_stats_repo
+        self.snapshot_repo = snapshot_repo
+
+    async def execute(
+        self, chat_id: int, target_date: date, version: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """채팅 일일 통계 조회 실행
+
+        Args:
+            version: 채팅 데이터 버전 (진행 중인 날의 캐시 결과를 버전이 같을 때만 재사용)
+        """
+        closed = clock.is_period_closed(target_date + timedelta(days=1))
+        daily_stats = await self.snapshot_repo.get_daily(chat_id, target_date, closed, version)
+        if daily_stats is None:
+            daily_stats = await self._compute(chat_id, target_date)
+            await self.snapshot_repo.put_daily(chat_id, daily_stats, closed, version)
+
+        return {"success": True, "stats": daily_stats}
+
+    async def _compute(self, chat_id: int, target_date: date) -> DailyStats:
+        """일일 통계 계산"""
+        # 1. 출석/채팅 통계 (출석 수, 메시지 수, 총 점수, 잭팟 횟수, 활동 사용자 수)
+        rollup = await self.daily_stats_repo.get_chat_day(chat_id, target_date)
+
+        # 2. 오늘의 TOP 사용자 (그날 획득 점수 기준 TOP 3)
+        top_users = await self.daily_stats_repo.get_top_users(
+            chat_id, target_date, target_date + timedelta(days=1), limit=3
+        )
+
+        # 3. DailyStats 엔티티 생성
+        return DailyStats(
             date=target_date,
-            total_users=total_users,
-            check_in_count=check_in_count,
-            total_messages=total_messages,
-            total_score=total_score,
-            jackpot_count=jackpot_count,
+            total_users=rollup.active_users,
+            check_in_count=rollup.check_in_count,
+            total_messages=rollup.message_count,
+            total_score=rollup.chat_score,
+            jackpot_count=rollup.jackpot_count,
             top_users=top_users,
         )
-
-        return {"success": True, "stats": daily_stats}
@@ -4,70 +4,81 @@ Get Monthly Stats Use Case - 월별 통계 조회
 from typing import Dict, Any, Optional
 from datetime import date
 
-from src.core.entities.stats import MonthlyStats, UserStats
-from src.repositories.user_repository import UserRepository
-from src.repositories.attendance_repository import AttendanceRepository
-from src.repositories.chat_activity_repository import ChatActivityRepository
+from src.core import clock
+from src.core.entities.stats import MonthlyStats
+from src.repositories.daily_stats_repository import DailyStatsRepository
+from src.repositories.stats_snapshot_repository import StatsSnapshotRepository
 
 
 class GetMonthlyStatsUseCase:
-    """월별 통계 조회 유스케이스"""
+    """월별 통계 조회 유스케이스
+
+    원본 테이블 대신 일별 롤업(최대 31행)을 합산하므로 채팅 활동이
+    아무리 쌓여도 조회 비용이 일정하고, 끝난 달의 결과는 스냅샷으로
+    남겨 다시 계산하지 않는다.
+    """
 
     def __init__(
         self,
-        user_repo: UserRepository,
-        attendance_repo: AttendanceRepository,
-        chat_activity_repo: ChatActivityRepository,
+        daily_stats_repo: DailyStatsRepository,
+        snapshot_repo: StatsSnapshotRepository,
     ):
-        self.user_repo = user_repo
-        self.attendance_repo = attendance_repo
-        self.chat_activity_repo = chat_activity_repo
+        self.daily_stats_repo = daily_stats_repo
+        self.snapshot_repo = snapshot_repo
+
+    async def execute(
+        self, chat_id: int, year: int, month: int, version: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """채팅 월별 통계 조회 실행
+
+        Args:
+            version: 채팅 데이터 버전 (진행 중인 달의 캐시 결과를 버전이 같을 때만 재사용)
+        """
+        _, end = clock.month_range(year, month)
+        closed = clock.is_period_closed(end)
+        monthly_stats = await self.snapshot_repo.get_monthly(
+            chat_id, year, month, closed, version
+        )
+        if monthly_stats is None:
+            monthly_stats = await self._compute(chat_id, year, month)
+            await self.snapshot_repo.put_monthly(chat_id, monthly_stats, closed, version)
+
+        return {"success": True, "stats": monthly_stats}
+
+    async def _compute(self, chat_id: int, year: int, month: int) -> MonthlyStats:
+        """월별 통계 계산"""
+        start, end = clock.month_range(year, month)
 
-    async def execute(self, year: int, month: int) -> Dict[str, Any]:
-        """월별 통계 조회 실행"""
-        # 1. 출석 횟수
-        check_in_count = await self.attendance_repo.get_monthly_count(year, month)
+        # 1. 일별 롤업 (출석 수, 메시지 수, 총 점수, 잭팟 횟수)
+        days = await self.daily_stats_repo.get_chat_days(chat_id, start, end)
 
-        # 2. 채팅 통계 (메시지 수, 총 점수, 잭팟 횟수, 활동 사용자 수)
-        (
-            total_messages,
-            total_score,
-            jackpot_count,
-            total_users,
-        ) = await self.chat_activity_repo.get_monthly_stats(year, month)
+        # 2. 활동 사용자 수 (일별 스케치 병합 추정)
+        total_users, estimated = await self.daily_stats_repo.count_active_users(
+            chat_id, start, end
+        )
 
-        # 3. 가장 활발했던 날
-        most_active = await self.chat_activity_repo.get_most_active_date(year, month)
+        # 3. 가장 활발했던 날 (같은 메시지 수면 앞선 날)
         most_active_date: Optional[date] = None
         most_active_count = 0
-        if most_active:
-            most_active_date = most_active[0]
-            most_active_count = most_active[1]
+        for day in days:
+            if day.message_count > most_active_count:
+                most_active_date = day.date
+                most_active_count = day.message_count
 
-        # 4. TOP 사용자 (점수 기준 TOP 5)
-        top_users_models = await self.user_repo.get_ranking_by_score(limit=5)
-        top_users = [
-            UserStats(
-                telegram_id=user.telegram_id,
-                username=user.username,
-                total_score=user.total_score,
-                chat_count=user.chat_count,
-            )
-            for user in top_users_models
-        ]
+        # 4. 이번 달 TOP 사용자 (그달 획득 점수 기준 TOP 5)
+        top_users = await self.daily_stats_repo.get_top_users(chat_id, start, end, limit=5)
 
         # 5. MonthlyStats 엔티티 생성
-        monthly_stats = MonthlyStats(
+        return MonthlyStats(
             year=year,
             month=month,
             total_users=total_users,
-            check_in_count=check_in_count,
-            total_messages=total_messages,
-            total_score=total_score,
-            jackpot_count=jackpot_count,
+            check_in_count=sum(day.check_in_count for day in days),
+            total_messages=sum(day.message_count for day in days),
+            total_score=sum(day.chat_score for day in days),
+            jackpot_count=sum(day.jackpot_count for day in days),
             most_active_date=most_active_date,
             most_active_count=most_active_count,
             top_users=top_users,
+            total_users_estimated=estimated,
         )
-
-        return {"success": True, "stats": monthly_stats}
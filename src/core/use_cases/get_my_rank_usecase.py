@@ -0,0 +1,137 @@
+"""
+GetMyRank Use Case - 내 순위 조회 로직
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from src.core.entities.ranking import RankingType
+from src.core.entities.user import User
+from src.core.exceptions import UserNotRegisteredError
+from src.infrastructure.cache.leaderboard import LeaderboardRegistry
+from src.repositories.user_repository import UserRepository
+
+
+@dataclass
+class RankedUser:
+    """순위가 매겨진 사용자"""
+
+    rank: int
+    user: User
+
+
+@dataclass
+class RankPosition:
+    """랭킹 타입 1개에서의 사용자 위치"""
+
+    ranking_type: RankingType
+    rank: Optional[int]  # 1부터 시작, 랭킹 대상이 아니면 None
+    total: int  # 랭킹 대상 사용자 수
+    neighbors: List[RankedUser] = field(default_factory=list)  # 본인 포함 주변 사용자
+
+    @property
+    def percentile(self) -> Optional[float]:
+        """상위 백분율 (1위에 가까울수록 작음)"""
+        if self.rank is None or self.total == 0:
+            return None
+        return round(self.rank / self.total * 100, 1)
+
+
+@dataclass
+class MyRankResult:
+    """내 순위 결과"""
+
+    user: User
+    positions: List[RankPosition]
+
+
+class GetMyRankUseCase:
+    """내 순위 조회 유스케이스
+
+    채팅의 메모리 리더보드(필요 시 적재)가 있으면 순위 트리에서 O(log n)으로
+    조회하고, 없으면 (정렬 키, id) 복합 비교 COUNT/키셋 쿼리로 조회한다.
+    """
+
+    def __init__(
+        self,
+        user_repo: UserRepository,
+        leaderboards: Optional[LeaderboardRegistry] = None,
+    ):
+        self.user_repo = user_repo
+        self.leaderboards = leaderboards
+
+    async def execute(self, telegram_id: int, chat_id: int, neighbors: int = 2) -> MyRankResult:
+        """채팅 내 모든 랭킹 타입에서의 내 순위 조회
+
+        Args:
+            telegram_id: 텔레그램 사용자 ID
+            chat_id: 채팅(그룹) ID
+            neighbors: 위/아래로 함께 보여줄 사용자 수
+
+        Returns:
+            MyRankResult: 내 순위 결과
+
+        Raises:
+            UserNotRegisteredError: 등록되지 않은 사용자
+        """
+        user = await self.user_repo.get_by_telegram_id(telegram_id, chat_id)
+        if not user:
+            raise UserNotRegisteredError("먼저 .출첵 명령어로 등록해주세요!")
+
+        positions = [
+            await self.position(user, ranking_type, neighbors) for ranking_type in RankingType
+        ]
+        return MyRankResult(user=user, positions=positions)
+
+    async def position(
+        self, user: User, ranking_type: RankingType, neighbors: int = 0
+    ) -> RankPosition:
+        """랭킹 타입 1개에서의 사용자 위치 조회
+
+        Args:
+            user: 사용자
+            ranking_type: 랭킹 타입
+            neighbors: 위/아래로 함께 조회할 사용자 수
+
+        Returns:
+            RankPosition: 사용자 위치
+        """
+        leaderboards = self.leaderboards
+        if leaderboards is not None:
+            await leaderboards.ensure_loaded(
+                user.chat_id, lambda: self.user_repo.iter_by_chat(user.chat_id)
+            )
+            return self._position_from_leaderboard(leaderboards, user, ranking_type, neighbors)
+
+        total = await self.user_repo.count_ranked(user.chat_id, ranking_type)
+        if not ranking_type.is_ranked(user):
+            return RankPosition(ranking_type=ranking_type, rank=None, total=total)
+
+        rank = await self.user_repo.count_ranked_ahead(ranking_type, user) + 1
+        ranked = [RankedUser(rank=rank, user=user)]
+        if neighbors > 0:
+            above, below = await self.user_repo.get_ranking_neighbors(
+                ranking_type, user, neighbors
+            )
+            ranked = (
+                [RankedUser(rank=rank - len(above) + i, user=u) for i, u in enumerate(above)]
+                + ranked
+                + [RankedUser(rank=rank + 1 + i, user=u) for i, u in enumerate(below)]
+            )
+        return RankPosition(ranking_type=ranking_type, rank=rank, total=total, neighbors=ranked)
+
+    @staticmethod
+    def _position_from_leaderboard(
+        leaderboards: LeaderboardRegistry, user: User, ranking_type: RankingType, neighbors: int
+    ) -> RankPosition:
+        """메모리 리더보드에서 사용자 위치 조회"""
+        total = leaderboards.size(user.chat_id, ranking_type)
+        rank = leaderboards.rank_of(user.chat_id, ranking_type, user.id)
+        if rank is None:
+            return RankPosition(ranking_type=ranking_type, rank=None, total=total)
+
+        start = max(rank - 1 - neighbors, 0)
+        users = leaderboards.top(
+            user.chat_id, ranking_type, limit=rank + neighbors - start, offset=start
+        )
+        ranked = [RankedUser(rank=start + 1 + i, user=u) for i, u in enumerate(users)]
+        return RankPosition(ranking_type=ranking_type, rank=rank, total=total, neighbors=ranked)
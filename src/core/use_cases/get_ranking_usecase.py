@@ -2,57 +2,183 @@
 GetRanking Use Case - 랭킹 조회 로직
 """
 from dataclasses import dataclass
-from enum import Enum
-from typing import List
+from typing import List, Optional, Tuple
 
+from src.core.entities.ranking import RankingType
 from src.core.entities.user import User
+from src.infrastructure.cache.leaderboard import LeaderboardRegistry
+from src.infrastructure.cache.lru import LRUCache
 from src.repositories.user_repository import UserRepository
 
+__all__ = [
+    "GetRankingUseCase",
+    "RankingCursor",
+    "RankingPage",
+    "RankingType",
+]
 
-class RankingType(Enum):
-    """랭킹 타입"""
 
-    SCORE = "score"  # 점수 랭킹
-    CHAT_COUNT = "chat_count"  # 채팅 수 랭킹
-    JACKPOT = "jackpot"  # 잭팟 횟수 랭킹
-    CONSECUTIVE_DAYS = "consecutive_days"  # 연속 출석 랭킹
+@dataclass(frozen=True)
+class RankingCursor:
+    """랭킹 페이지 커서"""
+
+    page: int  # 이동할 페이지 (0부터 시작)
+    key: Tuple[int, ...]  # 경계 사용자의 정렬 키 + id
+    forward: bool  # True: key 다음 순위부터, False: key 이전 순위까지
 
 
 @dataclass
-class RankingResult:
-    """랭킹 결과"""
+class RankingPage:
+    """랭킹 페이지"""
 
     ranking_type: RankingType
+    page: int
+    page_size: int
     users: List[User]
+    has_next: bool
+
+    @property
+    def has_prev(self) -> bool:
+        """이전 페이지 존재 여부"""
+        return self.page > 0
+
+    @property
+    def start_rank(self) -> int:
+        """페이지 첫 사용자의 순위"""
+        return self.page * self.page_size + 1
+
+    def next_cursor(self) -> Optional[RankingCursor]:
+        """다음 페이지 커서"""
+        if not self.has_next or not self.users:
+            return None
+        return RankingCursor(self.page + 1, self._key(self.users[-1]), forward=True)
+
+    def prev_cursor(self) -> Optional[RankingCursor]:
+        """이전 페이지 커서"""
+        if not self.has_prev or not self.users:
+            return None
+        return RankingCursor(self.page - 1, self._key(self.users[0]), forward=False)
+
+    def _key(self, user: User) -> Tuple[int, ...]:
+        return self.ranking_type.sort_key(user) + (user.id,)
+
+
+# 페이지 캐시 키: (채팅, 랭킹 타입, 페이지 크기, 커서, 리더보드 버전)
+PageCacheKey = Tuple[int, RankingType, int, Optional[RankingCursor], Optional[int]]
 
 
 class GetRankingUseCase:
     """랭킹 조회 유스케이스"""
 
-    def __init__(self, user_repo: UserRepository):
+    def __init__(
+        self,
+        user_repo: UserRepository,
+        leaderboards: Optional[LeaderboardRegistry] = None,
+        page_cache: Optional[LRUCache[PageCacheKey, RankingPage]] = None,
+    ):
         self.user_repo = user_repo
+        self.leaderboards = leaderboards
+        self.page_cache = page_cache
+
+    def version(self, chat_id: int, ranking_type: RankingType) -> Optional[int]:
+        """채팅 랭킹 데이터 버전 (메모리 리더보드가 적재되지 않았으면 None)"""
+        if self.leaderboards is None:
+            return None
+        return self.leaderboards.version(chat_id, ranking_type)
 
-    async def execute(
-        self, ranking_type: RankingType, limit: int = 10
-    ) -> RankingResult:
-        """랭킹 조회
+    async def execute_page(
+        self,
+        chat_id: int,
+        ranking_type: RankingType,
+        page_size: int = 10,
+        cursor: Optional[RankingCursor] = None,
+    ) -> RankingPage:
+        """채팅 랭킹 페이지 조회
+
+        메모리 리더보드가 있으면 순위 인덱스로, 없으면 커서 기준 키셋 쿼리로
+        조회하므로 깊은 페이지도 첫 페이지와 비용이 같다.
 
         Args:
+            chat_id: 채팅(그룹) ID
             ranking_type: 랭킹 타입
-            limit: 조회할 사용자 수
+            page_size: 페이지당 사용자 수
+            cursor: 페이지 커서 (None이면 첫 페이지)
 
         Returns:
-            RankingResult: 랭킹 결과
+            RankingPage: 랭킹 페이지
         """
-        if ranking_type == RankingType.SCORE:
-            users = await self.user_repo.get_ranking_by_score(limit)
-        elif ranking_type == RankingType.CHAT_COUNT:
-            users = await self.user_repo.get_ranking_by_chat_count(limit)
-        elif ranking_type == RankingType.JACKPOT:
-            users = await self.user_repo.get_ranking_by_jackpot(limit)
-        elif ranking_type == RankingType.CONSECUTIVE_DAYS:
-            users = await self.user_repo.get_ranking_by_consecutive_days(limit)
+        leaderboards = self.leaderboards
+        if leaderboards is not None:
+            await leaderboards.ensure_loaded(chat_id, lambda: self.user_repo.iter_by_chat(chat_id))
+            # 리더보드 데이터가 바뀌면 버전이 올라가 이전 페이지 캐시는 자연히 무효화된다
+            version = leaderboards.version(chat_id, ranking_type)
+        else:
+            version = None
+        cache_key: PageCacheKey = (chat_id, ranking_type, page_size, cursor, version)
+
+        if self.page_cache is not None:
+            cached: Optional[RankingPage] = self.page_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if leaderboards is not None:
+            page = self._page_from_leaderboard(
+                leaderboards, chat_id, ranking_type, page_size, cursor
+            )
+        else:
+            page = await self._page_from_repository(chat_id, ranking_type, page_size, cursor)
+
+        if self.page_cache is not None:
+            self.page_cache.set(cache_key, page)
+        return page
+
+    @staticmethod
+    def _page_from_leaderboard(
+        leaderboards: LeaderboardRegistry,
+        chat_id: int,
+        ranking_type: RankingType,
+        page_size: int,
+        cursor: Optional[RankingCursor],
+    ) -> RankingPage:
+        """메모리 리더보드에서 페이지 조회"""
+        page = cursor.page if cursor else 0
+        users = leaderboards.top(chat_id, ranking_type, page_size + 1, offset=page * page_size)
+        return RankingPage(
+            ranking_type=ranking_type,
+            page=page,
+            page_size=page_size,
+            users=users[:page_size],
+            has_next=len(users) > page_size,
+        )
+
+    async def _page_from_repository(
+        self,
+        chat_id: int,
+        ranking_type: RankingType,
+        page_size: int,
+        cursor: Optional[RankingCursor],
+    ) -> RankingPage:
+        """키셋 쿼리로 페이지 조회"""
+        if cursor is None:
+            users = await self.user_repo.get_ranking_page(chat_id, ranking_type, page_size + 1)
+            page, has_next = 0, len(users) > page_size
+            users = users[:page_size]
+        elif cursor.forward:
+            users = await self.user_repo.get_ranking_page(
+                chat_id, ranking_type, page_size + 1, after=cursor.key
+            )
+            page, has_next = cursor.page, len(users) > page_size
+            users = users[:page_size]
         else:
-            users = []
+            users = await self.user_repo.get_ranking_page(
+                chat_id, ranking_type, page_size, before=cursor.key
+            )
+            page, has_next = cursor.page, True
 
-        return RankingResult(ranking_type=ranking_type, users=users)
+        return RankingPage(
+            ranking_type=ranking_type,
+            page=page,
+            page_size=page_size,
+            users=users,
+            has_next=has_next,
+        )
@@ -2,12 +2,14 @@
 GetUserInfo Use Case - 사용자 정보 조회 로직
 """
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from src.core.entities.attendance import Attendance
 from src.core.entities.chat_activity import ChatActivity
 from src.core.entities.user import User
+from src.core.entities.ranking import RankingType
 from src.core.exceptions import UserNotRegisteredError
+from src.core.use_cases.get_my_rank_usecase import GetMyRankUseCase, RankPosition
 from src.repositories.attendance_repository import AttendanceRepository
 from src.repositories.chat_activity_repository import ChatActivityRepository
 from src.repositories.user_repository import UserRepository
@@ -20,6 +22,7 @@ class UserInfoResult:
     user: User
     recent_attendances: List[Attendance]
     top_jackpots: List[ChatActivity]
+    score_rank: Optional[RankPosition] = None
 
 
 class GetUserInfoUseCase:
@@ -30,16 +33,19 @@ class GetUserInfoUseCase:
         user_repo: UserRepository,
         attendance_repo: AttendanceRepository,
         chat_activity_repo: ChatActivityRepository,
+        get_my_rank_usecase: Optional[GetMyRankUseCase] = None,
     ):
         self.user_repo = user_repo
         self.attendance_repo = attendance_repo
         self.chat_activity_repo = chat_activity_repo
+        self.get_my_rank_usecase = get_my_rank_usecase
 
-    async def execute(self, telegram_id: int) -> UserInfoResult:
+    async def execute(self, telegram_id: int, chat_id: int) -> UserInfoResult:
         """사용자 정보 조회
 
         Args:
             telegram_id: 텔레그램 사용자 ID
+            chat_id: 채팅(그룹) ID
 
         Returns:
             UserInfoResult: 사용자 정보
@@ -48,7 +54,7 @@ class GetUserInfoUseCase:
             UserNotRegisteredError: 등록되지 않은 사용자
         """
         # 1. 사용자 조회
-        user = await self.user_repo.get_by_telegram_id(telegram_id)
+        user = await self.user_repo.get_by_telegram_id(telegram_id, chat_id)
         if not user:
             raise UserNotRegisteredError("먼저 .출첵 명령어로 등록해주세요!")
 
@@ -60,6 +66,14 @@ class GetUserInfoUseCase:
             user.id, limit=5
         )
 
+        # 4. 점수 순위 조회
+        score_rank = None
+        if self.get_my_rank_usecase is not None:
+            score_rank = await self.get_my_rank_usecase.position(user, RankingType.SCORE)
+
         return UserInfoResult(
-            user=user, recent_attendances=recent_attendances, top_jackpots=top_jackpots
+            user=user,
+            recent_attendances=recent_attendances,
+            top_jackpots=top_jackpots,
+            score_rank=score_rank,
         )
@@ -8,8 +8,10 @@ from src.core.entities.chat_activity import ChatActivity
 from src.core.entities.user import User
 from src.core.exceptions import UserNotRegisteredError
 from src.repositories.chat_activity_repository import ChatActivityRepository
+from src.repositories.chat_activity_writer import ChatActivityWriter
+from src.repositories.daily_stats_repository import DailyStatsRepository
 from src.repositories.score_config_repository import ScoreConfigRepository
-from src.repositories.user_repository import UserRepository
+from src.repositories.user_repository import UserCounterDelta, UserRepository
 
 
 @dataclass
@@ -29,48 +31,61 @@ class ProcessMessageUseCase:
         user_repo: UserRepository,
         chat_activity_repo: ChatActivityRepository,
         config_repo: ScoreConfigRepository,
+        daily_stats_repo: DailyStatsRepository,
+        activity_writer: Optional[ChatActivityWriter] = None,
     ):
         self.user_repo = user_repo
         self.chat_activity_repo = chat_activity_repo
         self.config_repo = config_repo
+        self.daily_stats_repo = daily_stats_repo
+        self.activity_writer = activity_writer
 
     async def execute(
-        self, telegram_id: int, message_id: int
+        self, telegram_id: int, chat_id: int, message_id: int
     ) -> Optional[ProcessMessageResult]:
         """메시지 처리 및 점수 부여
 
         Args:
             telegram_id: 텔레그램 사용자 ID
+            chat_id: 채팅(그룹) ID
             message_id: 메시지 ID
 
         Returns:
             ProcessMessageResult: 메시지 처리 결과 (미등록 유저는 None)
         """
-        # 1. 등록된 사용자인지 확인
-        user = await self.user_repo.get_by_telegram_id(telegram_id)
+        # 같은 사용자의 점수 갱신(읽기-수정-쓰기)은 ContainerMiddleware의 사용자 락이
+        # 커밋과 캐시 반영까지 직렬화하므로 다음 업데이트는 이 결과를 본다
+        # 1. 이 채팅에 등록된 사용자인지 확인
+        user = await self.user_repo.get_by_telegram_id(telegram_id, chat_id)
         if not user:
             # 미등록 유저는 무시 (None 반환)
             return None
 
         # 2. 점수 설정 조회
-        config = await self.config_repo.get_config()
+        config = await self.config_repo.get_config(chat_id)
 
         # 3. 채팅 활동 생성 (점수 계산 포함)
         activity = ChatActivity.create_activity(
-            user_id=user.id, message_id=message_id, config=config
+            user_id=user.id, chat_id=chat_id, message_id=message_id, config=config
         )
 
-        # 4. 채팅 활동 저장
-        await self.chat_activity_repo.create(activity)
-
-        # 5. 사용자 정보 업데이트
-        user.add_score(activity.final_score)
-        user.increment_chat_count()
-
-        if activity.is_jackpot:
-            user.record_jackpot(activity.final_score)
-
-        await self.user_repo.update(user)
+        # 4. 저장 및 사용자 정보 업데이트
+        if self.activity_writer:
+            # 배치 모드: 큐에 넣고 사용자 카운터/일별 롤업은 flush 시 일괄 반영
+            await self.activity_writer.submit(activity)
+
+            user.add_score(activity.final_score)
+            user.increment_chat_count()
+            if activity.is_jackpot:
+                user.record_jackpot(activity.final_score)
+            self.user_repo.remember(user)
+        else:
+            await self.chat_activity_repo.create(activity)
+            await self.daily_stats_repo.record_activities([activity])
+
+            delta = UserCounterDelta(user_id=user.id)
+            delta.add_activity(activity)
+            user = await self.user_repo.increment_counters(delta)
 
         return ProcessMessageResult(
             user=user, activity=activity, is_jackpot=activity.is_jackpot
@@ -15,6 +15,7 @@ async def check_in_handler(message: Message, attendance_service: AttendanceServi
     """출첵 명령어 핸들러"""
     result = await attendance_service.check_in(
         telegram_id=message.from_user.id,
+        chat_id=message.chat.id,
         username=message.from_user.username or "Unknown",
     )
 
@@ -13,7 +13,9 @@ router = Router()
 async def message_handler(message: Message, chat_activity_service: ChatActivityService):
     """일반 메시지 핸들러 (채팅 활동 점수)"""
     result = await chat_activity_service.process_message(
-        telegram_id=message.from_user.id, message_id=message.message_id
+        telegram_id=message.from_user.id,
+        chat_id=message.chat.id,
+        message_id=message.message_id,
     )
 
     if not result:
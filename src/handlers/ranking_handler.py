@@ -1,28 +1,100 @@
 """
 Ranking Handler - .랭킹 명령어 핸들러
 """
-from aiogram import Router
+from typing import Optional, Tuple
+
+from aiogram import F, Router
 from aiogram.filters import Command
-from aiogram.types import Message
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
+from aiogram.utils.keyboard import InlineKeyboardBuilder
 
-from src.core.use_cases.get_ranking_usecase import RankingType
+from config import settings
+from src.core.use_cases.get_ranking_usecase import RankingCursor, RankingPage, RankingType
+from src.infrastructure.cache.response_cache import response_cache
 from src.services.user_service import UserService
 
 router = Router()
 
 
-@router.message(Command("랭킹"))
-async def ranking_handler(message: Message, user_service: UserService):
-    """랭킹 명령어 핸들러 (점수 랭킹)"""
-    result = await user_service.get_ranking(RankingType.SCORE, limit=10)
+class RankingPageCallback(CallbackData, prefix="rk"):
+    """랭킹 페이지 이동 콜백 (키셋 커서 포함, 최대 64바이트)"""
+
+    type: str  # RankingType 값
+    page: int  # 이동할 페이지
+    key: str  # 경계 사용자의 정렬 키 + id ("."로 연결)
+    forward: bool
+
+    @classmethod
+    def from_cursor(cls, ranking_type: RankingType, cursor: RankingCursor) -> "RankingPageCallback":
+        return cls(
+            type=ranking_type.value,
+            page=cursor.page,
+            key=".".join(str(value) for value in cursor.key),
+            forward=cursor.forward,
+        )
+
+    def to_cursor(self) -> RankingCursor:
+        return RankingCursor(
+            page=self.page,
+            key=tuple(int(value) for value in self.key.split(".")),
+            forward=self.forward,
+        )
 
-    if not result["users"]:
-        await message.reply("아직 랭킹 데이터가 없습니다!")
-        return
 
-    # 랭킹 메시지 생성
+# 랭킹 타입별 (제목, 데이터 없을 때 안내)
+RANKING_VIEWS = {
+    RankingType.SCORE: ("🏆 <b>점수 랭킹", "아직 랭킹 데이터가 없습니다!"),
+    RankingType.CHAT_COUNT: ("💬 <b>채팅 랭킹", "아직 랭킹 데이터가 없습니다!"),
+    RankingType.JACKPOT: ("🎰 <b>잭팟 랭킹", "아직 잭팟 기록이 없습니다!"),
+    RankingType.CONSECUTIVE_DAYS: ("📅 <b>출석 랭킹", "아직 출석 기록이 없습니다!"),
+}
+
+
+# 랭킹 타입별 표시 이름과 값 포맷
+RANKING_LABELS = {
+    RankingType.SCORE: "🏆 점수",
+    RankingType.CHAT_COUNT: "💬 채팅",
+    RankingType.JACKPOT: "🎰 잭팟",
+    RankingType.CONSECUTIVE_DAYS: "📅 출석",
+}
+
+
+def format_ranking_value(ranking_type: RankingType, user) -> str:
+    """랭킹 타입별 사용자 값 표시"""
+    if ranking_type == RankingType.SCORE:
+        return f"{user.total_score:,}점"
+    if ranking_type == RankingType.CHAT_COUNT:
+        return f"{user.chat_count:,} 메시지"
+    if ranking_type == RankingType.JACKPOT:
+        return f"{user.jackpot_count}회"
+    return f"{user.consecutive_days}일 연속"
+
+
+def format_ranking_line(ranking_type: RankingType, user) -> str:
+    """랭킹 타입별 사용자 한 줄 표시 (랭킹 값과 보조 정보)"""
+    if ranking_type == RankingType.SCORE:
+        detail = f"{user.chat_count:,} 메시지"
+    elif ranking_type == RankingType.CHAT_COUNT:
+        detail = f"{user.total_score:,}점"
+    elif ranking_type == RankingType.JACKPOT:
+        detail = f"최고: {user.max_jackpot}점"
+    else:
+        detail = f"총 {user.total_attendance}일"
+    return f"<b>{format_ranking_value(ranking_type, user)}</b> ({detail})"
+
+
+def render_ranking_page(page: RankingPage) -> Tuple[str, Optional[InlineKeyboardMarkup]]:
+    """랭킹 페이지 메시지와 이전/다음 키보드 생성"""
+    title, _ = RANKING_VIEWS[page.ranking_type]
+    if page.page == 0:
+        title = f"{title} TOP {page.page_size}</b>"
+    else:
+        end_rank = page.start_rank + len(page.users) - 1
+        title = f"{title} ({page.start_rank}~{end_rank}위)</b>"
+
     ranking_lines = []
-    for idx, user in enumerate(result["users"], 1):
+    for idx, user in enumerate(page.users, page.start_rank):
         if idx == 1:
             medal = "👑"
         elif idx == 2:
@@ -34,99 +106,146 @@ async def ranking_handler(message: Message, user_service: UserService):
 
         ranking_lines.append(
             f"{medal} @{user.username or 'Unknown'} - "
-            f"<b>{user.total_score:,}점</b> ({user.chat_count:,} 메시지)"
+            f"{format_ranking_line(page.ranking_type, user)}"
         )
 
     ranking_text = "\n".join(ranking_lines)
 
-    await message.reply(f"🏆 <b>점수 랭킹 TOP 10</b>\n\n{ranking_text}")
+    builder = InlineKeyboardBuilder()
+    prev_cursor = page.prev_cursor()
+    if prev_cursor:
+        builder.button(
+            text="◀ 이전",
+            callback_data=RankingPageCallback.from_cursor(page.ranking_type, prev_cursor),
+        )
+    next_cursor = page.next_cursor()
+    if next_cursor:
+        builder.button(
+            text="다음 ▶",
+            callback_data=RankingPageCallback.from_cursor(page.ranking_type, next_cursor),
+        )
+    keyboard = builder.as_markup() if prev_cursor or next_cursor else None
 
+    return f"{title}\n\n{ranking_text}", keyboard
 
-@router.message(Command("채팅랭킹"))
-async def chat_ranking_handler(message: Message, user_service: UserService):
-    """채팅 랭킹 명령어 핸들러"""
-    result = await user_service.get_ranking(RankingType.CHAT_COUNT, limit=10)
 
-    if not result["users"]:
-        await message.reply("아직 랭킹 데이터가 없습니다!")
+async def reply_ranking(message: Message, user_service: UserService, ranking_type: RankingType):
+    """랭킹 첫 페이지 응답 (같은 데이터 버전이면 캐시된 응답 재사용)"""
+    # 버전은 조회 전에 읽어야 더 오래된 데이터가 새 버전으로 저장되지 않는다
+    version = user_service.ranking_version(message.chat.id, ranking_type)
+    cached = response_cache.get(ranking_type, message.chat.id, version)
+    if cached:
+        await message.reply(cached.text, reply_markup=cached.reply_markup)
         return
 
-    ranking_lines = []
-    for idx, user in enumerate(result["users"], 1):
-        if idx == 1:
-            medal = "👑"
-        elif idx == 2:
-            medal = "🥈"
-        elif idx == 3:
-            medal = "🥉"
-        else:
-            medal = f"{idx}."
+    result = await user_service.get_ranking_page(
+        message.chat.id, ranking_type, settings.ranking_page_size
+    )
+    page = result["page"]
 
-        ranking_lines.append(
-            f"{medal} @{user.username or 'Unknown'} - "
-            f"<b>{user.chat_count:,} 메시지</b> ({user.total_score:,}점)"
-        )
+    if not page.users:
+        _, text = RANKING_VIEWS[ranking_type]
+        keyboard = None
+    else:
+        text, keyboard = render_ranking_page(page)
 
-    ranking_text = "\n".join(ranking_lines)
+    response_cache.put(ranking_type, message.chat.id, version, text, keyboard)
+    await message.reply(text, reply_markup=keyboard)
 
-    await message.reply(f"💬 <b>채팅 랭킹 TOP 10</b>\n\n{ranking_text}")
+
+@router.message(Command("랭킹"))
+async def ranking_handler(message: Message, user_service: UserService):
+    """랭킹 명령어 핸들러 (점수 랭킹)"""
+    await reply_ranking(message, user_service, RankingType.SCORE)
+
+
+@router.message(Command("채팅랭킹"))
+async def chat_ranking_handler(message: Message, user_service: UserService):
+    """채팅 랭킹 명령어 핸들러"""
+    await reply_ranking(message, user_service, RankingType.CHAT_COUNT)
 
 
 @router.message(Command("잭팟랭킹"))
 async def jackpot_ranking_handler(message: Message, user_service: UserService):
     """잭팟 랭킹 명령어 핸들러"""
-    result = await user_service.get_ranking(RankingType.JACKPOT, limit=10)
+    await reply_ranking(message, user_service, RankingType.JACKPOT)
 
-    if not result["users"]:
-        await message.reply("아직 잭팟 기록이 없습니다!")
-        return
 
-    ranking_lines = []
-    for idx, user in enumerate(result["users"], 1):
-        if idx == 1:
-            medal = "👑"
-        elif idx == 2:
-            medal = "🥈"
-        elif idx == 3:
-            medal = "🥉"
-        else:
-            medal = f"{idx}."
+@router.message(Command("출석랭킹"))
+async def attendance_ranking_handler(message: Message, user_service: UserService):
+    """출석 랭킹 명령어 핸들러"""
+    await reply_ranking(message, user_service, RankingType.CONSECUTIVE_DAYS)
+
+
+@router.callback_query(RankingPageCallback.filter(F.type.in_({t.value for t in RankingType})))
+async def ranking_page_callback(
+    callback: CallbackQuery, callback_data: RankingPageCallback, user_service: UserService
+):
+    """랭킹 페이지 이동 콜백 핸들러"""
+    message = callback.message
+    if not isinstance(message, Message):
+        # 너무 오래되어 접근할 수 없는 메시지는 수정할 수 없다
+        await callback.answer("랭킹을 다시 조회해 주세요!")
+        return
 
-        ranking_lines.append(
-            f"{medal} @{user.username or 'Unknown'} - "
-            f"<b>{user.jackpot_count}회</b> (최고: {user.max_jackpot}점)"
-        )
+    ranking_type = RankingType(callback_data.type)
+    chat_id = message.chat.id
+    version = user_service.ranking_version(chat_id, ranking_type)
+    cached = response_cache.get(callback_data.pack(), chat_id, version)
+    if cached:
+        await message.edit_text(cached.text, reply_markup=cached.reply_markup)
+        await callback.answer()
+        return
 
-    ranking_text = "\n".join(ranking_lines)
+    result = await user_service.get_ranking_page(
+        chat_id, ranking_type, settings.ranking_page_size, callback_data.to_cursor()
+    )
+    page = result["page"]
 
-    await message.reply(f"🎰 <b>잭팟 랭킹 TOP 10</b>\n\n{ranking_text}")
+    if not page.users:
+        await callback.answer("더 이상 랭킹이 없습니다!")
+        return
 
+    text, keyboard = render_ranking_page(page)
+    response_cache.put(callback_data.pack(), chat_id, version, text, keyboard)
+    await message.edit_text(text, reply_markup=keyboard)
+    await callback.answer()
 
-@router.message(Command("출석랭킹"))
-async def attendance_ranking_handler(message: Message, user_service: UserService):
-    """출석 랭킹 명령어 핸들러"""
-    result = await user_service.get_ranking(RankingType.CONSECUTIVE_DAYS, limit=10)
 
-    if not result["users"]:
-        await message.reply("아직 출석 기록이 없습니다!")
+@router.message(Command("내순위"))
+async def my_rank_handler(message: Message, user_service: UserService):
+    """내순위 명령어 핸들러 (랭킹 타입별 내 순위와 주변 사용자)"""
+    if message.from_user is None:
         return
 
-    ranking_lines = []
-    for idx, user in enumerate(result["users"], 1):
-        if idx == 1:
-            medal = "👑"
-        elif idx == 2:
-            medal = "🥈"
-        elif idx == 3:
-            medal = "🥉"
-        else:
-            medal = f"{idx}."
+    result = await user_service.get_my_rank(
+        telegram_id=message.from_user.id, chat_id=message.chat.id
+    )
 
-        ranking_lines.append(
-            f"{medal} @{user.username or 'Unknown'} - "
-            f"<b>{user.consecutive_days}일 연속</b> (총 {user.total_attendance}일)"
-        )
-
-    ranking_text = "\n".join(ranking_lines)
+    if not result["success"]:
+        await message.reply(f"❌ {result['error']}")
+        return
 
-    await message.reply(f"📅 <b>출석 랭킹 TOP 10</b>\n\n{ranking_text}")
+    me = result["user"]
+    sections = []
+    for position in result["positions"]:
+        label = RANKING_LABELS[position.ranking_type]
+        if position.rank is None:
+            sections.append(f"<b>{label}</b>: 순위 없음")
+            continue
+
+        lines = [
+            f"<b>{label}</b>: {position.rank:,}위 / {position.total:,}명 "
+            f"(상위 {position.percentile}%)"
+        ]
+        for ranked in position.neighbors:
+            marker = "▶" if ranked.user.id == me.id else "  "
+            lines.append(
+                f"{marker} {ranked.rank}. @{ranked.user.username or 'Unknown'} - "
+                f"{format_ranking_value(position.ranking_type, ranked.user)}"
+            )
+        sections.append("\n".join(lines))
+
+    sections_text = "\n\n".join(sections)
+
+    await message.reply(f"📍 <b>내 순위</b>\n\n{sections_text}")
@@ -28,6 +28,10 @@ async def start_handler(message: Message):
         f"  /채팅랭킹 - 채팅 수 랭킹\n"
         f"  /잭팟랭킹 - 잭팟 횟수 랭킹\n"
         f"  /출석랭킹 - 연속 출석 랭킹\n"
+        f"  /내순위 - 랭킹별 내 순위\n"
+        f"  /일일통계 [YYYY-MM-DD] - 오늘(또는 지난 날) 채팅방 통계\n"
+        f"  /월통계 [YYYY-MM] - 이번 달(또는 지난 달) 채팅방 통계\n"
+        f"  /활동통계 - 최근 활동 추이와 시간대 분포\n"
         f"  /도움말 - 상세 도움말"
     )
 
@@ -57,7 +61,15 @@ async def help_handler(message: Message):
         f"  • <b>/랭킹</b> - 점수 순위\n"
         f"  • <b>/채팅랭킹</b> - 채팅 수 순위\n"
         f"  • <b>/잭팟랭킹</b> - 잭팟 횟수 순위\n"
-        f"  • <b>/출석랭킹</b> - 연속 출석 순위\n\n"
+        f"  • <b>/출석랭킹</b> - 연속 출석 순위\n"
+        f"  • <b>/내순위</b> - 내 순위와 주변 사용자\n\n"
+        f"📈 <b>채팅방 통계</b>\n"
+        f"  • <b>/일일통계</b> - 오늘 출석/채팅 현황\n"
+        f"  • <b>/일일통계 2024-01-31</b> - 지난 날 현황\n"
+        f"  • <b>/월통계</b> - 이번 달 출석/채팅 현황\n"
+        f"  • <b>/월통계 2024-01</b> - 지난 달 현황\n"
+        f"  • <b>/활동통계</b> - 일별 추이, 요일x시간대 분포\n"
+        f"  • 직전 기간 대비 활동 사용자/메시지 변화\n\n"
         f"💡 <b>팁</b>\n"
         f"  • 매일 출첵으로 연속 보너스 받기!\n"
         f"  • 채팅 많이 하면 잭팟 기회 증가!\n"
@@ -1,26 +1,80 @@
 """
 Stats Handler - 통계 명령어 핸들러
 """
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
 from aiogram import Router
-from aiogram.filters import Command
+from aiogram.filters import Command, CommandObject
 from aiogram.types import Message
 
+from src.core import clock
+from src.core.entities.stats import ActivityBucket, ActivityHeatmap, DailyStats, MonthlyStats
+from src.infrastructure.cache.response_cache import response_cache
 from src.services.stats_service import StatsService
 
 router = Router()
 
+WEEKDAYS = "월화수목금토일"
+# 히트맵 칸 음영 (최대값 대비 비율 구간)
+HEATMAP_SHADES = " ·░▒▓█"
+
+
+def parse_date_arg(args: Optional[str]) -> Optional[date]:
+    """일일통계 인자(YYYY-MM-DD) 해석 (없으면 오늘, 잘못됐거나 미래면 None)"""
+    if not args:
+        return clock.today()
+    try:
+        target_date = datetime.strptime(args.strip(), "%Y-%m-%d").date()
+    except ValueError:
+        return None
+    return target_date if target_date <= clock.today() else None
+
+
+def parse_month_arg(args: Optional[str]) -> Optional[Tuple[int, int]]:
+    """월통계 인자(YYYY-MM) 해석 (없으면 이번 달, 잘못됐거나 미래면 None)"""
+    now = clock.now()
+    if not args:
+        return now.year, now.month
+    try:
+        month_start = datetime.strptime(args.strip(), "%Y-%m")
+    except ValueError:
+        return None
+    if (month_start.year, month_start.month) > (now.year, now.month):
+        return None
+    return month_start.year, month_start.month
+
 
 @router.message(Command("일일통계"))
-async def daily_stats_handler(message: Message, stats_service: StatsService):
-    """일일통계 명령어 핸들러"""
-    result = await stats_service.get_daily_stats()
+async def daily_stats_handler(
+    message: Message, stats_service: StatsService, command: CommandObject
+):
+    """일일통계 명령어 핸들러 (/일일통계 [YYYY-MM-DD], 같은 데이터 버전이면 캐시된 응답 재사용)"""
+    target_date = parse_date_arg(command.args)
+    if target_date is None:
+        await message.reply("❌ 오늘까지의 날짜를 YYYY-MM-DD 형식으로 입력해주세요. (예: /일일통계 2024-01-31)")
+        return
+
+    version = stats_service.data_version(message.chat.id)
+    cache_key = ("일일통계", target_date)
+    cached = response_cache.get(cache_key, message.chat.id, version)
+    if cached:
+        await message.reply(cached.text)
+        return
+
+    result = await stats_service.get_daily_stats(message.chat.id, target_date)
 
     if not result["success"]:
         await message.reply("❌ 통계를 가져올 수 없습니다.")
         return
 
-    stats = result["stats"]
+    text = render_daily_stats(result["stats"])
+    response_cache.put(cache_key, message.chat.id, version, text)
+    await message.reply(text)
+
 
+def render_daily_stats(stats: DailyStats) -> str:
+    """일일 통계 메시지 생성"""
     # TOP 사용자 목록
     top_users_str = ""
     if stats.top_users:
@@ -33,7 +87,9 @@ async def daily_stats_handler(message: Message, stats_service: StatsService):
     else:
         top_users_str = "  데이터가 없습니다"
 
-    await message.reply(
+    top_label = "오늘의 TOP 3" if stats.date == clock.today() else "그날의 TOP 3"
+
+    return (
         f"📊 <b>일일 통계</b> ({stats.date.strftime('%Y-%m-%d')})\n\n"
         f"👥 <b>활동 현황</b>\n"
         f"  • 활동 사용자: {stats.total_users}명\n"
@@ -43,22 +99,42 @@ async def daily_stats_handler(message: Message, stats_service: StatsService):
         f"  • 총 획득 점수: {stats.total_score:,}점\n\n"
         f"🎰 <b>잭팟</b>\n"
         f"  • 잭팟 횟수: {stats.jackpot_count}회\n\n"
-        f"🏆 <b>오늘의 TOP 3</b>\n"
+        f"🏆 <b>{top_label}</b>\n"
         f"{top_users_str}"
     )
 
 
 @router.message(Command("월통계"))
-async def monthly_stats_handler(message: Message, stats_service: StatsService):
-    """월통계 명령어 핸들러"""
-    result = await stats_service.get_monthly_stats()
+async def monthly_stats_handler(
+    message: Message, stats_service: StatsService, command: CommandObject
+):
+    """월통계 명령어 핸들러 (/월통계 [YYYY-MM], 같은 데이터 버전이면 캐시된 응답 재사용)"""
+    period = parse_month_arg(command.args)
+    if period is None:
+        await message.reply("❌ 이번 달까지의 월을 YYYY-MM 형식으로 입력해주세요. (예: /월통계 2024-01)")
+        return
+
+    year, month = period
+    version = stats_service.data_version(message.chat.id)
+    cache_key = ("월통계", year, month)
+    cached = response_cache.get(cache_key, message.chat.id, version)
+    if cached:
+        await message.reply(cached.text)
+        return
+
+    result = await stats_service.get_monthly_stats(message.chat.id, year, month)
 
     if not result["success"]:
         await message.reply("❌ 통계를 가져올 수 없습니다.")
         return
 
-    stats = result["stats"]
+    text = render_monthly_stats(result["stats"])
+    response_cache.put(cache_key, message.chat.id, version, text)
+    await message.reply(text)
+
 
+def render_monthly_stats(stats: MonthlyStats) -> str:
+    """월별 통계 메시지 생성"""
     # TOP 사용자 목록
     top_users_str = ""
     if stats.top_users:
@@ -79,10 +155,19 @@ async def monthly_stats_handler(message: Message, stats_service: StatsService):
             f"{stats.most_active_count:,}개 메시지"
         )
 
-    await message.reply(
+    # 활동 사용자 수 (긴 기간은 스케치 추정값)
+    total_users_str = f"{stats.total_users}명"
+    if stats.total_users_estimated:
+        total_users_str = f"약 {total_users_str}"
+
+    now = clock.now()
+    is_current = (stats.year, stats.month) == (now.year, now.month)
+    top_label = "이번 달 TOP 5" if is_current else "그 달 TOP 5"
+
+    return (
         f"📊 <b>월별 통계</b> ({stats.year}년 {stats.month}월)\n\n"
         f"👥 <b>활동 현황</b>\n"
-        f"  • 활동 사용자: {stats.total_users}명\n"
+        f"  • 활동 사용자: {total_users_str}\n"
         f"  • 총 출석 횟수: {stats.check_in_count}회\n\n"
         f"💬 <b>채팅 현황</b>\n"
         f"  • 총 메시지: {stats.total_messages:,}개\n"
@@ -91,6 +176,106 @@ async def monthly_stats_handler(message: Message, stats_service: StatsService):
         f"  • 잭팟 횟수: {stats.jackpot_count}회\n\n"
         f"🔥 <b>가장 활발했던 날</b>\n"
         f"{most_active_str}\n\n"
-        f"🏆 <b>이번 달 TOP 5</b>\n"
+        f"🏆 <b>{top_label}</b>\n"
         f"{top_users_str}"
     )
+
+
+@router.message(Command("활동통계"))
+async def activity_stats_handler(message: Message, stats_service: StatsService):
+    """활동통계 명령어 핸들러 (같은 데이터 버전이면 캐시된 응답 재사용)"""
+    version = stats_service.data_version(message.chat.id)
+    cache_key = ("활동통계", clock.today())
+    cached = response_cache.get(cache_key, message.chat.id, version)
+    if cached:
+        await message.reply(cached.text)
+        return
+
+    result = await stats_service.get_activity_report(message.chat.id)
+
+    if not result["success"]:
+        await message.reply("❌ 통계를 가져올 수 없습니다.")
+        return
+
+    text = render_activity_report(
+        result["days"],
+        result["daily"],
+        result["heatmap"],
+        result["current"],
+        result["previous"],
+        result["current_users"],
+        result["previous_users"],
+    )
+    response_cache.put(cache_key, message.chat.id, version, text)
+    await message.reply(text)
+
+
+def render_change(current: int, previous: int) -> str:
+    """직전 기간 대비 증감률"""
+    if previous == 0:
+        return "신규" if current else "-"
+    change = (current - previous) / previous * 100
+    if change > 0:
+        return f"▲ {change:.1f}%"
+    if change < 0:
+        return f"▼ {-change:.1f}%"
+    return "변동 없음"
+
+
+def render_heatmap(heatmap: ActivityHeatmap) -> str:
+    """요일 x 시간대 히트맵 (최대값 대비 음영)"""
+    peak_count = max(max(row) for row in heatmap.counts)
+    lines = ["   0     6     12    18"]
+    for weekday, row in enumerate(heatmap.counts):
+        cells = "".join(
+            HEATMAP_SHADES[-(-count * (len(HEATMAP_SHADES) - 1) // peak_count)] if count else " "
+            for count in row
+        )
+        lines.append(f"{WEEKDAYS[weekday]} {cells}")
+    return "\n".join(lines)
+
+
+def render_activity_report(
+    days: int,
+    daily: List[ActivityBucket],
+    heatmap: ActivityHeatmap,
+    current: ActivityBucket,
+    previous: ActivityBucket,
+    current_users: Tuple[int, bool],
+    previous_users: Tuple[int, bool],
+) -> str:
+    """활동 리포트 메시지 생성"""
+    users, estimated = current_users
+    users_str = f"약 {users}명" if estimated else f"{users}명"
+
+    daily_str = "\n".join(
+        f"  {bucket.start.strftime('%m/%d')}({WEEKDAYS[bucket.start.weekday()]}): "
+        f"{bucket.message_count:,}개"
+        for bucket in daily
+    )
+
+    if heatmap.peak is None:
+        heatmap_str = "  데이터가 없습니다"
+    else:
+        weekday, hour = heatmap.peak
+        heatmap_str = (
+            f"<pre>{render_heatmap(heatmap)}</pre>\n"
+            f"  • 가장 활발한 시간: {WEEKDAYS[weekday]}요일 {hour}시"
+        )
+
+    return (
+        f"📈 <b>활동 통계</b> (최근 {days}일, "
+        f"{daily[0].start.strftime('%m/%d')}~{daily[-1].start.strftime('%m/%d')})\n\n"
+        f"💬 <b>직전 {days}일 대비</b>\n"
+        f"  • 활동 사용자: {users_str} ({render_change(users, previous_users[0])})\n"
+        f"  • 메시지: {current.message_count:,}개 "
+        f"({render_change(current.message_count, previous.message_count)})\n"
+        f"  • 획득 점수: {current.chat_score:,}점 "
+        f"({render_change(current.chat_score, previous.chat_score)})\n"
+        f"  • 잭팟: {current.jackpot_count}회 "
+        f"({render_change(current.jackpot_count, previous.jackpot_count)})\n\n"
+        f"📅 <b>일별 메시지</b>\n"
+        f"{daily_str}\n\n"
+        f"🕐 <b>요일 x 시간대</b>\n"
+        f"{heatmap_str}"
+    )
@@ -13,7 +13,9 @@ router = Router()
 @router.message(Command("내정보"))
 async def user_info_handler(message: Message, user_service: UserService):
     """내정보 명령어 핸들러"""
-    result = await user_service.get_user_info(telegram_id=message.from_user.id)
+    result = await user_service.get_user_info(
+        telegram_id=message.from_user.id, chat_id=message.chat.id
+    )
 
     if not result["success"]:
         await message.reply(f"❌ {result['error']}")
@@ -22,6 +24,7 @@ async def user_info_handler(message: Message, user_service: UserService):
     user = result["user"]
     recent_attendances = result["recent_attendances"]
     top_jackpots = result["top_jackpots"]
+    score_rank = result["score_rank"]
 
     # 최근 출석 현황
     attendance_str = ""
@@ -47,6 +50,14 @@ async def user_info_handler(message: Message, user_service: UserService):
     else:
         jackpot_str = "  아직 잭팟이 없어요 😢"
 
+    # 점수 순위
+    rank_str = ""
+    if score_rank and score_rank.rank:
+        rank_str = (
+            f"  • 점수 순위: {score_rank.rank:,}위 / {score_rank.total:,}명 "
+            f"(상위 {score_rank.percentile}%)\n"
+        )
+
     await message.reply(
         f"👤 <b>사용자 정보</b>\n\n"
         f"📅 <b>출석 현황</b>\n"
@@ -55,7 +66,8 @@ async def user_info_handler(message: Message, user_service: UserService):
         f"💰 <b>점수 현황</b>\n"
         f"  • 총 점수: {user.total_score:,}점\n"
         f"  • 총 채팅 수: {user.chat_count:,}개\n"
-        f"  • 평균 점수/채팅: {user.average_score_per_chat}점\n\n"
+        f"  • 평균 점수/채팅: {user.average_score_per_chat}점\n"
+        f"{rank_str}\n"
         f"🎰 <b>잭팟 기록</b>\n"
         f"  • 잭팟 횟수: {user.jackpot_count}회\n"
         f"  • 최고 잭팟: {user.max_jackpot}점\n\n"
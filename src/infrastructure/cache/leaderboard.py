@@ -0,0 +1,376 @@
+"""
+Leaderboard - 랭킹 타입별 증분 갱신 메모리 리더보드
+"""
+import asyncio
+import itertools
+import random
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, AsyncIterable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config import settings
+from src.core.entities.ranking import RankingType
+from src.core.entities.user import User
+
+_MAX_LEVEL = 32
+
+
+class _Node:
+    """스킵 리스트 노드 (레벨별 다음 노드와 건너뛰는 원소 수)"""
+
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value: Any, level: int):
+        self.value = value
+        self.next: List[Optional["_Node"]] = [None] * level
+        self.width: List[int] = [1] * level
+
+
+class IndexableSkipList:
+    """순위(인덱스) 조회가 가능한 정렬 스킵 리스트
+
+    삽입/삭제/순위 조회/인덱스 조회 모두 평균 O(log n).
+    값은 서로 비교 가능하고 중복이 없어야 한다.
+    """
+
+    def __init__(self) -> None:
+        self._head = _Node(None, _MAX_LEVEL)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, value: Any) -> None:
+        """값 삽입"""
+        chain: List[_Node] = [self._head] * _MAX_LEVEL
+        steps_at_level = [0] * _MAX_LEVEL
+        node = self._head
+        for level in reversed(range(_MAX_LEVEL)):
+            next_node = node.next[level]
+            while next_node is not None and next_node.value < value:
+                steps_at_level[level] += node.width[level]
+                node = next_node
+                next_node = node.next[level]
+            chain[level] = node
+
+        new_level = self._random_level()
+        new_node = _Node(value, new_level)
+        steps = 0
+        for level in range(new_level):
+            prev = chain[level]
+            new_node.next[level] = prev.next[level]
+            prev.next[level] = new_node
+            new_node.width[level] = prev.width[level] - steps
+            prev.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(new_level, _MAX_LEVEL):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, value: Any) -> None:
+        """값 삭제 (없으면 KeyError)"""
+        chain: List[_Node] = [self._head] * _MAX_LEVEL
+        node = self._head
+        for level in reversed(range(_MAX_LEVEL)):
+            next_node = node.next[level]
+            while next_node is not None and next_node.value < value:
+                node = next_node
+                next_node = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        if target is None or target.value != value:
+            raise KeyError(value)
+
+        for level in range(len(target.next)):
+            prev = chain[level]
+            prev.width[level] += target.width[level] - 1
+            prev.next[level] = target.next[level]
+        for level in range(len(target.next), _MAX_LEVEL):
+            chain[level].width[level] -= 1
+        self._size -= 1
+
+    def index(self, value: Any) -> int:
+        """값의 0 기반 순위 (없으면 ValueError)"""
+        position = 0
+        node = self._head
+        for level in reversed(range(_MAX_LEVEL)):
+            next_node = node.next[level]
+            while next_node is not None and next_node.value < value:
+                position += node.width[level]
+                node = next_node
+                next_node = node.next[level]
+
+        target = node.next[0]
+        if target is None or target.value != value:
+            raise ValueError(value)
+        return position
+
+    def __getitem__(self, index: int) -> Any:
+        return self._node_at(index).value
+
+    def islice(self, start: int, stop: int) -> Iterator[Any]:
+        """[start, stop) 구간 값 순회"""
+        start = max(start, 0)
+        stop = min(stop, self._size)
+        if start >= stop:
+            return
+        node: Optional[_Node] = self._node_at(start)
+        remaining = stop - start
+        while node is not None and remaining > 0:
+            yield node.value
+            node = node.next[0]
+            remaining -= 1
+
+    def _node_at(self, index: int) -> _Node:
+        """0 기반 인덱스의 노드"""
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        remaining = index + 1
+        node = self._head
+        for level in reversed(range(_MAX_LEVEL)):
+            next_node = node.next[level]
+            while next_node is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = next_node
+                next_node = node.next[level]
+        return node
+
+    @staticmethod
+    def _random_level() -> int:
+        level = 1
+        while level < _MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+
+class Leaderboard:
+    """랭킹 타입 1개의 정렬 인덱스
+
+    (정렬 키 내림차순, 사용자 ID 내림차순)으로 정렬하며, 키를 부호 반전해
+    스킵 리스트에 오름차순으로 저장한다.
+    """
+
+    def __init__(self, ranking_type: RankingType):
+        self.ranking_type = ranking_type
+        self._entries = IndexableSkipList()
+        self._keys: Dict[int, Tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._keys
+
+    def update(self, user: User) -> bool:
+        """사용자 위치 갱신
+
+        Returns:
+            bool: 정렬 키 또는 포함 여부가 바뀌었는지
+        """
+        key = self._key(user) if self.ranking_type.is_ranked(user) else None
+        old_key = self._keys.get(user.id)
+        if key == old_key:
+            return False
+
+        if old_key is not None:
+            self._entries.remove(old_key)
+            del self._keys[user.id]
+        if key is not None:
+            self._entries.insert(key)
+            self._keys[user.id] = key
+        return True
+
+    def rank_of(self, user_id: int) -> Optional[int]:
+        """사용자의 0 기반 순위 (랭킹 대상이 아니면 None)"""
+        key = self._keys.get(user_id)
+        return None if key is None else self._entries.index(key)
+
+    def user_ids(self, start: int, stop: int) -> List[int]:
+        """[start, stop) 순위 구간의 사용자 ID"""
+        return [-key[-1] for key in self._entries.islice(start, stop)]
+
+    def _key(self, user: User) -> Tuple[int, ...]:
+        return tuple(-value for value in self.ranking_type.sort_key(user)) + (-user.id,)
+
+
+class _ChatLeaderboards:
+    """채팅 1개의 랭킹 타입별 리더보드와 사용자 상태"""
+
+    def __init__(self) -> None:
+        self.loaded_at = time.monotonic()
+        self.boards: Dict[RankingType, Leaderboard] = {
+            ranking_type: Leaderboard(ranking_type) for ranking_type in RankingType
+        }
+        self.users: Dict[int, User] = {}
+        self.versions: Dict[RankingType, int] = {ranking_type: 0 for ranking_type in RankingType}
+
+    def update(self, user: User, version: int) -> None:
+        """사용자 상태 반영 (값이 바뀐 랭킹은 version으로 갱신)"""
+        self.users[user.id] = replace(user)
+        for ranking_type, board in self.boards.items():
+            if board.update(user) or user.id in board:
+                self.versions[ranking_type] = version
+
+
+class LeaderboardRegistry:
+    """채팅별, 랭킹 타입별 리더보드 모음
+
+    채팅의 랭킹을 처음 조회할 때 해당 채팅 사용자만 적재하고(ensure_loaded),
+    이후 사용자 상태가 바뀔 때마다 update()로 증분 갱신한다. 적재된 채팅 수는
+    max_chats로 제한하며 가장 오래 조회하지 않은 채팅부터 내린다.
+
+    버전은 프로세스 전역 단조 증가 값이라 채팅을 내렸다 다시 적재해도 이전 값과
+    겹치지 않는다. 랭킹 타입별 버전은 해당 랭킹의 순서나 포함된 사용자 값이
+    바뀔 때, 채팅 데이터 버전은 채팅의 사용자 상태가 바뀔 때마다 갱신된다.
+    렌더링 결과 캐시는 이 버전을 키로 사용한다. 채팅 데이터 버전도 max_chats개까지만
+    보관하며, 밀려난 채팅은 다음 조회 때 새 버전을 발급받는다.
+
+    리더보드는 프로세스마다 따로 있으므로 여러 레플리카가 같은 DB에 쓰면 다른
+    레플리카의 변경이 보이지 않는다. reload_interval이 지난 채팅은 다음 조회 때
+    DB에서 다시 적재해 그 차이를 reload_interval 이내로 제한한다.
+    """
+
+    def __init__(self, max_chats: int = 1000, reload_interval: float = 0.0) -> None:
+        """
+        Args:
+            max_chats: 메모리에 적재할 최대 채팅 수
+            reload_interval: 적재 후 DB에서 다시 적재하기까지의 시간 (초, 0이면 다시 적재하지 않음)
+        """
+        self.max_chats = max_chats
+        self.reload_interval = reload_interval
+        self._chats: "OrderedDict[int, _ChatLeaderboards]" = OrderedDict()
+        self._data_versions: "OrderedDict[int, int]" = OrderedDict()
+        self._loading: Dict[int, Dict[int, User]] = {}
+        self._load_locks: Dict[int, asyncio.Lock] = {}
+        self._clock = itertools.count(1)
+
+    def is_loaded(self, chat_id: int) -> bool:
+        """채팅 리더보드 적재 여부"""
+        return chat_id in self._chats
+
+    async def ensure_loaded(
+        self, chat_id: int, loader: Callable[[], AsyncIterable[User]]
+    ) -> None:
+        """채팅 리더보드가 없거나 reload_interval이 지났으면 loader로 채팅 사용자 전체를 적재
+
+        적재 중에 들어온 update()는 따로 모았다가 적재 후 덮어써서
+        DB에서 읽은 이전 상태가 최신 상태를 덮지 않게 한다. 다른 호출자가 다시
+        적재하는 동안에는 기다리지 않고 기존 리더보드를 그대로 사용한다.
+        """
+        if self._is_fresh(chat_id):
+            self._chats.move_to_end(chat_id)
+            return
+
+        lock = self._load_locks.setdefault(chat_id, asyncio.Lock())
+        if lock.locked() and chat_id in self._chats:
+            self._chats.move_to_end(chat_id)
+            return
+
+        async with lock:
+            if self._is_fresh(chat_id):
+                return
+
+            self._loading[chat_id] = {}
+            try:
+                chat = _ChatLeaderboards()
+                version = next(self._clock)
+                async for user in loader():
+                    chat.update(user, version)
+                for user in self._loading[chat_id].values():
+                    chat.update(user, next(self._clock))
+            finally:
+                del self._loading[chat_id]
+                self._load_locks.pop(chat_id, None)
+
+            # 다른 레플리카의 변경이 들어왔을 수 있으므로 데이터 버전도 새로 발급
+            self._bump_data_version(chat_id)
+            self._chats[chat_id] = chat
+            self._chats.move_to_end(chat_id)
+            while len(self._chats) > self.max_chats:
+                evicted_id, _ = self._chats.popitem(last=False)
+                self._data_versions.pop(evicted_id, None)
+
+    def _is_fresh(self, chat_id: int) -> bool:
+        """적재되어 있고 다시 적재할 시점이 지나지 않았는지"""
+        chat = self._chats.get(chat_id)
+        if chat is None:
+            return False
+        if not self.reload_interval:
+            return True
+        return time.monotonic() - chat.loaded_at < self.reload_interval
+
+    def update(self, user: User) -> None:
+        """사용자 상태 반영"""
+        if user.id is None:
+            return
+
+        chat = self._chats.get(user.chat_id)
+        if chat is not None and chat.users.get(user.id) == user:
+            return
+
+        version = self._bump_data_version(user.chat_id)
+        if chat is not None:
+            chat.update(user, version)
+        if user.chat_id in self._loading:
+            self._loading[user.chat_id][user.id] = replace(user)
+
+    def touch(self, chat_id: int) -> None:
+        """채팅 데이터 버전만 갱신 (사용자 상태 외의 채팅 데이터가 바뀌었을 때)"""
+        self._bump_data_version(chat_id)
+
+    def version(self, chat_id: int, ranking_type: RankingType) -> Optional[int]:
+        """랭킹 데이터 버전 (적재되지 않은 채팅이면 None)"""
+        chat = self._chats.get(chat_id)
+        return chat.versions[ranking_type] if chat else None
+
+    def data_version(self, chat_id: int) -> int:
+        """채팅 데이터 버전 (사용자 상태가 바뀔 때마다 갱신)
+
+        보관 중인 버전이 없으면 새로 발급한다. 밀려난 채팅이 예전 버전으로
+        캐시된 응답을 다시 쓰지 않도록 0 같은 고정값을 돌려주지 않는다.
+        """
+        version = self._data_versions.get(chat_id)
+        if version is None:
+            return self._bump_data_version(chat_id)
+        self._data_versions.move_to_end(chat_id)
+        return version
+
+    def _bump_data_version(self, chat_id: int) -> int:
+        """채팅 데이터 버전 새로 발급 (max_chats개를 넘으면 오래된 채팅부터 제거)"""
+        version = next(self._clock)
+        self._data_versions[chat_id] = version
+        self._data_versions.move_to_end(chat_id)
+        while len(self._data_versions) > self.max_chats:
+            self._data_versions.popitem(last=False)
+        return version
+
+    def top(
+        self, chat_id: int, ranking_type: RankingType, limit: int, offset: int = 0
+    ) -> List[User]:
+        """상위 사용자 조회"""
+        chat = self._chats[chat_id]
+        user_ids = chat.boards[ranking_type].user_ids(offset, offset + limit)
+        return [replace(chat.users[user_id]) for user_id in user_ids]
+
+    def rank_of(self, chat_id: int, ranking_type: RankingType, user_id: int) -> Optional[int]:
+        """사용자의 1 기반 순위 (랭킹 대상이 아니면 None)"""
+        rank = self._chats[chat_id].boards[ranking_type].rank_of(user_id)
+        return None if rank is None else rank + 1
+
+    def size(self, chat_id: int, ranking_type: RankingType) -> int:
+        """랭킹 대상 사용자 수"""
+        return len(self._chats[chat_id].boards[ranking_type])
+
+    def clear(self) -> None:
+        """전체 초기화"""
+        self._chats.clear()
+        self._data_versions.clear()
+
+
+# Global leaderboard registry instance
+leaderboards = LeaderboardRegistry(
+    max_chats=settings.leaderboard_max_chats,
+    reload_interval=settings.leaderboard_reload_interval,
+)
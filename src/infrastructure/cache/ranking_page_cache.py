@@ -0,0 +1,12 @@
+"""
+Ranking page cache - 랭킹 페이지 조회 결과 캐시
+"""
+from config import settings
+from src.infrastructure.cache.lru import LRUCache
+
+# Global ranking page cache instance
+# 키: (랭킹 타입, 페이지 크기, 커서, 리더보드 버전), 값: RankingPage
+ranking_page_cache: LRUCache[tuple, object] = LRUCache(
+    maxsize=settings.ranking_page_cache_size,
+    ttl=settings.ranking_page_cache_ttl,
+)
@@ -0,0 +1,65 @@
+"""
+Response cache - 렌더링된 명령어 응답 캐시
+"""
+from typing import Any, Hashable, NamedTuple, Optional
+
+from config import settings
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.metrics import metrics
+
+
+class CachedResponse(NamedTuple):
+    """캐시된 응답 (메시지 텍스트, 인라인 키보드)"""
+
+    text: str
+    reply_markup: Any = None
+
+
+class ResponseCache:
+    """(명령어, 채팅, 데이터 버전) → 최종 응답 텍스트 캐시
+
+    데이터 버전이 바뀌면 키가 달라지므로 별도 무효화가 필요 없고, 오래된
+    버전의 항목은 TTL/LRU로 밀려난다. 버전을 알 수 없으면(None) 캐시하지 않는다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: 최대 캐시 항목 수
+            ttl: 응답 유지 시간 (초)
+        """
+        self._cache: LRUCache[tuple, CachedResponse] = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def get(
+        self, command: Hashable, chat_id: int, version: Optional[int]
+    ) -> Optional[CachedResponse]:
+        """캐시된 응답 조회"""
+        if version is None:
+            return None
+
+        response: Optional[CachedResponse] = self._cache.get((command, chat_id, version))
+        metrics.increment("response_cache_hit" if response else "response_cache_miss")
+        return response
+
+    def put(
+        self,
+        command: Hashable,
+        chat_id: int,
+        version: Optional[int],
+        text: str,
+        reply_markup: Any = None,
+    ) -> None:
+        """응답 저장"""
+        if version is not None:
+            self._cache.set((command, chat_id, version), CachedResponse(text, reply_markup))
+
+    def clear(self) -> None:
+        """전체 캐시 제거"""
+        self._cache.clear()
+
+
+# Global response cache instance
+response_cache = ResponseCache(
+    maxsize=settings.response_cache_size,
+    ttl=settings.response_cache_ttl,
+)
@@ -0,0 +1,68 @@
+"""
+ScoreConfig cache - updated_at 버전 확인 기반 채팅별 점수 설정 캐시
+"""
+import time
+from dataclasses import replace
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from config import settings
+from src.core.entities.score_config import ScoreConfig
+
+
+class ScoreConfigCache:
+    """프로세스 전역 점수 설정 캐시 (채팅별)
+
+    채팅마다 실제로 적용되는 설정(채팅 전용 설정 또는 전체 기본 설정)을 저장한다.
+    check_interval 동안은 캐시된 설정을 그대로 사용하고, 이후에는 저장소가
+    (id, updated_at) 버전만 조회해 바뀐 경우에만 전체 설정을 다시 읽는다.
+    """
+
+    def __init__(self, check_interval: float):
+        """
+        Args:
+            check_interval: 버전 재확인 주기 (초)
+        """
+        self.check_interval = check_interval
+        self._entries: Dict[int, Tuple[ScoreConfig, float]] = {}
+
+    def version(self, chat_id: int) -> Optional[Tuple[int, Optional[datetime]]]:
+        """캐시된 설정의 버전 (id, updated_at)"""
+        entry = self._entries.get(chat_id)
+        return (entry[0].id, entry[0].updated_at) if entry else None
+
+    def get(self, chat_id: int) -> Optional[ScoreConfig]:
+        """버전 확인 없이 사용할 수 있는 설정 조회 (재확인 시점이면 None)"""
+        entry = self._entries.get(chat_id)
+        if entry is None:
+            return None
+        config, checked_at = entry
+        if time.monotonic() - checked_at >= self.check_interval:
+            return None
+        return replace(config)
+
+    def get_stale(self, chat_id: int) -> Optional[ScoreConfig]:
+        """재확인 시점과 무관하게 캐시된 설정 조회"""
+        entry = self._entries.get(chat_id)
+        return replace(entry[0]) if entry else None
+
+    def put(self, chat_id: int, config: ScoreConfig) -> None:
+        """설정 저장 및 확인 시각 갱신"""
+        self._entries[chat_id] = (replace(config), time.monotonic())
+
+    def mark_checked(self, chat_id: int) -> None:
+        """버전이 그대로임을 확인한 시각 갱신"""
+        entry = self._entries.get(chat_id)
+        if entry:
+            self._entries[chat_id] = (entry[0], time.monotonic())
+
+    def invalidate(self, chat_id: Optional[int] = None) -> None:
+        """캐시 제거 (chat_id가 없으면 전체, 다음 조회 시 전체 로드)"""
+        if chat_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(chat_id, None)
+
+
+# Global score config cache instance
+score_config_cache = ScoreConfigCache(check_interval=settings.score_config_check_interval)
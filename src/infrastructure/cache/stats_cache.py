@@ -0,0 +1,71 @@
+"""
+Stats cache - 기간 통계 결과 캐시
+"""
+from datetime import date
+from typing import Any, Optional
+
+from config import settings
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.metrics import metrics
+
+
+class StatsCache:
+    """(채팅, 기간 종류, 기간 시작일) → 통계 결과 캐시
+
+    끝난 기간의 통계는 더 바뀌지 않으므로 만료 없이 두고(LRU로만 밀려남),
+    진행 중인 기간(오늘/이번 달)은 open_ttl 동안만 유지한다. 진행 중인 기간은
+    저장할 때의 채팅 데이터 버전과 조회 버전이 같을 때만 적중한다.
+    """
+
+    def __init__(self, maxsize: int, open_ttl: float):
+        """
+        Args:
+            maxsize: 최대 캐시 항목 수
+            open_ttl: 진행 중인 기간 통계 유지 시간 (초)
+        """
+        self.open_ttl = open_ttl
+        self._cache: LRUCache[tuple, Any] = LRUCache(maxsize=maxsize)
+
+    def get(
+        self, chat_id: int, period: str, start: date, version: Optional[int] = None
+    ) -> Optional[Any]:
+        """캐시된 통계 조회
+
+        Args:
+            version: 채팅 데이터 버전 (진행 중인 기간은 저장 시 버전과 달라지면 미적중)
+        """
+        entry = self._cache.get((chat_id, period, start))
+        stats = None
+        if entry is not None:
+            closed, stored_version, cached = entry
+            if closed or stored_version == version:
+                stats = cached
+        metrics.increment("stats_cache_hit" if stats is not None else "stats_cache_miss")
+        return stats
+
+    def put(
+        self,
+        chat_id: int,
+        period: str,
+        start: date,
+        stats: Any,
+        closed: bool,
+        version: Optional[int] = None,
+    ) -> None:
+        """통계 저장 (closed면 만료 없음, 아니면 계산에 사용한 데이터 버전과 함께)"""
+        self._cache.set(
+            (chat_id, period, start),
+            (closed, version, stats),
+            ttl=None if closed else self.open_ttl,
+        )
+
+    def clear(self) -> None:
+        """전체 캐시 제거"""
+        self._cache.clear()
+
+
+# Global stats cache instance
+stats_cache = StatsCache(
+    maxsize=settings.stats_cache_size,
+    open_ttl=settings.stats_open_period_ttl,
+)
@@ -0,0 +1,66 @@
+"""
+User registry cache - (chat_id, telegram_id) 기반 사용자 캐시 (미등록 사용자 네거티브 캐싱 포함)
+"""
+from dataclasses import replace
+from typing import Optional, Tuple
+
+from config import settings
+from src.core.entities.user import User
+from src.infrastructure.cache.lru import LRUCache
+
+_UNREGISTERED = object()
+
+
+class UserCache:
+    """사용자 레지스트리 캐시
+
+    등록된 사용자는 User 엔티티 사본을, 미등록 사용자는 "미등록" 마커를 저장한다.
+    엔티티는 저장/조회 시 모두 복사하므로 호출자가 수정해도 캐시가 오염되지 않는다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, negative_ttl: float):
+        """
+        Args:
+            maxsize: 최대 캐시 항목 수
+            ttl: 등록 사용자 캐시 유지 시간 (초)
+            negative_ttl: 미등록 마커 유지 시간 (초)
+        """
+        self.negative_ttl = negative_ttl
+        self._cache: LRUCache[Tuple[int, int], object] = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def lookup(self, chat_id: int, telegram_id: int) -> Tuple[bool, Optional[User]]:
+        """캐시 조회
+
+        Returns:
+            Tuple[bool, Optional[User]]: (캐시 적중 여부, 사용자 또는 미등록이면 None)
+        """
+        cached = self._cache.get((chat_id, telegram_id))
+        if cached is None:
+            return False, None
+        if cached is _UNREGISTERED:
+            return True, None
+        return True, replace(cached)
+
+    def put(self, user: User) -> None:
+        """등록 사용자 저장 (미등록 마커 덮어쓰기)"""
+        self._cache.set((user.chat_id, user.telegram_id), replace(user))
+
+    def mark_unregistered(self, chat_id: int, telegram_id: int) -> None:
+        """미등록 사용자 마커 저장"""
+        self._cache.set((chat_id, telegram_id), _UNREGISTERED, ttl=self.negative_ttl)
+
+    def invalidate(self, chat_id: int, telegram_id: int) -> None:
+        """캐시 항목 제거"""
+        self._cache.pop((chat_id, telegram_id))
+
+    def clear(self) -> None:
+        """전체 캐시 제거"""
+        self._cache.clear()
+
+
+# Global user cache instance
+user_cache = UserCache(
+    maxsize=settings.user_cache_size,
+    ttl=settings.user_cache_ttl,
+    negative_ttl=settings.user_cache_negative_ttl,
+)
@@ -0,0 +1,52 @@
+"""
+Database dialect capability helpers
+"""
+from typing import Any, Type, TypeVar
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import Base
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+
+def supports_insert_returning(session: AsyncSession) -> bool:
+    """INSERT ... RETURNING 지원 여부 (SQLite 3.35 미만은 미지원)"""
+    return session.bind.dialect.insert_returning
+
+
+def supports_update_returning(session: AsyncSession) -> bool:
+    """UPDATE ... RETURNING 지원 여부 (SQLite 3.35 미만은 미지원)"""
+    return session.bind.dialect.update_returning
+
+
+async def insert_returning(session: AsyncSession, model_cls: Type[ModelT], **values: Any) -> ModelT:
+    """단일 INSERT ... RETURNING으로 행을 생성하고 모델 반환
+
+    RETURNING을 지원하지 않으면 add + flush로 대체한다 (모든 값을 직접 지정하므로
+    PK 외에는 다시 읽을 필요가 없다).
+    """
+    if supports_insert_returning(session):
+        result = await session.execute(insert(model_cls).values(**values).returning(model_cls))
+        return result.scalar_one()
+
+    model = model_cls(**values)
+    session.add(model)
+    await session.flush()
+    return model
+
+
+def insert_on_conflict(session: AsyncSession, model_cls: Type[Base]):
+    """INSERT ... ON CONFLICT (UPSERT)를 지원하는 방언별 insert 구문
+
+    SQLite와 PostgreSQL의 insert는 on_conflict_do_update/do_nothing과
+    excluded를 같은 형태로 제공한다.
+    """
+    dialect_name = session.bind.dialect.name
+    if dialect_name == "postgresql":
+        return postgresql.insert(model_cls)
+    if dialect_name == "sqlite":
+        return sqlite.insert(model_cls)
+    raise NotImplementedError(f"INSERT ... ON CONFLICT is not supported for {dialect_name}")
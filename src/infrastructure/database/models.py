@@ -1,7 +1,7 @@
 """
 Database models using SQLAlchemy
 """
-from datetime import datetime
+from datetime import date, datetime
 from typing import List
 
 from sqlalchemy import (
@@ -9,8 +9,13 @@ from sqlalchemy import (
     Boolean,
     Date,
     Float,
+    ForeignKey,
+    Index,
     Integer,
+    JSON,
+    LargeBinary,
     String,
+    UniqueConstraint,
     func,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -26,12 +31,28 @@ class UserModel(Base):
     """사용자 테이블"""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # 채팅(그룹)별 멤버십: 같은 텔레그램 사용자도 채팅마다 별도 행
+        UniqueConstraint("chat_id", "telegram_id", name="uq_users_chat_id_telegram_id"),
+        # 채팅 + 랭킹 정렬 키 + id (키셋 페이지네이션/순위 계산이 인덱스만으로 처리되도록)
+        Index("ix_users_chat_total_score_id", "chat_id", "total_score", "id"),
+        Index("ix_users_chat_chat_count_id", "chat_id", "chat_count", "id"),
+        Index("ix_users_chat_jackpot_ranking", "chat_id", "jackpot_count", "max_jackpot", "id"),
+        Index(
+            "ix_users_chat_consecutive_ranking",
+            "chat_id",
+            "consecutive_days",
+            "total_attendance",
+            "id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    telegram_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False, index=True)
+    telegram_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     username: Mapped[str] = mapped_column(String(255), nullable=True)
-    total_score: Mapped[int] = mapped_column(Integer, default=0, index=True)
-    chat_count: Mapped[int] = mapped_column(Integer, default=0, index=True)
+    total_score: Mapped[int] = mapped_column(Integer, default=0)
+    chat_count: Mapped[int] = mapped_column(Integer, default=0)
     jackpot_count: Mapped[int] = mapped_column(Integer, default=0)
     max_jackpot: Mapped[int] = mapped_column(Integer, default=0)
     consecutive_days: Mapped[int] = mapped_column(Integer, default=0)
@@ -56,10 +77,17 @@ class AttendanceModel(Base):
     """출석 기록 테이블"""
 
     __tablename__ = "attendances"
+    __table_args__ = (
+        # 사용자당 하루 1회 출석 (사용자별 출석 기록 최신순 조회도 이 인덱스 사용)
+        UniqueConstraint("user_id", "date", name="uq_attendances_user_id_date"),
+        # 채팅별 출석 통계
+        Index("ix_attendances_chat_id_date", "chat_id", "date"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
-    date: Mapped[datetime.date] = mapped_column(Date, nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     score: Mapped[int] = mapped_column(Integer, nullable=False)
     consecutive_days: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime] = mapped_column(default=func.now())
@@ -75,12 +103,21 @@ class ChatActivityModel(Base):
     """채팅 활동 테이블"""
 
     __tablename__ = "chat_activities"
+    __table_args__ = (
+        # 사용자별 채팅 기록 (최신순)
+        Index("ix_chat_activities_user_id_created_at", "user_id", "created_at"),
+        # 사용자별 잭팟 기록 (점수순)
+        Index("ix_chat_activities_user_jackpots", "user_id", "is_jackpot", "final_score"),
+        # 채팅별 활동 통계
+        Index("ix_chat_activities_chat_id_created_at", "chat_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     message_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     base_score: Mapped[int] = mapped_column(Integer, nullable=False)
-    is_jackpot: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    is_jackpot: Mapped[bool] = mapped_column(Boolean, default=False)
     multiplier: Mapped[int] = mapped_column(Integer, default=1)
     final_score: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime] = mapped_column(default=func.now(), index=True)
@@ -95,12 +132,96 @@ class ChatActivityModel(Base):
         )
 
 
+class DailyUserStatsModel(Base):
+    """채팅 사용자별 일일 통계 롤업 테이블 (활동/출석 기록 시 갱신)"""
+
+    __tablename__ = "daily_user_stats"
+
+    chat_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    message_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    chat_score: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    jackpot_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    check_in_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    attendance_score: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<DailyUserStats(chat_id={self.chat_id}, date={self.date}, "
+            f"user_id={self.user_id}, messages={self.message_count})>"
+        )
+
+
+class DailyChatStatsModel(Base):
+    """채팅별 일일 통계 롤업 테이블 (활동/출석 기록 시 갱신)"""
+
+    __tablename__ = "daily_chat_stats"
+
+    chat_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    message_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    chat_score: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    jackpot_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    check_in_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    attendance_score: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # 그날 채팅한 사용자 수 (daily_user_stats.message_count가 0에서 늘어날 때 증가)
+    active_users: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # 그날 채팅한 사용자의 HyperLogLog 스케치 (기간 고유 사용자 수 추정용, 명시적으로만 조회)
+    user_sketch: Mapped[bytes] = mapped_column(LargeBinary, nullable=True, deferred=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<DailyChatStats(chat_id={self.chat_id}, date={self.date}, "
+            f"messages={self.message_count})>"
+        )
+
+
+class HourlyChatStatsModel(Base):
+    """채팅별 시간대 활동 롤업 테이블 (채팅 활동 기록 시 갱신)"""
+
+    __tablename__ = "hourly_chat_stats"
+
+    chat_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    # 정시 시각 (설정 시간대 기준), 버킷은 [bucket, bucket + 1시간)
+    bucket: Mapped[datetime] = mapped_column(primary_key=True)
+    message_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    chat_score: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    jackpot_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<HourlyChatStats(chat_id={self.chat_id}, bucket={self.bucket}, "
+            f"messages={self.message_count})>"
+        )
+
+
+class StatsSnapshotModel(Base):
+    """끝난 기간의 통계 결과 스냅샷 테이블 (기간이 끝나면 바뀌지 않으므로 영구 보관)"""
+
+    __tablename__ = "stats_snapshots"
+
+    chat_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    period: Mapped[str] = mapped_column(String(16), primary_key=True)  # day / month
+    period_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=func.now())
+
+    def __repr__(self) -> str:
+        return (
+            f"<StatsSnapshot(chat_id={self.chat_id}, period={self.period}, "
+            f"start={self.period_start})>"
+        )
+
+
 class ScoreConfigModel(Base):
     """점수 설정 테이블"""
 
     __tablename__ = "score_configs"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # NULL이면 전체 기본 설정(id=1), 값이 있으면 해당 채팅 전용 설정
+    chat_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=True)
     attendance_score: Mapped[int] = mapped_column(Integer, default=10)
     chat_score_min: Mapped[int] = mapped_column(Integer, default=1)
     chat_score_max: Mapped[int] = mapped_column(Integer, default=6)
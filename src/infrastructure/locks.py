@@ -0,0 +1,61 @@
+"""
+Keyed async locks - 키(사용자) 단위 직렬화를 위한 샤딩 락 관리자
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Hashable, List
+
+
+class _LockEntry:
+    """락과 참조 수 (대기자 포함)"""
+
+    __slots__ = ("lock", "refs")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.refs = 0
+
+
+class KeyedLockManager:
+    """키 단위 비동기 락 관리자
+
+    같은 키의 작업은 순서대로 직렬화하고 다른 키는 병렬로 실행한다. 키는 해시로
+    샤드에 나뉘어 저장되고, 보유자와 대기자가 모두 없어지면 항목이 바로 제거되어
+    사용자 수만큼 락이 쌓이지 않는다.
+    """
+
+    def __init__(self, shards: int = 64):
+        """
+        Args:
+            shards: 샤드 수
+        """
+        self._shards: List[Dict[Hashable, _LockEntry]] = [{} for _ in range(shards)]
+
+    def __len__(self) -> int:
+        """현재 사용 중인 락 수"""
+        return sum(len(shard) for shard in self._shards)
+
+    @asynccontextmanager
+    async def acquire(self, key: Hashable) -> AsyncIterator[None]:
+        """키 락 획득
+
+        Args:
+            key: 직렬화 단위 키 (예: telegram_id)
+        """
+        shard = self._shards[hash(key) % len(self._shards)]
+        entry = shard.get(key)
+        if entry is None:
+            entry = shard[key] = _LockEntry()
+
+        entry.refs += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.refs -= 1
+            if entry.refs == 0:
+                del shard[key]
+
+
+# Global per-user lock manager
+user_locks = KeyedLockManager()
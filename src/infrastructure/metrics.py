@@ -0,0 +1,35 @@
+"""
+In-process metrics registry (counters and gauges)
+"""
+from collections import defaultdict
+from typing import DefaultDict, Dict
+
+
+class Metrics:
+    """프로세스 내 카운터/게이지 저장소"""
+
+    def __init__(self):
+        self._counters: DefaultDict[str, int] = defaultdict(int)
+        self._gauges: Dict[str, float] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """카운터 증가"""
+        self._counters[name] += value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """게이지 값 설정"""
+        self._gauges[name] = value
+
+    def get(self, name: str) -> float:
+        """카운터 또는 게이지 현재 값"""
+        if name in self._gauges:
+            return self._gauges[name]
+        return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        """전체 지표 스냅샷"""
+        return {**self._counters, **self._gauges}
+
+
+# Global metrics instance
+metrics = Metrics()
@@ -0,0 +1,77 @@
+"""
+Webhook server - aiohttp 기반 웹훅 업데이트 수신
+"""
+import asyncio
+import logging
+import signal
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+
+from config import settings
+from src.infrastructure.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+async def healthz(request: web.Request) -> web.Response:
+    """헬스 체크 및 지표 조회"""
+    return web.json_response({"status": "ok", "metrics": metrics.snapshot()})
+
+
+async def run_webhook(dp: Dispatcher, bot: Bot) -> None:
+    """웹훅 서버 실행 (종료 신호를 받을 때까지 대기)
+
+    Args:
+        dp: aiogram 디스패처
+        bot: 봇 인스턴스
+    """
+    if not settings.webhook_base_url:
+        raise ValueError("WEBHOOK_BASE_URL is required in webhook mode")
+    if not settings.webhook_secret:
+        # 비밀 토큰이 없으면 누구나 위조한 업데이트를 보낼 수 있다
+        raise ValueError("WEBHOOK_SECRET is required in webhook mode")
+
+    app = web.Application()
+    # 동시 처리 제한과 백프레셔는 디스패처의 UpdateSchedulerMiddleware가 담당한다.
+    # 슬롯이 없으면 feed_update가 기다리므로 HTTP 응답도 늦춰진다.
+    SimpleRequestHandler(
+        dp,
+        bot,
+        handle_in_background=False,
+        secret_token=settings.webhook_secret,
+    ).register(app, path=settings.webhook_path)
+    app.router.add_get("/healthz", healthz)
+    setup_application(app, dp, bot=bot)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, settings.webhook_host, settings.webhook_port)
+    await site.start()
+
+    # 여러 레플리카가 같은 URL을 등록해도 무방하므로 종료 시 웹훅은 삭제하지 않는다
+    await bot.set_webhook(
+        url=settings.webhook_base_url.rstrip("/") + settings.webhook_path,
+        secret_token=settings.webhook_secret,
+        allowed_updates=dp.resolve_used_update_types(),
+    )
+    logger.info(
+        "Webhook server listening on %s:%s%s",
+        settings.webhook_host,
+        settings.webhook_port,
+        settings.webhook_path,
+    )
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    try:
+        await stop.wait()
+    finally:
+        await runner.cleanup()
@@ -0,0 +1,170 @@
+"""
+Scheduling Middleware - 동시 처리 제한, 사용자별 순서 보장, 백프레셔
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from src.infrastructure.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]]
+
+BUSY_REPLY = "⏳ 처리할 요청이 밀려 있어요. 잠시 후 다시 시도해주세요!"
+
+
+class UpdateSchedulerMiddleware(BaseMiddleware):
+    """업데이트 처리 스케줄러 (update outer middleware, 가장 바깥에 등록)
+
+    - 동시에 처리하는 업데이트는 최대 max_in_flight 개로 제한한다.
+    - 슬롯이 없으면 업데이트 수신 경로(폴링 루프 / 웹훅 응답)를 그 자리에서 기다리게
+      해서 Telegram에서 가져오는 속도를 늦춘다 (폴링은 handle_as_tasks=False 필요).
+    - 같은 사용자의 업데이트는 도착 순서대로 하나씩 처리하고, 다른 사용자는 병렬 처리한다.
+      앞선 업데이트를 기다리는 동안에는 슬롯을 잡지 않으므로 한 사용자가 슬롯을
+      독차지하지 못한다.
+    - 사용자별 대기 업데이트는 max_queued_per_user 개까지만 두고, 넘치는 업데이트는 버린다.
+      버린 업데이트가 명령어면 사용자에게 잠시 후 다시 시도하라고 답한다 (대기열이 빌
+      때까지 사용자당 1회).
+    """
+
+    def __init__(self, max_in_flight: int, max_queued_per_user: int = 20):
+        """
+        Args:
+            max_in_flight: 동시에 처리할 수 있는 최대 업데이트 수
+            max_queued_per_user: 사용자별로 앞선 업데이트를 기다릴 수 있는 최대 업데이트 수
+        """
+        self.max_in_flight = max_in_flight
+        self.max_queued_per_user = max_queued_per_user
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._tails: Dict[Hashable, asyncio.Task] = {}
+        self._waiting: Dict[Hashable, int] = {}
+        self._notified: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._queued = 0
+
+    @property
+    def in_flight(self) -> int:
+        """처리 중이거나 대기 중인 업데이트 수"""
+        return len(self._tasks)
+
+    async def __call__(
+        self, handler: Handler, event: TelegramObject, data: Dict[str, Any]
+    ) -> Any:
+        key = self._ordering_key(data)
+        holds_slot = False
+        if self._predecessor(key) is None:
+            # 슬롯이 빌 때까지 수신 경로를 멈춘다 (백프레셔)
+            await self._slots.acquire()
+            holds_slot = True
+
+        # 슬롯을 기다리는 사이 같은 사용자의 업데이트가 먼저 등록됐을 수 있다
+        previous = self._predecessor(key)
+        if previous is not None:
+            if holds_slot:
+                self._slots.release()
+                holds_slot = False
+            if self._waiting.get(key, 0) >= self.max_queued_per_user:
+                metrics.increment("updates_dropped")
+                logger.warning(
+                    "Dropping update %s: %d updates from %s already queued",
+                    getattr(event, "update_id", None),
+                    self._waiting[key],
+                    key,
+                )
+                self._notify_dropped(key, event)
+                return None
+            self._waiting[key] = self._waiting.get(key, 0) + 1
+
+        task = asyncio.create_task(self._run(handler, event, data, key, previous, holds_slot))
+        self._tasks.add(task)
+        if key is not None:
+            self._tails[key] = task
+        task.add_done_callback(lambda done: self._on_done(done, key))
+
+        metrics.increment("updates_scheduled")
+        metrics.set_gauge("updates_in_flight", self.in_flight)
+        return None
+
+    async def drain(self) -> None:
+        """처리 중인 업데이트가 모두 끝날 때까지 대기"""
+        while self._tasks:
+            await asyncio.wait(set(self._tasks))
+
+    async def _run(
+        self,
+        handler: Handler,
+        event: TelegramObject,
+        data: Dict[str, Any],
+        key: Optional[Hashable],
+        previous: Optional[asyncio.Task],
+        holds_slot: bool,
+    ) -> None:
+        if previous is not None:
+            # 같은 사용자의 앞선 업데이트가 끝난 뒤에 슬롯을 잡고 처리
+            self._set_queued(1)
+            try:
+                await asyncio.wait({previous})
+            finally:
+                self._set_queued(-1)
+                self._release_waiting(key)
+
+        if not holds_slot:
+            await self._slots.acquire()
+        try:
+            await handler(event, data)
+        except Exception:
+            metrics.increment("updates_errored")
+            logger.exception("Error while handling update %s", getattr(event, "update_id", None))
+        finally:
+            self._slots.release()
+
+    def _notify_dropped(self, key: Hashable, event: TelegramObject) -> None:
+        """버린 업데이트가 명령어면 다시 시도 안내 (수신 경로를 막지 않게 별도 태스크)"""
+        message = getattr(event, "message", None)
+        text = getattr(message, "text", None)
+        if not text or not text.startswith("/") or key in self._notified:
+            return
+
+        self._notified.add(key)
+        task = asyncio.create_task(self._reply_busy(message))
+        self._tasks.add(task)
+        task.add_done_callback(lambda done: self._on_done(done, None))
+
+    @staticmethod
+    async def _reply_busy(message: Any) -> None:
+        try:
+            await message.reply(BUSY_REPLY)
+        except Exception:
+            logger.exception("Failed to tell user about dropped update")
+
+    def _predecessor(self, key: Optional[Hashable]) -> Optional[asyncio.Task]:
+        """같은 사용자의 아직 끝나지 않은 마지막 업데이트"""
+        tail = self._tails.get(key) if key is not None else None
+        return tail if tail is not None and not tail.done() else None
+
+    def _on_done(self, task: asyncio.Task, key: Optional[Hashable]) -> None:
+        self._tasks.discard(task)
+        if key is not None and self._tails.get(key) is task:
+            del self._tails[key]
+        metrics.set_gauge("updates_in_flight", self.in_flight)
+
+    def _release_waiting(self, key: Hashable) -> None:
+        remaining = self._waiting.pop(key) - 1
+        if remaining:
+            self._waiting[key] = remaining
+        else:
+            self._notified.discard(key)
+
+    def _set_queued(self, delta: int) -> None:
+        self._queued += delta
+        metrics.set_gauge("updates_queued", self._queued)
+
+    @staticmethod
+    def _ordering_key(data: Dict[str, Any]) -> Optional[Hashable]:
+        """순서를 보장할 단위 (보낸 사용자)"""
+        from_user = data.get("event_from_user")
+        return from_user.id if from_user else None
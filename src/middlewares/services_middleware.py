@@ -0,0 +1,87 @@
+"""
+Services Middleware - 업데이트 단위 지연 의존성 주입 및 작업 단위 관리
+"""
+import logging
+from contextlib import nullcontext
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict, Optional
+
+from aiogram import BaseMiddleware
+from aiogram.types import Chat, TelegramObject, User
+
+from src.container import ServiceContainer
+from src.infrastructure.locks import KeyedLockManager
+from src.infrastructure.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]]
+
+
+class ContainerMiddleware(BaseMiddleware):
+    """업데이트마다 지연 컨테이너를 만들고 처리 후 정리 (update outer middleware)
+
+    컨테이너 생성 자체는 DB 작업이 없으므로 매칭되지 않는 업데이트는 비용이 거의 없다.
+    핸들러가 세션을 열었다면 핸들러 종료 후 한 번 커밋하고, 실패하면 롤백한다.
+
+    채팅 멤버(채팅, 보낸 사용자) 락은 커밋과 캐시/리더보드 반영이 끝날 때까지 보유하므로
+    같은 사용자의 다음 업데이트는 항상 앞선 업데이트의 결과를 읽는다.
+    """
+
+    def __init__(
+        self,
+        container_factory: Callable[[], ServiceContainer],
+        user_locks: Optional[KeyedLockManager] = None,
+    ):
+        """
+        Args:
+            container_factory: 업데이트별 컨테이너 생성 함수
+            user_locks: 채팅 멤버 단위 락 관리자 (None이면 락 없음)
+        """
+        self.container_factory = container_factory
+        self.user_locks = user_locks
+
+    async def __call__(
+        self, handler: Handler, event: TelegramObject, data: Dict[str, Any]
+    ) -> Any:
+        from_user = data.get("event_from_user")
+        chat = data.get("event_chat")
+        container = self.container_factory()
+        data["container"] = container
+        async with self._user_lock(from_user, chat):
+            try:
+                async with container:
+                    return await handler(event, data)
+            except Exception:
+                metrics.increment("updates_failed")
+                # 사용자 상태는 커밋 후에만 캐시/리더보드에 반영된다. 다만 쓰기 지연 모드에서는
+                # 이미 큐에 들어간 활동이 롤백과 무관하게 저장되므로 캐시 항목을 비워 다시 읽게 한다
+                if from_user and chat and container.user_cache:
+                    container.user_cache.invalidate(chat.id, from_user.id)
+                logger.warning(
+                    "Update %s failed, transaction rolled back", getattr(event, "update_id", None)
+                )
+                raise
+
+    def _user_lock(
+        self, from_user: Optional[User], chat: Optional[Chat]
+    ) -> AsyncContextManager[None]:
+        """채팅 멤버 단위 락 (락 관리자나 사용자/채팅이 없으면 no-op)"""
+        if self.user_locks is None or not from_user or not chat:
+            return nullcontext()
+        return self.user_locks.acquire((chat.id, from_user.id))
+
+
+class DependencyMiddleware(BaseMiddleware):
+    """필터를 통과한 핸들러가 요청한 서비스만 주입 (event inner middleware)"""
+
+    async def __call__(
+        self, handler: Handler, event: TelegramObject, data: Dict[str, Any]
+    ) -> Any:
+        container: ServiceContainer = data["container"]
+        handler_object = data["handler"]
+
+        for name in handler_object.params:
+            if name not in data and container.provides(name):
+                data[name] = await container.resolve(name)
+
+        return await handler(event, data)
@@ -1,13 +1,19 @@
 """
 Attendance Repository - Data access layer for Attendance entity
 """
-from datetime import date, datetime
+from datetime import date
 from typing import List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core import clock
 from src.core.entities.attendance import Attendance
+from src.infrastructure.database.dialect import (
+    insert_on_conflict,
+    insert_returning,
+    supports_insert_returning,
+)
 from src.infrastructure.database.models import AttendanceModel
 
 
@@ -42,56 +48,79 @@ class AttendanceRepository:
         return [self._to_entity(model) for model in models]
 
     async def create(
-        self, user_id: int, attendance_date: date, score: int, consecutive_days: int
+        self,
+        user_id: int,
+        chat_id: int,
+        attendance_date: date,
+        score: int,
+        consecutive_days: int,
     ) -> Attendance:
-        """출석 기록 생성"""
-        model = AttendanceModel(
+        """출석 기록 생성 (INSERT ... RETURNING 1회)"""
+        model = await insert_returning(
+            self.session,
+            AttendanceModel,
             user_id=user_id,
+            chat_id=chat_id,
             date=attendance_date,
             score=score,
             consecutive_days=consecutive_days,
-            created_at=datetime.now(),
+            created_at=clock.now(),
         )
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
         return self._to_entity(model)
 
-    async def get_total_count(self, user_id: int) -> int:
-        """사용자의 총 출석 횟수"""
-        result = await self.session.execute(
-            select(AttendanceModel).where(AttendanceModel.user_id == user_id)
-        )
-        return len(result.scalars().all())
+    async def create_if_absent(
+        self,
+        user_id: int,
+        chat_id: int,
+        attendance_date: date,
+        score: int,
+        consecutive_days: int,
+    ) -> Optional[Attendance]:
+        """그날 출석 기록이 없을 때만 생성 (INSERT ... ON CONFLICT DO NOTHING RETURNING 1회)
 
-    async def get_daily_count(self, attendance_date: date) -> int:
-        """특정 날짜의 출석 횟수"""
-        from sqlalchemy import func
+        (user_id, date) 유니크 제약으로 판정하므로 동시에 들어온 출석 요청 중
+        하나만 기록되고, 나머지는 별도 조회 없이 None을 받는다.
 
-        result = await self.session.execute(
-            select(func.count(AttendanceModel.id)).where(
-                AttendanceModel.date == attendance_date
+        Returns:
+            Optional[Attendance]: 생성된 출석 기록 (이미 출석했으면 None)
+        """
+        table = AttendanceModel.__table__
+        stmt = (
+            insert_on_conflict(self.session, AttendanceModel)
+            .values(
+                user_id=user_id,
+                chat_id=chat_id,
+                date=attendance_date,
+                score=score,
+                consecutive_days=consecutive_days,
+                created_at=clock.now(),
             )
+            .on_conflict_do_nothing(index_elements=[table.c.user_id, table.c.date])
         )
-        return result.scalar() or 0
 
-    async def get_monthly_count(self, year: int, month: int) -> int:
-        """특정 월의 총 출석 횟수"""
-        from sqlalchemy import func, extract
+        if supports_insert_returning(self.session):
+            result = await self.session.execute(stmt.returning(AttendanceModel))
+            model = result.scalar_one_or_none()
+            return self._to_entity(model) if model else None
+
+        result = await self.session.execute(stmt)
+        if result.rowcount == 0:
+            return None
+        return await self.get_by_user_and_date(user_id, attendance_date)
 
+    async def get_total_count(self, user_id: int) -> int:
+        """사용자의 총 출석 횟수"""
         result = await self.session.execute(
-            select(func.count(AttendanceModel.id)).where(
-                extract("year", AttendanceModel.date) == year,
-                extract("month", AttendanceModel.date) == month,
-            )
+            select(AttendanceModel).where(AttendanceModel.user_id == user_id)
         )
-        return result.scalar() or 0
+        return len(result.scalars().all())
 
     def _to_entity(self, model: AttendanceModel) -> Attendance:
         """모델을 엔티티로 변환"""
         return Attendance(
             id=model.id,
             user_id=model.user_id,
+            chat_id=model.chat_id,
             date=model.date,
             score=model.score,
             consecutive_days=model.consecutive_days,
@@ -0,0 +1,246 @@
+"""
+ChatActivity Writer - Write-behind batch writer for ChatActivity entity
+"""
+import asyncio
+import logging
+from typing import AsyncContextManager, Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.entities.chat_activity import ChatActivity
+from src.infrastructure.cache.leaderboard import LeaderboardRegistry
+from src.infrastructure.metrics import metrics
+from src.repositories.chat_activity_repository import ChatActivityRepository
+from src.repositories.daily_stats_repository import DailyStatsRepository
+from src.repositories.user_repository import UserCounterDelta, UserRepository
+
+logger = logging.getLogger(__name__)
+
+# 재시도 한도를 넘긴 활동 기록 (운영 시 별도 핸들러로 보관해 수동 복구)
+dead_letter_logger = logging.getLogger(f"{__name__}.dead_letter")
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+class ChatActivityWriter:
+    """채팅 활동 쓰기 지연(write-behind) 저장기
+
+    채팅 활동을 메모리 큐에 모아두고, flush 주기 또는 배치 크기에 도달하면
+    한 트랜잭션에서 multi-row INSERT + 사용자별 카운터 UPDATE + 일별 롤업
+    UPSERT로 일괄 저장한다.
+
+    - 배치는 저장에 성공한 뒤에만 큐에서 빠지므로 flush 도중 취소되어도 유실되지 않는다.
+    - 실패한 배치는 지수 백오프로 max_retries번까지 재시도하고, 그래도 실패하면
+      dead letter 로그로 남기고 버린다.
+    - 큐(저장 중인 배치 포함)는 max_pending 건을 넘지 않고, 가득 차면 submit이 기다린다.
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        flush_interval_ms: int = 200,
+        batch_size: int = 500,
+        max_pending: Optional[int] = None,
+        max_retries: int = 5,
+        max_backoff: float = 30.0,
+        leaderboards: Optional[LeaderboardRegistry] = None,
+    ):
+        """
+        Args:
+            session_factory: 트랜잭션 세션 컨텍스트 매니저 팩토리
+            flush_interval_ms: flush 주기 (밀리초)
+            batch_size: flush를 즉시 트리거하는 대기 건수 (한 번에 저장하는 최대 건수)
+            max_pending: 대기 건수 상한 (가득 차면 submit이 자리가 날 때까지 기다림)
+            max_retries: 배치 하나를 버리기 전까지의 최대 저장 시도 횟수
+            max_backoff: 재시도 간격 상한 (초)
+            leaderboards: 저장 후 채팅 데이터 버전을 갱신할 메모리 리더보드
+        """
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval_ms / 1000
+        self.batch_size = batch_size
+        self.max_pending = max(max_pending or batch_size * 10, batch_size)
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self.leaderboards = leaderboards
+
+        self._pending: List[ChatActivity] = []
+        self._attempts = 0
+        self._retry_size = 0
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending_count(self) -> int:
+        """저장 대기 중인 채팅 활동 수"""
+        return len(self._pending)
+
+    def pending_delta(self, user_id: int) -> Optional[UserCounterDelta]:
+        """아직 DB에 반영되지 않은(저장 중인 배치 포함) 사용자 활동의 카운터 증분
+
+        Returns:
+            Optional[UserCounterDelta]: 대기 중인 활동이 없으면 None
+        """
+        batch = [activity for activity in self._pending if activity.user_id == user_id]
+        return self._aggregate(batch).get(user_id)
+
+    def start(self) -> None:
+        """백그라운드 flush 루프 시작"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="chat-activity-writer")
+
+    async def stop(self) -> None:
+        """flush 루프 종료 및 남은 활동 저장
+
+        진행 중인 flush는 취소하지 않고 끝날 때까지 기다린 뒤, 남은 활동을
+        재시도 한도 안에서 모두 저장한다.
+        """
+        if self._task is not None:
+            self._stopping.set()
+            self._wakeup.set()
+            await self._task
+            self._task = None
+
+        while self._pending:
+            await self.flush()
+            if self._attempts:
+                await asyncio.sleep(self._backoff())
+
+    async def submit(self, activity: ChatActivity) -> None:
+        """채팅 활동을 저장 큐에 추가
+
+        Args:
+            activity: 저장할 채팅 활동
+        """
+        while len(self._pending) >= self.max_pending:
+            # DB가 따라오지 못하면 자리가 날 때까지 호출자를 기다리게 해 큐가 무한히 커지지 않게 한다
+            self._space.clear()
+            self._wakeup.set()
+            await self._space.wait()
+
+        self._pending.append(activity)
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """대기 중인 채팅 활동 일괄 저장 (배치 하나가 실패하면 중단)
+
+        Returns:
+            int: 저장된 채팅 활동 수
+        """
+        async with self._flush_lock:
+            written = 0
+            while self._pending:
+                flushed = await self._flush_batch()
+                if not flushed:
+                    break
+                written += flushed
+            return written
+
+    async def _flush_batch(self) -> int:
+        """큐 앞쪽 배치 하나 저장
+
+        배치는 저장에 성공한 뒤에야 큐에서 제거한다. 실패하면 같은 배치를 큐 앞에
+        그대로 두어 다음 시도에서 순서대로 다시 저장한다.
+
+        Returns:
+            int: 저장된 채팅 활동 수 (실패 시 0)
+        """
+        batch = self._pending[: self._retry_size or self.batch_size]
+        try:
+            async with self.session_factory() as session:
+                await ChatActivityRepository(session).create_many(batch)
+                await DailyStatsRepository(session).record_activities(batch)
+                await UserRepository(session).apply_counter_deltas(
+                    self._aggregate(batch).values()
+                )
+        except Exception:
+            self._attempts += 1
+            if self._attempts < self.max_retries:
+                self._retry_size = len(batch)
+                logger.exception(
+                    "Failed to flush %d chat activities (attempt %d/%d)",
+                    len(batch),
+                    self._attempts,
+                    self.max_retries,
+                )
+                return 0
+
+            logger.exception(
+                "Giving up on %d chat activities after %d attempts", len(batch), self._attempts
+            )
+            self._dead_letter(batch)
+            self._release(batch)
+            return 0
+
+        self._release(batch)
+        if self.leaderboards is not None:
+            # 롤업이 DB에 반영됐으므로 제출 시점 버전으로 캐시된 통계 응답을 무효화
+            for chat_id in {activity.chat_id for activity in batch}:
+                self.leaderboards.touch(chat_id)
+        logger.debug("Flushed %d chat activities", len(batch))
+        return len(batch)
+
+    def _release(self, batch: List[ChatActivity]) -> None:
+        """처리가 끝난 배치를 큐에서 제거하고 재시도 상태 초기화"""
+        del self._pending[: len(batch)]
+        self._attempts = 0
+        self._retry_size = 0
+        if len(self._pending) < self.max_pending:
+            self._space.set()
+
+    def _backoff(self) -> float:
+        """현재 실패 횟수의 재시도 대기 시간 (초)"""
+        return float(min(self.flush_interval * 2 ** self._attempts, self.max_backoff))
+
+    async def _run(self) -> None:
+        """flush 주기 또는 배치 크기 도달 시 flush (종료 요청 시 진행 중인 flush 후 반환)"""
+        while not self._stopping.is_set():
+            if self._attempts:
+                # 실패한 배치는 백오프 후 재시도 (submit의 깨우기는 무시하고 종료 요청만 반영)
+                await self._wait(self._stopping, self._backoff())
+            else:
+                await self._wait(self._wakeup, self.flush_interval)
+            self._wakeup.clear()
+            if not self._stopping.is_set():
+                await self.flush()
+
+    @staticmethod
+    async def _wait(event: asyncio.Event, timeout: float) -> None:
+        """event가 설정되거나 timeout이 지날 때까지 대기"""
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    @staticmethod
+    def _dead_letter(batch: List[ChatActivity]) -> None:
+        """저장하지 못한 활동을 복구용으로 한 줄씩 기록"""
+        metrics.increment("chat_activities_dead_lettered", len(batch))
+        for activity in batch:
+            dead_letter_logger.error(
+                "chat_activity user_id=%s chat_id=%s message_id=%s base_score=%s "
+                "final_score=%s multiplier=%s is_jackpot=%s created_at=%s",
+                activity.user_id,
+                activity.chat_id,
+                activity.message_id,
+                activity.base_score,
+                activity.final_score,
+                activity.multiplier,
+                activity.is_jackpot,
+                activity.created_at.isoformat(),
+            )
+
+    @staticmethod
+    def _aggregate(batch: List[ChatActivity]) -> Dict[int, UserCounterDelta]:
+        """배치를 사용자별 카운터 증분으로 집계"""
+        deltas: Dict[int, UserCounterDelta] = {}
+        for activity in batch:
+            delta = deltas.get(activity.user_id)
+            if delta is None:
+                delta = deltas[activity.user_id] = UserCounterDelta(user_id=activity.user_id)
+            delta.add_activity(activity)
+        return deltas
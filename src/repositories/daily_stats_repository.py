@@ -0,0 +1,422 @@
+"""
+DailyStats Repository - Data access layer for daily stats rollups
+"""
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from src.core.entities.chat_activity import ChatActivity
+from src.core.entities.stats import ActivityBucket, DailyRollup, Granularity, UserStats
+from src.infrastructure.database.dialect import insert_on_conflict, supports_insert_returning
+from src.infrastructure.hyperloglog import HyperLogLog
+from src.infrastructure.database.models import (
+    DailyChatStatsModel,
+    DailyUserStatsModel,
+    HourlyChatStatsModel,
+    UserModel,
+)
+
+# 사용자 행과 채팅 행에 같은 이름으로 더해지는 카운터 컬럼
+COUNTER_COLUMNS = (
+    "message_count",
+    "chat_score",
+    "jackpot_count",
+    "check_in_count",
+    "attendance_score",
+)
+
+# 시간대 행에 더해지는 카운터 컬럼 (채팅 활동만 집계)
+HOURLY_COLUMNS = ("message_count", "chat_score", "jackpot_count")
+
+UserDayKey = Tuple[int, date, int]  # (chat_id, date, user_id)
+ChatDayKey = Tuple[int, date]  # (chat_id, date)
+ChatHourKey = Tuple[int, datetime]  # (chat_id, bucket)
+
+
+class DailyStatsRepository:
+    """일일 통계 롤업 저장소
+
+    채팅 활동/출석을 기록할 때 daily_user_stats(채팅, 날짜, 사용자)와
+    daily_chat_stats(채팅, 날짜)에 증분을 UPSERT해 두어, 일일/월별 통계는
+    원본 테이블을 집계하지 않고 롤업 1행/최대 31행으로 조회한다.
+    채팅 활동은 hourly_chat_stats(채팅, 정시)에도 쌓아 임의 구간/단위의
+    활동 시계열을 시간 버킷 병합으로 계산한다. 채팅 일별 행에는 그날 채팅한
+    사용자의 HyperLogLog 스케치를 두어 긴 기간의 고유 사용자 수를 병합으로 추정한다.
+
+    채팅 행과 시간대 행은 같은 채팅의 모든 쓰기가 갱신하는 행이라, 요청 중에
+    UPSERT하면 응답을 보내고 커밋할 때까지 행 락이 유지되어 쓰기가 직렬화된다.
+    defer_writes면 증분을 모아두었다가 커밋 직전 apply_deferred()로 같은 트랜잭션의
+    마지막 쓰기로 반영한다.
+    """
+
+    def __init__(self, session: AsyncSession, defer_writes: bool = False):
+        """
+        Args:
+            session: 데이터베이스 세션
+            defer_writes: 롤업 증분을 apply_deferred() 호출까지 미룰지 여부
+        """
+        self.session = session
+        self.defer_writes = defer_writes
+        self._deferred_activities: List[ChatActivity] = []
+        self._deferred_check_ins: List[Tuple[int, int, date, int]] = []
+
+    @property
+    def has_deferred(self) -> bool:
+        """반영을 기다리는 롤업 증분이 있는지"""
+        return bool(self._deferred_activities or self._deferred_check_ins)
+
+    async def apply_deferred(self) -> None:
+        """모아둔 롤업 증분을 현재 트랜잭션에 반영 (커밋은 호출자가 함)"""
+        activities, self._deferred_activities = self._deferred_activities, []
+        check_ins, self._deferred_check_ins = self._deferred_check_ins, []
+
+        repo = DailyStatsRepository(self.session)
+        if activities:
+            await repo.record_activities(activities)
+        for check_in in check_ins:
+            await repo.record_check_in(*check_in)
+
+    async def record_activities(self, activities: Iterable[ChatActivity]) -> None:
+        """채팅 활동을 롤업에 반영 (사용자/채팅/시간대 행 각각 multi-row UPSERT 1회)"""
+        if self.defer_writes:
+            self._deferred_activities.extend(activities)
+            return
+
+        user_rows: Dict[UserDayKey, Dict[str, int]] = {}
+        hour_rows: Dict[ChatHourKey, Dict[str, int]] = {}
+        for activity in activities:
+            hour_key = (activity.chat_id, Granularity.HOUR.floor(activity.created_at))
+            hour_row = hour_rows.get(hour_key)
+            if hour_row is None:
+                hour_row = hour_rows[hour_key] = dict.fromkeys(HOURLY_COLUMNS, 0)
+            hour_row["message_count"] += 1
+            hour_row["chat_score"] += activity.final_score
+            if activity.is_jackpot:
+                hour_row["jackpot_count"] += 1
+
+            key = (activity.chat_id, activity.created_at.date(), activity.user_id)
+            row = user_rows.get(key)
+            if row is None:
+                row = user_rows[key] = dict.fromkeys(COUNTER_COLUMNS, 0)
+            row["message_count"] += 1
+            row["chat_score"] += activity.final_score
+            if activity.is_jackpot:
+                row["jackpot_count"] += 1
+
+        if not user_rows:
+            return
+
+        newly_active = await self._upsert_user_rows(user_rows)
+
+        chat_rows: Dict[ChatDayKey, Dict[str, int]] = {}
+        for (chat_id, day, _), row in user_rows.items():
+            chat_row = chat_rows.get((chat_id, day))
+            if chat_row is None:
+                chat_row = chat_rows[(chat_id, day)] = dict.fromkeys(COUNTER_COLUMNS, 0)
+                chat_row["active_users"] = 0
+            for column in COUNTER_COLUMNS:
+                chat_row[column] += row[column]
+        for chat_id, day, _ in newly_active:
+            chat_rows[(chat_id, day)]["active_users"] += 1
+
+        await self._upsert_chat_rows(chat_rows)
+        await self._add_to_sketches(newly_active)
+        await self._upsert_hour_rows(hour_rows)
+
+    async def record_check_in(
+        self, chat_id: int, user_id: int, attendance_date: date, score: int
+    ) -> None:
+        """출석 1건을 일별 롤업에 반영"""
+        if self.defer_writes:
+            self._deferred_check_ins.append((chat_id, user_id, attendance_date, score))
+            return
+
+        row = dict.fromkeys(COUNTER_COLUMNS, 0)
+        row["check_in_count"] = 1
+        row["attendance_score"] = score
+
+        await self._upsert_user_rows({(chat_id, attendance_date, user_id): row})
+        await self._upsert_chat_rows({(chat_id, attendance_date): dict(row, active_users=0)})
+
+    async def get_chat_day(self, chat_id: int, target_date: date) -> DailyRollup:
+        """채팅의 일일 롤업 조회 (기록이 없으면 0으로 채운 롤업)"""
+        result = await self.session.execute(
+            select(DailyChatStatsModel).where(
+                DailyChatStatsModel.chat_id == chat_id,
+                DailyChatStatsModel.date == target_date,
+            )
+        )
+        model = result.scalar_one_or_none()
+        if model is None:
+            return DailyRollup(date=target_date)
+        return self._to_entity(model)
+
+    async def get_chat_days(self, chat_id: int, start: date, end: date) -> List[DailyRollup]:
+        """채팅의 [start, end) 기간 일일 롤업 조회 (기록이 있는 날만, 날짜순)"""
+        result = await self.session.execute(
+            select(DailyChatStatsModel)
+            .where(
+                DailyChatStatsModel.chat_id == chat_id,
+                DailyChatStatsModel.date >= start,
+                DailyChatStatsModel.date < end,
+            )
+            .order_by(DailyChatStatsModel.date)
+        )
+        return [self._to_entity(model) for model in result.scalars().all()]
+
+    async def count_active_users(self, chat_id: int, start: date, end: date) -> Tuple[int, bool]:
+        """채팅의 [start, end) 기간에 채팅한 사용자 수
+
+        중복 제거할 일별 사용자 행이 settings.stats_exact_distinct_rows 이하이면
+        정확히 세고, 그보다 많으면 일별 스케치를 병합해 추정한다. 스케치가 없는 날
+        (스케치 도입 전 기록)이 있으면 정확히 센다.
+
+        Returns:
+            Tuple[int, bool]: (사용자 수, 추정값 여부)
+        """
+        # 일별 활동 사용자 수의 합 = 정확히 셀 때 읽을 일별 사용자 행 수
+        result = await self.session.execute(
+            select(func.coalesce(func.sum(DailyChatStatsModel.active_users), 0)).where(
+                DailyChatStatsModel.chat_id == chat_id,
+                DailyChatStatsModel.date >= start,
+                DailyChatStatsModel.date < end,
+            )
+        )
+        if result.scalar_one() > settings.stats_exact_distinct_rows:
+            estimate = await self._estimate_active_users(chat_id, start, end)
+            if estimate is not None:
+                return estimate, True
+
+        result = await self.session.execute(
+            select(func.count(func.distinct(DailyUserStatsModel.user_id))).where(
+                DailyUserStatsModel.chat_id == chat_id,
+                DailyUserStatsModel.date >= start,
+                DailyUserStatsModel.date < end,
+                DailyUserStatsModel.message_count > 0,
+            )
+        )
+        return result.scalar_one(), False
+
+    async def get_top_users(
+        self, chat_id: int, start: date, end: date, limit: int
+    ) -> List[UserStats]:
+        """채팅의 [start, end) 기간 점수 TOP 사용자
+
+        기간 점수(채팅 + 출석)와 채팅 수는 일별 사용자 행을 합산하므로 원본 활동
+        테이블은 읽지 않는다. 동점이면 채팅 수, 먼저 가입한 사용자 순.
+        """
+        score = func.sum(
+            DailyUserStatsModel.chat_score + DailyUserStatsModel.attendance_score
+        ).label("score")
+        messages = func.sum(DailyUserStatsModel.message_count).label("messages")
+        period = (
+            select(DailyUserStatsModel.user_id, score, messages)
+            .where(
+                DailyUserStatsModel.chat_id == chat_id,
+                DailyUserStatsModel.date >= start,
+                DailyUserStatsModel.date < end,
+            )
+            .group_by(DailyUserStatsModel.user_id)
+            .order_by(score.desc(), messages.desc(), DailyUserStatsModel.user_id)
+            .limit(limit)
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(UserModel.telegram_id, UserModel.username, period.c.score, period.c.messages)
+            .join(period, UserModel.id == period.c.user_id)
+            .order_by(period.c.score.desc(), period.c.messages.desc(), period.c.user_id)
+        )
+        return [
+            UserStats(
+                telegram_id=telegram_id,
+                username=username,
+                total_score=period_score,
+                chat_count=period_messages,
+            )
+            for telegram_id, username, period_score, period_messages in result
+        ]
+
+    async def get_hour_buckets(
+        self, chat_id: int, start: datetime, end: datetime
+    ) -> List[ActivityBucket]:
+        """채팅의 [start, end) 구간 시간 버킷 조회 (기록이 있는 시간만, 시각순)"""
+        result = await self.session.execute(
+            select(HourlyChatStatsModel)
+            .where(
+                HourlyChatStatsModel.chat_id == chat_id,
+                HourlyChatStatsModel.bucket >= start,
+                HourlyChatStatsModel.bucket < end,
+            )
+            .order_by(HourlyChatStatsModel.bucket)
+        )
+        return [
+            ActivityBucket(
+                start=model.bucket,
+                message_count=model.message_count,
+                chat_score=model.chat_score,
+                jackpot_count=model.jackpot_count,
+            )
+            for model in result.scalars().all()
+        ]
+
+    async def _estimate_active_users(self, chat_id: int, start: date, end: date) -> Optional[int]:
+        """일별 스케치 병합으로 사용자 수 추정 (스케치가 빠진 날이 있으면 None)"""
+        result = await self.session.execute(
+            select(DailyChatStatsModel.user_sketch).where(
+                DailyChatStatsModel.chat_id == chat_id,
+                DailyChatStatsModel.date >= start,
+                DailyChatStatsModel.date < end,
+                DailyChatStatsModel.active_users > 0,
+            )
+        )
+        merged = HyperLogLog()
+        for registers in result.scalars():
+            if registers is None:
+                return None
+            merged.merge(HyperLogLog(registers))
+        return merged.count()
+
+    async def _upsert_user_rows(self, rows: Dict[UserDayKey, Dict[str, int]]) -> Set[UserDayKey]:
+        """사용자 행 증분 UPSERT
+
+        Returns:
+            Set: 이번 증분으로 그날 첫 채팅이 기록된 (채팅, 날짜, 사용자) 키
+        """
+        table = DailyUserStatsModel.__table__
+        stmt = insert_on_conflict(self.session, DailyUserStatsModel).values(
+            [
+                dict(row, chat_id=chat_id, date=day, user_id=user_id)
+                for (chat_id, day, user_id), row in rows.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.chat_id, table.c.date, table.c.user_id],
+            set_={column: table.c[column] + stmt.excluded[column] for column in COUNTER_COLUMNS},
+        )
+
+        chatted = {key for key, row in rows.items() if row["message_count"] > 0}
+        if not chatted:
+            await self.session.execute(stmt)
+            return set()
+
+        if supports_insert_returning(self.session):
+            # 갱신 후 메시지 수가 이번 증분과 같으면 그날 첫 채팅
+            result = await self.session.execute(
+                stmt.returning(table.c.chat_id, table.c.date, table.c.user_id, table.c.message_count)
+            )
+            return {
+                (chat_id, day, user_id)
+                for chat_id, day, user_id, message_count in result
+                if (chat_id, day, user_id) in chatted
+                and message_count == rows[(chat_id, day, user_id)]["message_count"]
+            }
+
+        already_active = await self._active_keys(chatted)
+        await self.session.execute(stmt)
+        return chatted - already_active
+
+    async def _active_keys(self, keys: Set[UserDayKey]) -> Set[UserDayKey]:
+        """이미 채팅 기록이 있는 (채팅, 날짜, 사용자) 키"""
+        result = await self.session.execute(
+            select(
+                DailyUserStatsModel.chat_id,
+                DailyUserStatsModel.date,
+                DailyUserStatsModel.user_id,
+            ).where(
+                tuple_(
+                    DailyUserStatsModel.chat_id,
+                    DailyUserStatsModel.date,
+                    DailyUserStatsModel.user_id,
+                ).in_(list(keys)),
+                DailyUserStatsModel.message_count > 0,
+            )
+        )
+        return {tuple(row) for row in result}
+
+    async def _upsert_chat_rows(self, rows: Dict[ChatDayKey, Dict[str, int]]) -> None:
+        """채팅 행 증분 UPSERT"""
+        table = DailyChatStatsModel.__table__
+        stmt = insert_on_conflict(self.session, DailyChatStatsModel).values(
+            [dict(row, chat_id=chat_id, date=day) for (chat_id, day), row in rows.items()]
+        )
+        columns: List[str] = [*COUNTER_COLUMNS, "active_users"]
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.chat_id, table.c.date],
+                set_={column: table.c[column] + stmt.excluded[column] for column in columns},
+            )
+        )
+
+    async def _add_to_sketches(self, keys: Set[UserDayKey]) -> None:
+        """그날 첫 채팅한 사용자를 채팅 일별 스케치에 추가
+
+        채팅 행 UPSERT 뒤에 읽으므로 같은 행을 갱신하는 트랜잭션과 직렬화되어
+        동시 기록에도 스케치 갱신이 유실되지 않는다. 사용자당 하루 한 번만 실행된다.
+        """
+        if not keys:
+            return
+
+        new_users: Dict[ChatDayKey, List[int]] = {}
+        for chat_id, day, user_id in keys:
+            new_users.setdefault((chat_id, day), []).append(user_id)
+
+        result = await self.session.execute(
+            select(
+                DailyChatStatsModel.chat_id,
+                DailyChatStatsModel.date,
+                DailyChatStatsModel.user_sketch,
+            ).where(
+                tuple_(DailyChatStatsModel.chat_id, DailyChatStatsModel.date).in_(list(new_users))
+            )
+        )
+        updates = []
+        for chat_id, day, registers in result:
+            if registers is None:
+                # 스케치 도입 전부터 있던 날은 일별 사용자 행으로 새로 만든다
+                sketch = HyperLogLog()
+                sketch.update(await self._active_user_ids(chat_id, day))
+            else:
+                sketch = HyperLogLog(registers)
+                sketch.update(new_users[(chat_id, day)])
+            updates.append({"chat_id": chat_id, "date": day, "user_sketch": sketch.to_bytes()})
+
+        await self.session.execute(update(DailyChatStatsModel), updates)
+
+    async def _active_user_ids(self, chat_id: int, day: date) -> List[int]:
+        """그날 채팅한 사용자 id"""
+        result = await self.session.execute(
+            select(DailyUserStatsModel.user_id).where(
+                DailyUserStatsModel.chat_id == chat_id,
+                DailyUserStatsModel.date == day,
+                DailyUserStatsModel.message_count > 0,
+            )
+        )
+        return list(result.scalars())
+
+    async def _upsert_hour_rows(self, rows: Dict[ChatHourKey, Dict[str, int]]) -> None:
+        """시간대 행 증분 UPSERT"""
+        table = HourlyChatStatsModel.__table__
+        stmt = insert_on_conflict(self.session, HourlyChatStatsModel).values(
+            [dict(row, chat_id=chat_id, bucket=bucket) for (chat_id, bucket), row in rows.items()]
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.chat_id, table.c.bucket],
+                set_={column: table.c[column] + stmt.excluded[column] for column in HOURLY_COLUMNS},
+            )
+        )
+
+    @staticmethod
+    def _to_entity(model: DailyChatStatsModel) -> DailyRollup:
+        return DailyRollup(
+            date=model.date,
+            message_count=model.message_count,
+            chat_score=model.chat_score,
+            jackpot_count=model.jackpot_count,
+            check_in_count=model.check_in_count,
+            attendance_score=model.attendance_score,
+            active_users=model.active_users,
+        )
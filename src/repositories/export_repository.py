@@ -0,0 +1,69 @@
+"""
+Export Repository - Streaming read access for history exports
+"""
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Type, Union
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import AttendanceModel, ChatActivityModel
+
+ExportModel = Union[Type[ChatActivityModel], Type[AttendanceModel]]
+
+# 내보낼 수 있는 기록 테이블 (id 순으로 증가하는 원본 기록)
+EXPORT_TABLES: Dict[str, ExportModel] = {
+    ChatActivityModel.__tablename__: ChatActivityModel,
+    AttendanceModel.__tablename__: AttendanceModel,
+}
+
+
+class ExportRepository:
+    """기록 내보내기 저장소
+
+    서버 측 커서(yield_per)로 행을 나눠 받아 ORM 객체 없이 튜플로 넘기므로
+    테이블 크기와 관계없이 메모리 사용량이 일정하다.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def columns(model: ExportModel) -> List[str]:
+        """내보내는 컬럼 이름 (테이블 정의 순서)"""
+        return [column.name for column in model.__table__.columns]
+
+    async def max_id(self, model: ExportModel) -> int:
+        """현재 마지막 id (기록이 없으면 0)"""
+        result = await self.session.execute(select(func.coalesce(func.max(model.id), 0)))
+        return result.scalar_one()
+
+    async def stream_rows(
+        self,
+        model: ExportModel,
+        start_id: int,
+        end_id: int,
+        chat_id: Optional[int] = None,
+        batch_size: int = 5000,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """[start_id, end_id) 구간 행을 id 순으로 스트리밍
+
+        Args:
+            model: 내보낼 테이블 모델
+            start_id: 시작 id (포함)
+            end_id: 끝 id (제외)
+            chat_id: 채팅 필터 (None이면 전체)
+            batch_size: 커서에서 한 번에 가져올 행 수
+        """
+        stmt = (
+            select(*model.__table__.columns)
+            .where(model.id >= start_id, model.id < end_id)
+            .order_by(model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if chat_id is not None:
+            stmt = stmt.where(model.chat_id == chat_id)
+
+        result = await self.session.stream(stmt)
+        async for partition in result.partitions():
+            for row in partition:
+                yield row
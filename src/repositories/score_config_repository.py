@@ -2,25 +2,43 @@
 ScoreConfig Repository - Data access layer for ScoreConfig entity
 """
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import case, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core import clock
 from src.core.entities.score_config import ScoreConfig
+from src.infrastructure.cache.score_config_cache import ScoreConfigCache
+from src.infrastructure.database.dialect import insert_returning
 from src.infrastructure.database.models import ScoreConfigModel
 
 
 class ScoreConfigRepository:
     """점수 설정 저장소"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: Optional[ScoreConfigCache] = None):
         self.session = session
+        self.cache = cache
+
+    async def get_config(self, chat_id: int) -> ScoreConfig:
+        """채팅에 적용되는 점수 설정 조회 (채팅 전용 설정 > 기본 ID=1, 캐시 우선)"""
+        if self.cache:
+            config = self.cache.get(chat_id)
+            if config:
+                return config
+
+            cached = self.cache.get_stale(chat_id)
+            if cached and await self._get_version(chat_id) == (cached.id, cached.updated_at):
+                # 버전이 같으면 전체 설정을 다시 읽지 않는다
+                self.cache.mark_checked(chat_id)
+                return cached
 
-    async def get_config(self) -> ScoreConfig:
-        """점수 설정 조회 (기본 ID=1)"""
         result = await self.session.execute(
-            select(ScoreConfigModel).where(ScoreConfigModel.id == 1)
+            select(ScoreConfigModel)
+            .where(self._effective_filter(chat_id))
+            .order_by(self._chat_first())
+            .limit(1)
         )
         model = result.scalar_one_or_none()
 
@@ -28,7 +46,7 @@ class ScoreConfigRepository:
             # 설정이 없으면 기본값 생성
             model = await self._create_default()
 
-        return self._to_entity(model)
+        return self._remember(chat_id, self._to_entity(model))
 
     async def update(self, config: ScoreConfig) -> ScoreConfig:
         """점수 설정 업데이트"""
@@ -41,6 +59,7 @@ class ScoreConfigRepository:
             # 없으면 생성
             model = ScoreConfigModel(
                 id=config.id,
+                chat_id=config.chat_id,
                 attendance_score=config.attendance_score,
                 chat_score_min=config.chat_score_min,
                 chat_score_max=config.chat_score_max,
@@ -48,7 +67,7 @@ class ScoreConfigRepository:
                 multiplier_min=config.multiplier_min,
                 multiplier_max=config.multiplier_max,
                 max_consecutive_bonus=config.max_consecutive_bonus,
-                updated_at=datetime.now(),
+                updated_at=clock.now(),
             )
             self.session.add(model)
         else:
@@ -60,15 +79,51 @@ class ScoreConfigRepository:
             model.multiplier_min = config.multiplier_min
             model.multiplier_max = config.multiplier_max
             model.max_consecutive_bonus = config.max_consecutive_bonus
-            model.updated_at = datetime.now()
+            model.updated_at = clock.now()
 
         await self.session.flush()
         await self.session.refresh(model)
-        return self._to_entity(model)
+        config = self._to_entity(model)
+        if self.cache:
+            # 기본 설정이 바뀌면 이를 쓰는 모든 채팅의 캐시가 영향을 받는다
+            if config.chat_id is None:
+                self.cache.invalidate()
+            else:
+                self.cache.put(config.chat_id, config)
+        return config
+
+    async def _get_version(self, chat_id: int) -> Optional[Tuple[int, datetime]]:
+        """채팅에 적용되는 설정의 버전 (id, updated_at) 조회"""
+        result = await self.session.execute(
+            select(ScoreConfigModel.id, ScoreConfigModel.updated_at)
+            .where(self._effective_filter(chat_id))
+            .order_by(self._chat_first())
+            .limit(1)
+        )
+        row = result.one_or_none()
+        return (row[0], row[1]) if row else None
+
+    @staticmethod
+    def _effective_filter(chat_id: int):
+        """채팅 전용 설정 또는 기본 설정"""
+        return or_(ScoreConfigModel.chat_id == chat_id, ScoreConfigModel.id == 1)
+
+    @staticmethod
+    def _chat_first():
+        """채팅 전용 설정을 기본 설정보다 먼저 정렬"""
+        return case((ScoreConfigModel.chat_id.is_(None), 1), else_=0)
+
+    def _remember(self, chat_id: int, config: ScoreConfig) -> ScoreConfig:
+        """설정을 캐시에 반영"""
+        if self.cache:
+            self.cache.put(chat_id, config)
+        return config
 
     async def _create_default(self) -> ScoreConfigModel:
-        """기본 설정 생성"""
-        model = ScoreConfigModel(
+        """기본 설정 생성 (INSERT ... RETURNING 1회)"""
+        return await insert_returning(
+            self.session,
+            ScoreConfigModel,
             id=1,
             attendance_score=10,
             chat_score_min=1,
@@ -77,17 +132,14 @@ class ScoreConfigRepository:
             multiplier_min=1,
             multiplier_max=7,
             max_consecutive_bonus=7,
-            updated_at=datetime.now(),
+            updated_at=clock.now(),
         )
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return model
 
     def _to_entity(self, model: ScoreConfigModel) -> ScoreConfig:
         """모델을 엔티티로 변환"""
         return ScoreConfig(
             id=model.id,
+            chat_id=model.chat_id,
             attendance_score=model.attendance_score,
             chat_score_min=model.chat_score_min,
             chat_score_max=model.chat_score_max,
@@ -0,0 +1,135 @@
+"""
+StatsSnapshot Repository - Data access layer for memoized period stats
+"""
+from dataclasses import asdict
+from datetime import date
+from typing import Any, Dict, Optional, Type, TypeVar, Union
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import clock
+from src.core.entities.stats import DailyStats, MonthlyStats, UserStats
+from src.infrastructure.cache.stats_cache import StatsCache
+from src.infrastructure.database.dialect import insert_on_conflict
+from src.infrastructure.database.models import StatsSnapshotModel
+
+PERIOD_DAY = "day"
+PERIOD_MONTH = "month"
+
+StatsT = TypeVar("StatsT", DailyStats, MonthlyStats)
+
+
+class StatsSnapshotRepository:
+    """기간 통계 결과 저장소
+
+    끝난 기간(closed)의 통계는 메모리 캐시와 stats_snapshots 테이블에 영구히
+    남겨 다시 계산하지 않는다. 진행 중인 기간은 메모리 캐시에만 짧게 두고,
+    채팅 데이터 버전(version)이 바뀌면 다시 계산한다.
+    """
+
+    def __init__(self, session: AsyncSession, cache: Optional[StatsCache] = None):
+        self.session = session
+        self.cache = cache
+
+    async def get_daily(
+        self, chat_id: int, day: date, closed: bool, version: Optional[int] = None
+    ) -> Optional[DailyStats]:
+        """저장된 일일 통계 조회"""
+        return await self._get(chat_id, PERIOD_DAY, day, closed, DailyStats, version)
+
+    async def put_daily(
+        self, chat_id: int, stats: DailyStats, closed: bool, version: Optional[int] = None
+    ) -> None:
+        """일일 통계 저장"""
+        await self._put(chat_id, PERIOD_DAY, stats.date, stats, closed, version)
+
+    async def get_monthly(
+        self, chat_id: int, year: int, month: int, closed: bool, version: Optional[int] = None
+    ) -> Optional[MonthlyStats]:
+        """저장된 월별 통계 조회"""
+        start, _ = clock.month_range(year, month)
+        return await self._get(chat_id, PERIOD_MONTH, start, closed, MonthlyStats, version)
+
+    async def put_monthly(
+        self, chat_id: int, stats: MonthlyStats, closed: bool, version: Optional[int] = None
+    ) -> None:
+        """월별 통계 저장"""
+        start, _ = clock.month_range(stats.year, stats.month)
+        await self._put(chat_id, PERIOD_MONTH, start, stats, closed, version)
+
+    async def _get(
+        self,
+        chat_id: int,
+        period: str,
+        start: date,
+        closed: bool,
+        stats_cls: Type[StatsT],
+        version: Optional[int],
+    ) -> Optional[StatsT]:
+        if self.cache:
+            cached: Optional[StatsT] = self.cache.get(chat_id, period, start, version)
+            if cached is not None:
+                return cached
+
+        # 진행 중인 기간은 스냅샷이 없으므로 조회하지 않는다
+        if not closed:
+            return None
+
+        result = await self.session.execute(
+            select(StatsSnapshotModel.payload).where(
+                StatsSnapshotModel.chat_id == chat_id,
+                StatsSnapshotModel.period == period,
+                StatsSnapshotModel.period_start == start,
+            )
+        )
+        payload = result.scalar_one_or_none()
+        if payload is None:
+            return None
+
+        stats = self._from_payload(stats_cls, payload)
+        if self.cache:
+            self.cache.put(chat_id, period, start, stats, closed=True)
+        return stats
+
+    async def _put(
+        self,
+        chat_id: int,
+        period: str,
+        start: date,
+        stats: Union[DailyStats, MonthlyStats],
+        closed: bool,
+        version: Optional[int],
+    ) -> None:
+        if self.cache:
+            self.cache.put(chat_id, period, start, stats, closed, version)
+        if not closed:
+            return
+
+        # 같은 기간을 동시에 계산했다면 먼저 저장된 스냅샷을 유지
+        stmt = insert_on_conflict(self.session, StatsSnapshotModel).values(
+            chat_id=chat_id,
+            period=period,
+            period_start=start,
+            payload=self._to_payload(stats),
+            created_at=clock.now(),
+        )
+        await self.session.execute(stmt.on_conflict_do_nothing())
+
+    @staticmethod
+    def _to_payload(stats: Union[DailyStats, MonthlyStats]) -> Dict[str, Any]:
+        """통계 엔티티를 JSON 저장용 dict로 변환 (날짜는 ISO 문자열)"""
+        return {
+            key: value.isoformat() if isinstance(value, date) else value
+            for key, value in asdict(stats).items()
+        }
+
+    @staticmethod
+    def _from_payload(stats_cls: Type[StatsT], payload: Dict[str, Any]) -> StatsT:
+        """JSON 저장용 dict를 통계 엔티티로 변환"""
+        values = dict(payload)
+        for key in ("date", "most_active_date"):
+            if values.get(key) is not None:
+                values[key] = date.fromisoformat(values[key])
+        values["top_users"] = [UserStats(**user) for user in values["top_users"]]
+        return stats_cls(**values)
@@ -1,21 +1,82 @@
 """
 User Repository - Data access layer for User entity
 """
-from datetime import datetime
-from typing import List, Optional
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, cast
 
-from sqlalchemy import select
+from sqlalchemy import Table, bindparam, case, func, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core import clock
+from src.core.entities.chat_activity import ChatActivity
+from src.core.entities.ranking import RankingType
 from src.core.entities.user import User
+from src.infrastructure.cache.leaderboard import LeaderboardRegistry
+from src.infrastructure.cache.user_cache import UserCache
+from src.infrastructure.database.dialect import insert_returning, supports_update_returning
 from src.infrastructure.database.models import UserModel
 
 
+@dataclass
+class UserCounterDelta:
+    """사용자 누적 카운터 증분"""
+
+    user_id: int
+    score: int = 0
+    chat_count: int = 0
+    jackpot_count: int = 0
+    max_jackpot: int = 0
+
+    def add_activity(self, activity: ChatActivity) -> None:
+        """채팅 활동 1건을 증분에 합산"""
+        self.score += activity.final_score
+        self.chat_count += 1
+        if activity.is_jackpot:
+            self.jackpot_count += 1
+            self.max_jackpot = max(self.max_jackpot, activity.final_score)
+
+    def apply_to(self, user: User) -> User:
+        """증분을 더한 사용자 상태 (DB에 아직 반영되지 않은 증분을 얹을 때 사용)"""
+        return replace(
+            user,
+            total_score=user.total_score + self.score,
+            chat_count=user.chat_count + self.chat_count,
+            jackpot_count=user.jackpot_count + self.jackpot_count,
+            max_jackpot=max(user.max_jackpot, self.max_jackpot),
+        )
+
+
+# 랭킹 타입별 정렬 컬럼 (RankingType.sort_key와 같은 순서, 마지막 동점 기준은 id)
+RANKING_COLUMNS = {
+    RankingType.SCORE: (UserModel.total_score,),
+    RankingType.CHAT_COUNT: (UserModel.chat_count,),
+    RankingType.JACKPOT: (UserModel.jackpot_count, UserModel.max_jackpot),
+    RankingType.CONSECUTIVE_DAYS: (UserModel.consecutive_days, UserModel.total_attendance),
+}
+
+
 class UserRepository:
     """사용자 저장소"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: Optional[UserCache] = None,
+        leaderboards: Optional[LeaderboardRegistry] = None,
+        defer_publish: bool = False,
+    ):
+        """
+        Args:
+            session: 데이터베이스 세션
+            cache: 사용자 캐시
+            leaderboards: 메모리 리더보드
+            defer_publish: 캐시/리더보드 반영을 publish() 호출(커밋 후)까지 미룰지 여부
+        """
         self.session = session
+        self.cache = cache
+        self.leaderboards = leaderboards
+        self.defer_publish = defer_publish
+        self._unpublished: Dict[int, User] = {}
 
     async def get_by_id(self, user_id: int) -> Optional[User]:
         """ID로 사용자 조회"""
@@ -25,18 +86,36 @@ class UserRepository:
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
-    async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
-        """Telegram ID로 사용자 조회"""
+    async def get_by_telegram_id(self, telegram_id: int, chat_id: int) -> Optional[User]:
+        """채팅 내 Telegram ID로 사용자 조회 (캐시 우선)"""
+        if self.cache:
+            hit, user = self.cache.lookup(chat_id, telegram_id)
+            if hit:
+                return user
+
         result = await self.session.execute(
-            select(UserModel).where(UserModel.telegram_id == telegram_id)
+            select(UserModel).where(
+                UserModel.chat_id == chat_id, UserModel.telegram_id == telegram_id
+            )
         )
         model = result.scalar_one_or_none()
-        return self._to_entity(model) if model else None
+        user = self._to_entity(model) if model else None
 
-    async def create(self, telegram_id: int, username: str) -> User:
-        """사용자 생성"""
-        model = UserModel(
+        if self.cache:
+            if user:
+                self.cache.put(user)
+            else:
+                self.cache.mark_unregistered(chat_id, telegram_id)
+        return user
+
+    async def create(self, telegram_id: int, chat_id: int, username: str) -> User:
+        """채팅 멤버 사용자 생성 (INSERT ... RETURNING 1회)"""
+        now = clock.now()
+        model = await insert_returning(
+            self.session,
+            UserModel,
             telegram_id=telegram_id,
+            chat_id=chat_id,
             username=username,
             total_score=0,
             chat_count=0,
@@ -45,84 +124,238 @@ class UserRepository:
             consecutive_days=0,
             total_attendance=0,
             last_checkin=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
+        )
+        return self.remember(self._to_entity(model))
+
+    async def increment_counters(self, delta: UserCounterDelta) -> User:
+        """사용자 카운터 원자적 증가 (UPDATE ... RETURNING 1회)"""
+        return await self._update_returning(
+            delta.user_id,
+            total_score=UserModel.total_score + delta.score,
+            chat_count=UserModel.chat_count + delta.chat_count,
+            jackpot_count=UserModel.jackpot_count + delta.jackpot_count,
+            max_jackpot=case(
+                (UserModel.max_jackpot < delta.max_jackpot, delta.max_jackpot),
+                else_=UserModel.max_jackpot,
+            ),
+            updated_at=clock.now(),
+        )
+
+    async def record_checkin(self, user_id: int, score: int, consecutive_days: int) -> User:
+        """출석 반영 (점수/출석 수 원자적 증가, UPDATE ... RETURNING 1회)"""
+        now = clock.now()
+        return await self._update_returning(
+            user_id,
+            total_score=UserModel.total_score + score,
+            total_attendance=UserModel.total_attendance + 1,
+            consecutive_days=consecutive_days,
+            last_checkin=now,
+            updated_at=now,
         )
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return self._to_entity(model)
 
-    async def update(self, user: User) -> User:
-        """사용자 업데이트"""
+    def remember(self, user: User) -> User:
+        """사용자 상태를 캐시/리더보드에 반영 (쓰기 지연 모드에서 DB 반영 전 상태 포함)
+
+        defer_publish면 상태를 모아두었다가 작업 단위 커밋 후 publish()에서 반영하므로
+        롤백된 변경은 캐시나 리더보드에 남지 않는다.
+        """
+        if self.defer_publish:
+            self._unpublished[user.id] = replace(user)
+        else:
+            self._publish(user)
+        return user
+
+    def publish(self) -> None:
+        """커밋된 사용자 상태를 캐시/리더보드에 반영"""
+        users, self._unpublished = self._unpublished, {}
+        for user in users.values():
+            self._publish(user)
+
+    def _publish(self, user: User) -> None:
+        if self.cache:
+            self.cache.put(user)
+        if self.leaderboards is not None:
+            self.leaderboards.update(user)
+
+    async def iter_by_chat(self, chat_id: int, batch_size: int = 1000) -> AsyncIterator[User]:
+        """채팅의 전체 사용자 스트리밍 조회 (서버 측 커서, batch_size 단위로 가져옴)"""
+        result = await self.session.stream_scalars(
+            select(UserModel)
+            .where(UserModel.chat_id == chat_id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for model in result:
+            yield self._to_entity(model)
+
+    async def apply_counter_deltas(self, deltas: Iterable[UserCounterDelta]) -> None:
+        """사용자별 카운터 증분 일괄 반영 (사용자당 UPDATE 1회, executemany)"""
+        params = [
+            {
+                "b_id": delta.user_id,
+                "b_score": delta.score,
+                "b_chat_count": delta.chat_count,
+                "b_jackpot_count": delta.jackpot_count,
+                "b_max_jackpot": delta.max_jackpot,
+                "b_updated_at": clock.now(),
+            }
+            for delta in deltas
+        ]
+        if not params:
+            return
+
+        users = cast(Table, UserModel.__table__)
+        await self.session.execute(
+            update(users)
+            .where(users.c.id == bindparam("b_id"))
+            .values(
+                total_score=users.c.total_score + bindparam("b_score"),
+                chat_count=users.c.chat_count + bindparam("b_chat_count"),
+                jackpot_count=users.c.jackpot_count + bindparam("b_jackpot_count"),
+                max_jackpot=case(
+                    (users.c.max_jackpot < bindparam("b_max_jackpot"), bindparam("b_max_jackpot")),
+                    else_=users.c.max_jackpot,
+                ),
+                updated_at=bindparam("b_updated_at"),
+            ),
+            params,
+        )
+
+    async def get_ranking_page(
+        self,
+        chat_id: int,
+        ranking_type: RankingType,
+        limit: int,
+        after: Optional[Tuple[int, ...]] = None,
+        before: Optional[Tuple[int, ...]] = None,
+    ) -> List[User]:
+        """랭킹 페이지 조회 (키셋 페이지네이션, OFFSET 없음)
+
+        Args:
+            chat_id: 채팅 ID
+            ranking_type: 랭킹 타입
+            limit: 조회할 사용자 수
+            after: 이 키(정렬 키 + id) 다음 순위부터 조회
+            before: 이 키 바로 앞 순위까지 조회
+
+        Returns:
+            List[User]: 순위 순서의 사용자 목록
+        """
+        columns = RANKING_COLUMNS[ranking_type] + (UserModel.id,)
+        stmt = select(UserModel).where(UserModel.chat_id == chat_id, columns[0] > 0)
+
+        if before is not None:
+            # 이전 페이지: 기준 키보다 높은 순위를 가까운 순서로 가져와 뒤집는다
+            result = await self.session.execute(
+                stmt.where(tuple_(*columns) > tuple_(*map(literal, before)))
+                .order_by(*[column.asc() for column in columns])
+                .limit(limit)
+            )
+            return [self._to_entity(model) for model in reversed(result.scalars().all())]
+
+        if after is not None:
+            stmt = stmt.where(tuple_(*columns) < tuple_(*map(literal, after)))
         result = await self.session.execute(
-            select(UserModel).where(UserModel.id == user.id)
+            stmt.order_by(*[column.desc() for column in columns]).limit(limit)
         )
-        model = result.scalar_one()
-
-        model.username = user.username
-        model.total_score = user.total_score
-        model.chat_count = user.chat_count
-        model.jackpot_count = user.jackpot_count
-        model.max_jackpot = user.max_jackpot
-        model.consecutive_days = user.consecutive_days
-        model.total_attendance = user.total_attendance
-        model.last_checkin = user.last_checkin
-        model.updated_at = datetime.now()
-
-        await self.session.flush()
-        await self.session.refresh(model)
-        return self._to_entity(model)
-
-    async def get_ranking_by_score(self, limit: int = 10) -> List[User]:
-        """점수 순위 조회"""
+        return [self._to_entity(model) for model in result.scalars().all()]
+
+    async def count_ranked(self, chat_id: int, ranking_type: RankingType) -> int:
+        """채팅 내 랭킹 대상 사용자 수"""
+        first_column = RANKING_COLUMNS[ranking_type][0]
         result = await self.session.execute(
-            select(UserModel)
-            .where(UserModel.total_score > 0)
-            .order_by(UserModel.total_score.desc())
-            .limit(limit)
+            select(func.count(UserModel.id)).where(
+                UserModel.chat_id == chat_id, first_column > 0
+            )
         )
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+        return result.scalar() or 0
 
-    async def get_ranking_by_chat_count(self, limit: int = 10) -> List[User]:
-        """채팅 수 순위 조회"""
+    async def count_ranked_ahead(self, ranking_type: RankingType, user: User) -> int:
+        """같은 채팅에서 해당 사용자보다 순위가 높은 사용자 수"""
+        columns, key = self._ranking_key(ranking_type, user)
         result = await self.session.execute(
-            select(UserModel)
-            .where(UserModel.chat_count > 0)
-            .order_by(UserModel.chat_count.desc())
-            .limit(limit)
+            select(func.count(UserModel.id)).where(
+                UserModel.chat_id == user.chat_id,
+                columns[0] > 0,
+                tuple_(*columns) > tuple_(*key),
+            )
         )
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+        return result.scalar() or 0
+
+    async def get_ranking_neighbors(
+        self, ranking_type: RankingType, user: User, count: int
+    ) -> Tuple[List[User], List[User]]:
+        """같은 채팅에서 해당 사용자 바로 위/아래 사용자 조회
+
+        Returns:
+            Tuple[List[User], List[User]]: (위쪽 사용자 높은 순위부터, 아래쪽 사용자)
+        """
+        columns, key = self._ranking_key(ranking_type, user)
 
-    async def get_ranking_by_jackpot(self, limit: int = 10) -> List[User]:
-        """잭팟 횟수 순위 조회"""
         result = await self.session.execute(
             select(UserModel)
-            .where(UserModel.jackpot_count > 0)
-            .order_by(UserModel.jackpot_count.desc(), UserModel.max_jackpot.desc())
-            .limit(limit)
+            .where(
+                UserModel.chat_id == user.chat_id,
+                columns[0] > 0,
+                tuple_(*columns) > tuple_(*key),
+            )
+            .order_by(*[column.asc() for column in columns])
+            .limit(count)
         )
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+        above = [self._to_entity(model) for model in reversed(result.scalars().all())]
 
-    async def get_ranking_by_consecutive_days(self, limit: int = 10) -> List[User]:
-        """연속 출석일 순위 조회"""
         result = await self.session.execute(
             select(UserModel)
-            .where(UserModel.consecutive_days > 0)
-            .order_by(UserModel.consecutive_days.desc(), UserModel.total_attendance.desc())
-            .limit(limit)
+            .where(
+                UserModel.chat_id == user.chat_id,
+                columns[0] > 0,
+                tuple_(*columns) < tuple_(*key),
+            )
+            .order_by(*[column.desc() for column in columns])
+            .limit(count)
         )
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+        below = [self._to_entity(model) for model in result.scalars().all()]
+        return above, below
+
+    @staticmethod
+    def _ranking_key(ranking_type: RankingType, user: User) -> Tuple[tuple, tuple]:
+        """랭킹 정렬 컬럼과 해당 사용자의 키 값 (id 포함)"""
+        columns = RANKING_COLUMNS[ranking_type] + (UserModel.id,)
+        key = ranking_type.sort_key(user) + (user.id,)
+        return columns, key
+
+    async def _update_returning(self, user_id: int, **values) -> User:
+        """UPDATE 후 갱신된 행을 엔티티로 반환 (RETURNING 미지원 시 재조회)"""
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+        if supports_update_returning(self.session):
+            result = await self.session.execute(
+                stmt.returning(UserModel).execution_options(populate_existing=True)
+            )
+            model = result.scalar_one()
+        else:
+            await self.session.execute(stmt)
+            result = await self.session.execute(
+                select(UserModel)
+                .where(UserModel.id == user_id)
+                .execution_options(populate_existing=True)
+            )
+            model = result.scalar_one()
+
+        return self.remember(self._to_entity(model))
 
     def _to_entity(self, model: UserModel) -> User:
         """모델을 엔티티로 변환"""
         return User(
             id=model.id,
             telegram_id=model.telegram_id,
+            chat_id=model.chat_id,
             username=model.username,
             total_score=model.total_score,
             chat_count=model.chat_count,
@@ -13,18 +13,19 @@ class AttendanceService:
     def __init__(self, checkin_usecase: CheckInUseCase):
         self.checkin_usecase = checkin_usecase
 
-    async def check_in(self, telegram_id: int, username: str) -> Dict[str, Any]:
+    async def check_in(self, telegram_id: int, chat_id: int, username: str) -> Dict[str, Any]:
         """출석 체크 처리
 
         Args:
             telegram_id: 텔레그램 사용자 ID
+            chat_id: 채팅(그룹) ID
             username: 사용자 이름
 
         Returns:
             Dict: 출석 결과
         """
         try:
-            result = await self.checkin_usecase.execute(telegram_id, username)
+            result = await self.checkin_usecase.execute(telegram_id, chat_id, username)
             return {
                 "success": True,
                 "user": result.user,
@@ -13,18 +13,19 @@ class ChatActivityService:
         self.process_message_usecase = process_message_usecase
 
     async def process_message(
-        self, telegram_id: int, message_id: int
+        self, telegram_id: int, chat_id: int, message_id: int
     ) -> Optional[Dict[str, Any]]:
         """메시지 처리 및 점수 부여
 
         Args:
             telegram_id: 텔레그램 사용자 ID
+            chat_id: 채팅(그룹) ID
             message_id: 메시지 ID
 
         Returns:
             Dict: 처리 결과 (미등록 유저는 None)
         """
-        result = await self.process_message_usecase.execute(telegram_id, message_id)
+        result = await self.process_message_usecase.execute(telegram_id, chat_id, message_id)
 
         if not result:
             return None  # 미등록 유저
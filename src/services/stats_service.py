@@ -1,11 +1,15 @@
 """
 Stats Service - 통계 서비스
 """
-from datetime import date, datetime
-from typing import Dict, Any
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Optional
 
+from src.core import clock
+from src.core.entities.stats import ActivityBucket, Granularity
+from src.core.use_cases.get_activity_series_usecase import GetActivitySeriesUseCase
 from src.core.use_cases.get_daily_stats_usecase import GetDailyStatsUseCase
 from src.core.use_cases.get_monthly_stats_usecase import GetMonthlyStatsUseCase
+from src.infrastructure.cache.leaderboard import LeaderboardRegistry
 
 
 class StatsService:
@@ -15,23 +19,76 @@ class StatsService:
         self,
         daily_stats_usecase: GetDailyStatsUseCase,
         monthly_stats_usecase: GetMonthlyStatsUseCase,
+        activity_series_usecase: GetActivitySeriesUseCase,
+        leaderboards: Optional[LeaderboardRegistry] = None,
     ):
         self.daily_stats_usecase = daily_stats_usecase
         self.monthly_stats_usecase = monthly_stats_usecase
+        self.activity_series_usecase = activity_series_usecase
+        self.leaderboards = leaderboards
 
-    async def get_daily_stats(self, target_date: date = None) -> Dict[str, Any]:
-        """일일 통계 조회 (기본값: 오늘)"""
+    def data_version(self, chat_id: int) -> Optional[int]:
+        """채팅 통계 데이터 버전 (응답 캐시 키, 알 수 없으면 None)
+
+        채팅/출석은 항상 사용자 카운터 갱신을 동반하므로 리더보드의
+        채팅 사용자 상태 버전을 통계 버전으로 사용한다.
+        """
+        if self.leaderboards is None:
+            return None
+        return self.leaderboards.data_version(chat_id)
+
+    async def get_daily_stats(self, chat_id: int, target_date: date = None) -> Dict[str, Any]:
+        """채팅 일일 통계 조회 (기본값: 오늘)"""
         if target_date is None:
-            target_date = datetime.now().date()
+            target_date = clock.today()
 
-        return await self.daily_stats_usecase.execute(target_date)
+        return await self.daily_stats_usecase.execute(
+            chat_id, target_date, self.data_version(chat_id)
+        )
 
-    async def get_monthly_stats(self, year: int = None, month: int = None) -> Dict[str, Any]:
-        """월별 통계 조회 (기본값: 이번 달)"""
-        now = datetime.now()
+    async def get_monthly_stats(
+        self, chat_id: int, year: int = None, month: int = None
+    ) -> Dict[str, Any]:
+        """채팅 월별 통계 조회 (기본값: 이번 달)"""
+        now = clock.now()
         if year is None:
             year = now.year
         if month is None:
             month = now.month
 
-        return await self.monthly_stats_usecase.execute(year, month)
+        return await self.monthly_stats_usecase.execute(
+            chat_id, year, month, self.data_version(chat_id)
+        )
+
+    async def get_activity_report(self, chat_id: int, days: int = 7) -> Dict[str, Any]:
+        """채팅 활동 리포트 조회 (최근 days일과 그 직전 days일 비교, 오늘 포함)
+
+        Returns:
+            Dict: daily(일별 시계열), heatmap(요일 x 시간대), current/previous(기간 합계),
+                current_users/previous_users((사용자 수, 추정값 여부))
+        """
+        end = datetime.combine(clock.today() + timedelta(days=1), time.min)
+        start = end - timedelta(days=days)
+        previous_start = start - timedelta(days=days)
+
+        daily = await self.activity_series_usecase.execute(
+            chat_id, start, end, Granularity.DAY
+        )
+        current = ActivityBucket(start=start)
+        for bucket in daily:
+            current.add(bucket)
+
+        return {
+            "success": True,
+            "days": days,
+            "daily": daily,
+            "heatmap": await self.activity_series_usecase.heatmap(chat_id, start, end),
+            "current": current,
+            "previous": await self.activity_series_usecase.total(chat_id, previous_start, start),
+            "current_users": await self.activity_series_usecase.active_users(
+                chat_id, start.date(), end.date()
+            ),
+            "previous_users": await self.activity_series_usecase.active_users(
+                chat_id, previous_start.date(), start.date()
+            ),
+        }
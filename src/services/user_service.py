@@ -1,10 +1,15 @@
 """
 User Service - 사용자 정보 관련 비즈니스 서비스
 """
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
 from src.core.exceptions import UserNotRegisteredError
-from src.core.use_cases.get_ranking_usecase import GetRankingUseCase, RankingType
+from src.core.use_cases.get_my_rank_usecase import GetMyRankUseCase
+from src.core.use_cases.get_ranking_usecase import (
+    GetRankingUseCase,
+    RankingCursor,
+    RankingType,
+)
 from src.core.use_cases.get_user_info_usecase import GetUserInfoUseCase
 
 
@@ -15,45 +20,76 @@ class UserService:
         self,
         get_user_info_usecase: GetUserInfoUseCase,
         get_ranking_usecase: GetRankingUseCase,
+        get_my_rank_usecase: GetMyRankUseCase,
     ):
         self.get_user_info_usecase = get_user_info_usecase
         self.get_ranking_usecase = get_ranking_usecase
+        self.get_my_rank_usecase = get_my_rank_usecase
 
-    async def get_user_info(self, telegram_id: int) -> Dict[str, Any]:
+    async def get_user_info(self, telegram_id: int, chat_id: int) -> Dict[str, Any]:
         """사용자 정보 조회
 
         Args:
             telegram_id: 텔레그램 사용자 ID
+            chat_id: 채팅(그룹) ID
 
         Returns:
             Dict: 사용자 정보
         """
         try:
-            result = await self.get_user_info_usecase.execute(telegram_id)
+            result = await self.get_user_info_usecase.execute(telegram_id, chat_id)
             return {
                 "success": True,
                 "user": result.user,
                 "recent_attendances": result.recent_attendances,
                 "top_jackpots": result.top_jackpots,
+                "score_rank": result.score_rank,
             }
         except UserNotRegisteredError as e:
             return {"success": False, "error": str(e)}
 
-    async def get_ranking(
-        self, ranking_type: RankingType, limit: int = 10
+    def ranking_version(self, chat_id: int, ranking_type: RankingType) -> Optional[int]:
+        """채팅 랭킹 데이터 버전 (응답 캐시 키, 알 수 없으면 None)"""
+        return self.get_ranking_usecase.version(chat_id, ranking_type)
+
+    async def get_ranking_page(
+        self,
+        chat_id: int,
+        ranking_type: RankingType,
+        page_size: int = 10,
+        cursor: Optional[RankingCursor] = None,
     ) -> Dict[str, Any]:
-        """랭킹 조회
+        """채팅 랭킹 페이지 조회
 
         Args:
+            chat_id: 채팅(그룹) ID
             ranking_type: 랭킹 타입
-            limit: 조회할 사용자 수
+            page_size: 페이지당 사용자 수
+            cursor: 페이지 커서 (None이면 첫 페이지)
 
         Returns:
-            Dict: 랭킹 정보
+            Dict: 랭킹 페이지 정보
         """
-        result = await self.get_ranking_usecase.execute(ranking_type, limit)
-        return {
-            "success": True,
-            "ranking_type": result.ranking_type,
-            "users": result.users,
-        }
+        page = await self.get_ranking_usecase.execute_page(
+            chat_id, ranking_type, page_size, cursor
+        )
+        return {"success": True, "ranking_type": ranking_type, "page": page}
+
+    async def get_my_rank(
+        self, telegram_id: int, chat_id: int, neighbors: int = 2
+    ) -> Dict[str, Any]:
+        """채팅 내 순위 조회
+
+        Args:
+            telegram_id: 텔레그램 사용자 ID
+            chat_id: 채팅(그룹) ID
+            neighbors: 위/아래로 함께 보여줄 사용자 수
+
+        Returns:
+            Dict: 랭킹 타입별 순위 정보
+        """
+        try:
+            result = await self.get_my_rank_usecase.execute(telegram_id, chat_id, neighbors)
+            return {"success": True, "user": result.user, "positions": result.positions}
+        except UserNotRegisteredError as e:
+            return {"success": False, "error": str(e)}
@@ -0,0 +1,33 @@
+"""
+Shared test fixtures
+"""
+import os
+
+# 설정 모듈이 import 시점에 필수 값을 읽으므로 가장 먼저 채운다
+os.environ.setdefault("BOT_TOKEN", "123456:test-token")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+import pytest  # noqa: E402
+
+from src.infrastructure.database.connection import DatabaseManager  # noqa: E402
+from src.repositories.user_repository import UserRepository  # noqa: E402
+
+
+@pytest.fixture
+async def db(tmp_path):
+    """테스트마다 새로 만드는 SQLite 데이터베이스"""
+    manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    await manager.init_db()
+    yield manager
+    await manager.close()
+
+
+@pytest.fixture
+def create_user(db):
+    """사용자 생성 헬퍼"""
+
+    async def create(telegram_id: int, chat_id: int = -100, username: str = "user"):
+        async with db.session() as session:
+            return await UserRepository(session).create(telegram_id, chat_id, username)
+
+    return create
@@ -0,0 +1,194 @@
+"""
+ChatActivityWriter tests
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import func, select
+
+from src.container import ServiceContainer
+from src.core import clock
+from src.core.entities.chat_activity import ChatActivity
+from src.infrastructure.cache.leaderboard import LeaderboardRegistry
+from src.infrastructure.cache.user_cache import UserCache
+from src.infrastructure.database.models import ChatActivityModel
+from src.repositories.chat_activity_writer import ChatActivityWriter
+from src.repositories.user_repository import UserRepository
+
+pytestmark = pytest.mark.integration
+
+
+def make_activity(user_id: int, message_id: int, chat_id: int = -100) -> ChatActivity:
+    return ChatActivity(
+        id=0,
+        user_id=user_id,
+        chat_id=chat_id,
+        message_id=message_id,
+        base_score=1,
+        is_jackpot=False,
+        multiplier=1,
+        final_score=1,
+        created_at=clock.now(),
+    )
+
+
+async def count_activities(db) -> int:
+    async with db.session() as session:
+        return int(
+            (await session.execute(select(func.count(ChatActivityModel.id)))).scalar_one()
+        )
+
+
+class FlakySessions:
+    """처음 failures번은 실패하고 이후에는 실제 세션을 여는 세션 팩토리"""
+
+    def __init__(self, db, failures: int):
+        self.db = db
+        self.failures = failures
+        self.attempts = 0
+
+    @asynccontextmanager
+    async def __call__(self):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise RuntimeError("database unavailable")
+        async with self.db.session() as session:
+            yield session
+
+
+async def test_flush_writes_activities_and_counters(db, create_user):
+    user = await create_user(1)
+    writer = ChatActivityWriter(db.session)
+
+    for message_id in range(3):
+        await writer.submit(make_activity(user.id, message_id))
+
+    assert await writer.flush() == 3
+    assert writer.pending_count == 0
+    assert await count_activities(db) == 3
+    async with db.session() as session:
+        stored = await UserRepository(session).get_by_id(user.id)
+    assert stored.chat_count == 3
+    assert stored.total_score == 3
+
+
+async def test_stop_finishes_in_flight_flush(db, create_user):
+    user = await create_user(1)
+    entered = asyncio.Event()
+    release = asyncio.Event()
+
+    @asynccontextmanager
+    async def slow_session():
+        async with db.session() as session:
+            entered.set()
+            await release.wait()
+            yield session
+
+    writer = ChatActivityWriter(slow_session, flush_interval_ms=10)
+    writer.start()
+    for message_id in range(5):
+        await writer.submit(make_activity(user.id, message_id))
+
+    await entered.wait()
+    stopping = asyncio.create_task(writer.stop())
+    await asyncio.sleep(0.05)
+    assert not stopping.done()
+
+    release.set()
+    await stopping
+    assert writer.pending_count == 0
+    assert await count_activities(db) == 5
+
+
+async def test_failed_batch_is_retried_in_order(db, create_user):
+    user = await create_user(1)
+    sessions = FlakySessions(db, failures=2)
+    writer = ChatActivityWriter(sessions, max_retries=5)
+
+    for message_id in range(3):
+        await writer.submit(make_activity(user.id, message_id))
+
+    assert await writer.flush() == 0
+    assert await writer.flush() == 0
+    assert writer.pending_count == 3
+    assert await writer.flush() == 3
+
+    async with db.session() as session:
+        rows = await session.scalars(
+            select(ChatActivityModel.message_id).order_by(ChatActivityModel.id)
+        )
+    assert list(rows) == [0, 1, 2]
+
+
+async def test_batch_is_dead_lettered_after_max_retries(db, create_user, caplog):
+    user = await create_user(1)
+    sessions = FlakySessions(db, failures=3)
+    writer = ChatActivityWriter(sessions, max_retries=3)
+    await writer.submit(make_activity(user.id, 1))
+
+    with caplog.at_level(logging.ERROR, logger="src.repositories.chat_activity_writer.dead_letter"):
+        for _ in range(3):
+            await writer.flush()
+
+    assert writer.pending_count == 0
+    assert sessions.attempts == 3
+    assert await count_activities(db) == 0
+    assert any("message_id=1" in record.getMessage() for record in caplog.records)
+
+
+async def test_submit_waits_when_queue_is_full(db, create_user):
+    user = await create_user(1)
+    writer = ChatActivityWriter(db.session, batch_size=2, max_pending=2)
+    await writer.submit(make_activity(user.id, 1))
+    await writer.submit(make_activity(user.id, 2))
+
+    blocked = asyncio.create_task(writer.submit(make_activity(user.id, 3)))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+    assert writer.pending_count == 2
+
+    await writer.flush()
+    await blocked
+    assert writer.pending_count == 1
+
+
+async def test_flush_bumps_chat_data_version(db, create_user):
+    user = await create_user(1)
+    registry = LeaderboardRegistry()
+    writer = ChatActivityWriter(db.session, leaderboards=registry)
+    await writer.submit(make_activity(user.id, 1))
+    submitted = registry.data_version(-100)
+
+    await writer.flush()
+    assert registry.data_version(-100) > submitted
+
+
+async def test_check_in_keeps_queued_chat_increments(db, create_user):
+    user = await create_user(1)
+    user_cache = UserCache(maxsize=100, ttl=60, negative_ttl=60)
+    writer = ChatActivityWriter(db.session)
+
+    def container() -> ServiceContainer:
+        return ServiceContainer(db.session_factory, user_cache=user_cache, activity_writer=writer)
+
+    for message_id in range(3):
+        async with container() as uow:
+            await (await uow.resolve("process_message_usecase")).execute(1, -100, message_id)
+    assert writer.pending_count == 3
+
+    # 채팅 증분이 아직 큐에 있는 상태에서 출석
+    async with container() as uow:
+        result = await (await uow.resolve("checkin_usecase")).execute(1, -100, "user")
+
+    expected_score = writer.pending_delta(user.id).score + result.score
+    assert result.user.total_score == expected_score
+    assert result.user.chat_count == 3
+    assert user_cache.lookup(-100, 1)[1].total_score == expected_score
+
+    # 큐가 저장된 뒤 DB 값도 캐시와 같다
+    await writer.flush()
+    async with db.session() as session:
+        stored = await UserRepository(session).get_by_id(user.id)
+    assert (stored.total_score, stored.chat_count) == (expected_score, 3)
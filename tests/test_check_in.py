@@ -0,0 +1,65 @@
+"""
+Check-in use case tests
+"""
+import asyncio
+
+import pytest
+
+from src.container import ServiceContainer
+from src.core.exceptions import AlreadyCheckedInError
+from src.infrastructure.database.models import AttendanceModel
+from src.repositories.attendance_repository import AttendanceRepository
+from src.repositories.score_config_repository import ScoreConfigRepository
+from src.repositories.user_repository import UserRepository
+
+pytestmark = pytest.mark.integration
+
+CHAT_ID = -100
+CONCURRENT_CALLS = 5
+
+
+async def test_concurrent_check_ins_award_once(db, create_user, monkeypatch):
+    user = await create_user(1, CHAT_ID)
+    async with db.session() as session:
+        # 기본 설정을 미리 만들어 게이트 전에는 읽기만 하게 한다
+        await ScoreConfigRepository(session).get_config(CHAT_ID)
+
+    # 모든 호출이 빠른 거절(can_checkin_today)을 통과한 뒤 동시에 게이트에 도달하게 한다
+    create_if_absent = AttendanceRepository.create_if_absent
+    arrived = []
+    all_arrived = asyncio.Event()
+
+    async def gated(self, *args, **kwargs):
+        arrived.append(self)
+        if len(arrived) == CONCURRENT_CALLS:
+            all_arrived.set()
+        await all_arrived.wait()
+        return await create_if_absent(self, *args, **kwargs)
+
+    monkeypatch.setattr(AttendanceRepository, "create_if_absent", gated)
+
+    async def check_in():
+        # 호출마다 별도 세션/트랜잭션 (미들웨어 사용자 락 없이 DB 게이트만 검증)
+        async with ServiceContainer(db.session_factory) as container:
+            usecase = await container.resolve("checkin_usecase")
+            return await usecase.execute(user.telegram_id, CHAT_ID, "user")
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(check_in() for _ in range(CONCURRENT_CALLS)), return_exceptions=True),
+        timeout=30,
+    )
+
+    succeeded = [result for result in results if not isinstance(result, BaseException)]
+    rejected = [result for result in results if isinstance(result, AlreadyCheckedInError)]
+    assert len(succeeded) == 1
+    assert len(rejected) == CONCURRENT_CALLS - 1
+
+    async with db.session() as session:
+        rows = await session.execute(
+            AttendanceModel.__table__.select().where(AttendanceModel.user_id == user.id)
+        )
+        assert len(rows.all()) == 1
+        stored = await UserRepository(session).get_by_id(user.id)
+
+    assert stored.total_attendance == 1
+    assert stored.total_score == succeeded[0].score
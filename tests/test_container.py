@@ -0,0 +1,83 @@
+"""
+ServiceContainer unit-of-work tests
+"""
+import pytest
+
+from src.container import ServiceContainer
+from src.core import clock
+from src.core.entities.chat_activity import ChatActivity
+from src.repositories.daily_stats_repository import DailyStatsRepository
+from src.repositories.user_repository import UserRepository
+
+pytestmark = pytest.mark.integration
+
+CHAT_ID = -100
+
+
+def make_activity(user_id: int) -> ChatActivity:
+    return ChatActivity(
+        id=0,
+        user_id=user_id,
+        chat_id=CHAT_ID,
+        message_id=1,
+        base_score=3,
+        is_jackpot=False,
+        multiplier=1,
+        final_score=3,
+        created_at=clock.now(),
+    )
+
+
+async def chat_day(db):
+    async with db.session() as session:
+        return await DailyStatsRepository(session).get_chat_day(CHAT_ID, clock.today())
+
+
+async def test_rollups_are_applied_at_commit(db, create_user):
+    user = await create_user(1)
+
+    async with ServiceContainer(db.session_factory) as container:
+        daily_stats_repo = await container.resolve("daily_stats_repo")
+        await daily_stats_repo.record_activities([make_activity(user.id)])
+        await daily_stats_repo.record_check_in(CHAT_ID, user.id, clock.today(), 10)
+        # 커밋 직전까지 채팅 행을 건드리지 않는다
+        assert (await chat_day(db)).message_count == 0
+
+    rollup = await chat_day(db)
+    assert rollup.message_count == 1
+    assert rollup.chat_score == 3
+    assert rollup.check_in_count == 1
+    assert rollup.active_users == 1
+
+
+async def test_rollups_are_dropped_on_rollback(db, create_user):
+    user = await create_user(1)
+
+    with pytest.raises(RuntimeError):
+        async with ServiceContainer(db.session_factory) as container:
+            daily_stats_repo = await container.resolve("daily_stats_repo")
+            await daily_stats_repo.record_activities([make_activity(user.id)])
+            raise RuntimeError("handler failed")
+
+    assert (await chat_day(db)).message_count == 0
+
+
+async def test_failed_rollup_rolls_back_unit_of_work(db, create_user, monkeypatch):
+    user = await create_user(1)
+
+    async def fail(self, rows):
+        raise RuntimeError("rollup failed")
+
+    monkeypatch.setattr(DailyStatsRepository, "_upsert_chat_rows", fail)
+    with pytest.raises(RuntimeError):
+        async with ServiceContainer(db.session_factory) as container:
+            user_repo = await container.resolve("user_repo")
+            await user_repo.record_checkin(user.id, 10, 1)
+            daily_stats_repo = await container.resolve("daily_stats_repo")
+            await daily_stats_repo.record_check_in(CHAT_ID, user.id, clock.today(), 10)
+
+    # 롤업과 원본 쓰기는 함께 롤백되어 서로 어긋나지 않는다
+    async with db.session() as session:
+        assert (await UserRepository(session).get_by_id(user.id)).total_score == 0
+    monkeypatch.undo()
+    assert (await chat_day(db)).check_in_count == 0
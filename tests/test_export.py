@@ -0,0 +1,94 @@
+"""
+Export chunk grid tests
+"""
+import argparse
+import csv
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+import export as export_module
+from export import grid_cells
+from src.core import clock
+from src.infrastructure.database.models import AttendanceModel
+
+
+@pytest.mark.unit
+def test_cells_follow_fixed_grid_regardless_of_bounds():
+    assert list(grid_cells(1, 26, 10)) == [(0, 10, True), (10, 20, True), (20, 30, False)]
+    # 최대 id가 늘어도 이미 완료된 구간의 이름(경계)은 그대로다
+    assert list(grid_cells(1, 36, 10)) == [
+        (0, 10, True),
+        (10, 20, True),
+        (20, 30, True),
+        (30, 40, False),
+    ]
+
+
+@pytest.mark.unit
+def test_cells_cut_by_start_id_are_partial():
+    assert list(grid_cells(15, 40, 10)) == [(10, 20, False), (20, 30, True), (30, 40, True)]
+
+
+@pytest.mark.unit
+def test_cells_near_max_id_are_not_final():
+    # 최대 id에서 settle 여유만큼 떨어지지 않은 구간은 늦게 커밋되는 행이 있을 수 있다
+    assert list(grid_cells(1, 36, 10, settled_id=26)) == [
+        (0, 10, True),
+        (10, 20, True),
+        (20, 30, False),
+        (30, 40, False),
+    ]
+
+
+@pytest.mark.integration
+async def test_rerun_picks_up_rows_committed_late_with_lower_ids(
+    db, create_user, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(export_module, "db_manager", db)
+    user = await create_user(1)
+
+    async def add_rows(ids):
+        async with db.session() as session:
+            await session.execute(
+                insert(AttendanceModel),
+                [
+                    {
+                        "id": row_id,
+                        "user_id": user.id,
+                        "chat_id": -100,
+                        "date": date(2026, 1, 1) + timedelta(days=row_id),
+                        "score": 10,
+                        "consecutive_days": 1,
+                        "created_at": clock.now(),
+                    }
+                    for row_id in ids
+                ],
+            )
+
+    def exported_ids():
+        ids = []
+        for path in sorted(tmp_path.glob("*.csv")):
+            with path.open(newline="", encoding="utf-8") as file:
+                ids += [int(row["id"]) for row in csv.DictReader(file)]
+        return sorted(ids)
+
+    args = argparse.Namespace(
+        table="attendances",
+        out=tmp_path,
+        chat_id=None,
+        start_id=1,
+        end_id=None,
+        chunk_size=10,
+        batch_size=100,
+        settle_ids=10,
+    )
+
+    # id 25는 할당됐지만 아직 커밋되지 않은 상태
+    await add_rows([row_id for row_id in range(1, 31) if row_id != 25])
+    await export_module.export(args)
+    await add_rows([25])
+    await export_module.export(args)
+
+    assert exported_ids() == list(range(1, 31))
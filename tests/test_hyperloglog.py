@@ -0,0 +1,122 @@
+"""
+HyperLogLog sketch tests
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from config import settings
+from src.core.entities.chat_activity import ChatActivity
+from src.infrastructure.hyperloglog import REGISTERS, HyperLogLog
+from src.repositories.daily_stats_repository import DailyStatsRepository
+
+CHAT_ID = -100
+
+
+def sketch_of(values) -> HyperLogLog:
+    sketch = HyperLogLog()
+    sketch.update(values)
+    return sketch
+
+
+@pytest.mark.unit
+def test_empty_sketch_counts_zero():
+    assert HyperLogLog().count() == 0
+
+
+@pytest.mark.unit
+def test_add_is_idempotent():
+    sketch = sketch_of(range(100))
+    before = sketch.to_bytes()
+
+    sketch.update(range(100))
+
+    assert sketch.to_bytes() == before
+
+
+@pytest.mark.unit
+def test_merge_is_union():
+    left = sketch_of(range(0, 3000))
+    right = sketch_of(range(2000, 5000))
+
+    left.merge(right)
+
+    # 겹치는 값은 한 번만 세므로 합집합 스케치와 레지스터가 같다
+    assert left.to_bytes() == sketch_of(range(0, 5000)).to_bytes()
+
+
+@pytest.mark.unit
+def test_merge_is_commutative_and_idempotent():
+    left = sketch_of(range(0, 500))
+    right = sketch_of(range(250, 1000))
+
+    forward = HyperLogLog(left.to_bytes())
+    forward.merge(right)
+    backward = HyperLogLog(right.to_bytes())
+    backward.merge(left)
+    assert forward.to_bytes() == backward.to_bytes()
+
+    merged = forward.to_bytes()
+    forward.merge(right)
+    assert forward.to_bytes() == merged
+
+
+@pytest.mark.unit
+def test_to_bytes_round_trip():
+    sketch = sketch_of(range(1000))
+
+    restored = HyperLogLog(sketch.to_bytes())
+
+    assert len(sketch.to_bytes()) == REGISTERS
+    assert restored.to_bytes() == sketch.to_bytes()
+    assert restored.count() == sketch.count()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cardinality", [10, 1_000, 50_000])
+def test_estimate_error_is_bounded(cardinality):
+    estimate = sketch_of(range(cardinality)).count()
+
+    # 표준 오차 약 1.6%의 3배 이내
+    assert abs(estimate - cardinality) <= max(1, cardinality * 0.05)
+
+
+@pytest.mark.unit
+def test_invalid_register_length_is_rejected():
+    with pytest.raises(ValueError):
+        HyperLogLog(bytes(REGISTERS - 1))
+
+
+@pytest.mark.integration
+async def test_active_users_merges_daily_sketches(db, create_user, monkeypatch):
+    users = [await create_user(telegram_id) for telegram_id in range(1, 6)]
+    first_day = datetime(2026, 1, 5, 12)
+
+    def activity(user_id: int, created_at: datetime) -> ChatActivity:
+        return ChatActivity(
+            id=0,
+            user_id=user_id,
+            chat_id=CHAT_ID,
+            message_id=1,
+            base_score=3,
+            is_jackpot=False,
+            multiplier=1,
+            final_score=3,
+            created_at=created_at,
+        )
+
+    # 첫날 1~4번, 다음 날 3~5번 사용자 (3, 4번은 이틀 모두 채팅)
+    async with db.session() as session:
+        await DailyStatsRepository(session).record_activities(
+            [activity(user.id, first_day) for user in users[:4]]
+            + [activity(user.id, first_day + timedelta(days=1)) for user in users[2:]]
+        )
+
+    monkeypatch.setattr(settings, "stats_exact_distinct_rows", 0)
+    async with db.session() as session:
+        count, estimated = await DailyStatsRepository(session).count_active_users(
+            CHAT_ID, first_day.date(), first_day.date() + timedelta(days=2)
+        )
+
+    assert estimated is True
+    assert count == len(users)
@@ -0,0 +1,216 @@
+"""
+Leaderboard and skip list tests
+"""
+import asyncio
+import random
+from dataclasses import replace
+
+import pytest
+
+from src.container import ServiceContainer
+from src.core import clock
+from src.core.entities.ranking import RankingType
+from src.core.entities.user import User
+from src.infrastructure.cache.leaderboard import IndexableSkipList, LeaderboardRegistry
+from src.infrastructure.cache.user_cache import UserCache
+
+CHAT_ID = -100
+
+
+def make_user(user_id: int, total_score: int = 0, chat_count: int = 0) -> User:
+    now = clock.now()
+    return User(
+        id=user_id,
+        telegram_id=user_id,
+        chat_id=CHAT_ID,
+        username=f"user{user_id}",
+        total_score=total_score,
+        chat_count=chat_count,
+        jackpot_count=0,
+        max_jackpot=0,
+        consecutive_days=0,
+        total_attendance=0,
+        last_checkin=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def loader_of(users):
+    async def load():
+        for user in users:
+            yield user
+
+    return load
+
+
+class TestIndexableSkipList:
+    pytestmark = pytest.mark.unit
+
+    def test_matches_sorted_list_under_random_operations(self):
+        rng = random.Random(7)
+        skip_list = IndexableSkipList()
+        expected = []
+
+        for _ in range(2000):
+            if expected and rng.random() < 0.4:
+                value = rng.choice(expected)
+                skip_list.remove(value)
+                expected.remove(value)
+            else:
+                value = rng.randrange(100_000)
+                if value in expected:
+                    continue
+                skip_list.insert(value)
+                expected.append(value)
+            expected.sort()
+
+        assert len(skip_list) == len(expected)
+        assert list(skip_list.islice(0, len(expected))) == expected
+        for position in rng.sample(range(len(expected)), 50):
+            assert skip_list[position] == expected[position]
+            assert skip_list.index(expected[position]) == position
+
+    def test_missing_values_raise(self):
+        skip_list = IndexableSkipList()
+        skip_list.insert(1)
+        with pytest.raises(KeyError):
+            skip_list.remove(2)
+        with pytest.raises(ValueError):
+            skip_list.index(2)
+        with pytest.raises(IndexError):
+            skip_list[1]
+
+
+class TestLeaderboardRegistry:
+    pytestmark = pytest.mark.unit
+
+    async def test_ranks_follow_updates(self):
+        registry = LeaderboardRegistry()
+        users = [make_user(1, total_score=10), make_user(2, total_score=30), make_user(3)]
+        await registry.ensure_loaded(CHAT_ID, loader_of(users))
+
+        top = registry.top(CHAT_ID, RankingType.SCORE, limit=10)
+        assert [user.id for user in top] == [2, 1]
+        assert registry.rank_of(CHAT_ID, RankingType.SCORE, 3) is None
+
+        registry.update(replace(users[0], total_score=50))
+        assert registry.rank_of(CHAT_ID, RankingType.SCORE, 1) == 1
+        assert registry.rank_of(CHAT_ID, RankingType.SCORE, 2) == 2
+        assert registry.size(CHAT_ID, RankingType.SCORE) == 2
+
+    async def test_ties_are_broken_by_newer_user_first(self):
+        registry = LeaderboardRegistry()
+        users = [make_user(1, total_score=10), make_user(2, total_score=10)]
+        await registry.ensure_loaded(CHAT_ID, loader_of(users))
+
+        top = registry.top(CHAT_ID, RankingType.SCORE, limit=10)
+        assert [user.id for user in top] == [2, 1]
+
+    async def test_update_during_load_wins_over_loaded_state(self):
+        registry = LeaderboardRegistry()
+        stale = make_user(1, total_score=10)
+
+        async def load():
+            registry.update(replace(stale, total_score=99))
+            yield stale
+
+        await registry.ensure_loaded(CHAT_ID, load)
+        assert registry.top(CHAT_ID, RankingType.SCORE, limit=1)[0].total_score == 99
+
+    async def test_reloads_after_interval(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("src.infrastructure.cache.leaderboard.time.monotonic", lambda: now[0])
+        registry = LeaderboardRegistry(reload_interval=60)
+        await registry.ensure_loaded(CHAT_ID, loader_of([make_user(1, total_score=10)]))
+        version = registry.data_version(CHAT_ID)
+
+        # 다른 레플리카가 쓴 값은 다시 적재할 때까지 보이지 않는다
+        replica_write = loader_of([make_user(1, total_score=10), make_user(2, total_score=20)])
+        now[0] += 30
+        await registry.ensure_loaded(CHAT_ID, replica_write)
+        assert registry.size(CHAT_ID, RankingType.SCORE) == 1
+
+        now[0] += 31
+        await registry.ensure_loaded(CHAT_ID, replica_write)
+        assert registry.size(CHAT_ID, RankingType.SCORE) == 2
+        assert registry.data_version(CHAT_ID) > version
+
+    async def test_reload_in_progress_serves_old_board(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("src.infrastructure.cache.leaderboard.time.monotonic", lambda: now[0])
+        registry = LeaderboardRegistry(reload_interval=60)
+        await registry.ensure_loaded(CHAT_ID, loader_of([make_user(1, total_score=10)]))
+
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_load():
+            started.set()
+            await release.wait()
+            yield make_user(1, total_score=10)
+            yield make_user(2, total_score=20)
+
+        now[0] += 61
+        reload = asyncio.create_task(registry.ensure_loaded(CHAT_ID, slow_load))
+        await started.wait()
+
+        await asyncio.wait_for(
+            registry.ensure_loaded(CHAT_ID, loader_of([])), timeout=1
+        )
+        assert registry.size(CHAT_ID, RankingType.SCORE) == 1
+
+        release.set()
+        await reload
+        assert registry.size(CHAT_ID, RankingType.SCORE) == 2
+
+    async def test_data_versions_are_bounded_with_boards(self):
+        registry = LeaderboardRegistry(max_chats=2)
+        for chat_id in (-1, -2, -3):
+            await registry.ensure_loaded(chat_id, loader_of([]))
+            registry.touch(chat_id - 100)
+        assert not registry.is_loaded(-1)
+        assert len(registry._data_versions) == 2
+
+        evicted = max(registry.data_version(chat_id) for chat_id in (-2, -3))
+        assert registry.data_version(-1) > evicted
+
+        registry.clear()
+        assert not registry._data_versions
+
+
+class TestPublishAfterCommit:
+    pytestmark = pytest.mark.integration
+
+    async def test_committed_changes_are_published(self, db, create_user):
+        registry = LeaderboardRegistry()
+        user = await create_user(1)
+        await registry.ensure_loaded(CHAT_ID, loader_of([user]))
+        user_cache = UserCache(maxsize=100, ttl=60, negative_ttl=60)
+
+        async with ServiceContainer(
+            db.session_factory, user_cache, leaderboards=registry
+        ) as container:
+            user_repo = await container.resolve("user_repo")
+            await user_repo.record_checkin(user.id, score=10, consecutive_days=1)
+            assert registry.size(CHAT_ID, RankingType.SCORE) == 0
+
+        assert registry.rank_of(CHAT_ID, RankingType.SCORE, user.id) == 1
+        assert user_cache.lookup(CHAT_ID, user.telegram_id)[1].total_score == 10
+
+    async def test_rolled_back_changes_are_not_published(self, db, create_user):
+        registry = LeaderboardRegistry()
+        user = await create_user(1)
+        await registry.ensure_loaded(CHAT_ID, loader_of([user]))
+        user_cache = UserCache(maxsize=100, ttl=60, negative_ttl=60)
+
+        with pytest.raises(RuntimeError):
+            async with ServiceContainer(
+                db.session_factory, user_cache, leaderboards=registry
+            ) as container:
+                user_repo = await container.resolve("user_repo")
+                await user_repo.record_checkin(user.id, score=10, consecutive_days=1)
+                raise RuntimeError("handler failed")
+
+        assert registry.size(CHAT_ID, RankingType.SCORE) == 0
+        assert user_cache.lookup(CHAT_ID, user.telegram_id) == (False, None)
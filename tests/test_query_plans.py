@@ -0,0 +1,136 @@
+"""
+Query plan tests - ranking, my-rank and stats queries must use their indexes (SQLite)
+"""
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Any, List, Tuple
+
+import pytest
+from sqlalchemy import event
+
+from src.core.entities.ranking import RankingType
+from src.repositories.attendance_repository import AttendanceRepository
+from src.repositories.chat_activity_repository import ChatActivityRepository
+from src.repositories.daily_stats_repository import DailyStatsRepository
+from src.repositories.user_repository import UserRepository
+
+pytestmark = pytest.mark.integration
+
+CHAT_ID = -100
+
+RANKING_INDEXES = {
+    RankingType.SCORE: "ix_users_chat_total_score_id",
+    RankingType.CHAT_COUNT: "ix_users_chat_chat_count_id",
+    RankingType.JACKPOT: "ix_users_chat_jackpot_ranking",
+    RankingType.CONSECUTIVE_DAYS: "ix_users_chat_consecutive_ranking",
+}
+
+
+@contextmanager
+def captured_selects(db):
+    """블록 안에서 실행된 SELECT 문과 파라미터 수집"""
+    statements: List[Tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine.sync_engine, "before_cursor_execute", capture)
+
+
+async def query_plans(db, statements: List[Tuple[str, Any]]) -> List[str]:
+    """수집한 문장별 EXPLAIN QUERY PLAN 결과 (단계 설명을 줄바꿈으로 연결)"""
+    plans = []
+    async with db.engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+            plans.append("\n".join(row[-1] for row in result))
+    return plans
+
+
+def assert_uses_index(plan: str, index: str) -> None:
+    """인덱스로 찾고 정렬도 인덱스 순서를 그대로 사용하는지"""
+    assert index in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+
+def assert_primary_key_range(plan: str, table: str) -> None:
+    """롤업 테이블을 기본 키(chat_id, 기간) 범위로만 읽는지 (전체 스캔 없음)"""
+    assert f"SEARCH {table} USING INDEX sqlite_autoindex_{table}_1 (chat_id=?" in plan, plan
+    assert f"SCAN {table}" not in plan, plan
+
+
+@pytest.fixture
+async def ranked_user(db, create_user):
+    user = await create_user(1)
+    async with db.session() as session:
+        return await UserRepository(session).record_checkin(user.id, score=10, consecutive_days=1)
+
+
+@pytest.mark.parametrize("ranking_type", list(RankingType))
+async def test_ranking_pages_use_ranking_index(db, ranked_user, ranking_type):
+    columns = ranking_type.sort_key(ranked_user) + (ranked_user.id,)
+    with captured_selects(db) as statements:
+        async with db.session() as session:
+            repo = UserRepository(session)
+            await repo.get_ranking_page(CHAT_ID, ranking_type, limit=10)
+            await repo.get_ranking_page(CHAT_ID, ranking_type, limit=10, after=columns)
+            await repo.get_ranking_page(CHAT_ID, ranking_type, limit=10, before=columns)
+            await repo.count_ranked(CHAT_ID, ranking_type)
+
+    for plan in await query_plans(db, statements):
+        assert_uses_index(plan, RANKING_INDEXES[ranking_type])
+
+
+@pytest.mark.parametrize("ranking_type", list(RankingType))
+async def test_my_rank_queries_use_ranking_index(db, ranked_user, ranking_type):
+    with captured_selects(db) as statements:
+        async with db.session() as session:
+            repo = UserRepository(session)
+            await repo.count_ranked_ahead(ranking_type, ranked_user)
+            await repo.get_ranking_neighbors(ranking_type, ranked_user, count=2)
+
+    plans = await query_plans(db, statements)
+    assert len(plans) == 3
+    for plan in plans:
+        assert_uses_index(plan, RANKING_INDEXES[ranking_type])
+
+
+async def test_user_history_queries_use_indexes(db, ranked_user):
+    with captured_selects(db) as statements:
+        async with db.session() as session:
+            await ChatActivityRepository(session).get_by_user(ranked_user.id)
+            await ChatActivityRepository(session).get_jackpots_by_user(ranked_user.id)
+            await AttendanceRepository(session).get_by_user(ranked_user.id)
+
+    recent, jackpots, attendances = await query_plans(db, statements)
+    assert_uses_index(recent, "ix_chat_activities_user_id_created_at")
+    assert_uses_index(jackpots, "ix_chat_activities_user_jackpots")
+    # SQLite는 UNIQUE 제약(uq_attendances_user_id_date)을 자동 인덱스로 만든다
+    assert_uses_index(attendances, "sqlite_autoindex_attendances_1 (user_id=?)")
+
+
+async def test_stats_queries_read_rollups_by_primary_key(db):
+    start, end = date(2026, 10, 1), date(2026, 11, 1)
+    with captured_selects(db) as statements:
+        async with db.session() as session:
+            repo = DailyStatsRepository(session)
+            await repo.get_chat_days(CHAT_ID, start, end)
+            await repo.count_active_users(CHAT_ID, start, end)
+            await repo.get_top_users(CHAT_ID, start, end, limit=10)
+            await repo.get_hour_buckets(
+                CHAT_ID, datetime(2026, 10, 1), datetime(2026, 10, 1) + timedelta(days=7)
+            )
+
+    days, active_rows, active_users, top_users, hours = await query_plans(db, statements)
+    assert_uses_index(days, "sqlite_autoindex_daily_chat_stats_1")
+    assert_primary_key_range(active_rows, "daily_chat_stats")
+    assert_primary_key_range(active_users, "daily_user_stats")
+    # 기간 합산 순위는 집계 결과를 정렬해야 하므로 임시 정렬은 허용
+    assert_primary_key_range(top_users, "daily_user_stats")
+    assert "SEARCH users USING INTEGER PRIMARY KEY" in top_users, top_users
+    assert_uses_index(hours, "sqlite_autoindex_hourly_chat_stats_1")
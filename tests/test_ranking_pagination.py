@@ -0,0 +1,93 @@
+"""
+Ranking keyset pagination tests
+"""
+import pytest
+
+from src.core.use_cases.get_ranking_usecase import GetRankingUseCase, RankingCursor, RankingType
+from src.handlers.ranking_handler import RankingPageCallback
+from src.infrastructure.cache.leaderboard import LeaderboardRegistry
+from src.repositories.user_repository import UserRepository
+
+pytestmark = pytest.mark.integration
+
+CHAT_ID = -100
+PAGE_SIZE = 4
+
+
+@pytest.fixture
+async def ranked_users(db):
+    """동점이 섞인 점수 사용자 11명 + 랭킹 대상이 아닌 사용자 1명"""
+    users = []
+    async with db.session() as session:
+        repo = UserRepository(session)
+        for index in range(12):
+            user = await repo.create(1000 + index, CHAT_ID, f"user{index}")
+            if index < 11:
+                user = await repo.record_checkin(user.id, score=index // 3 + 1, consecutive_days=1)
+            users.append(user)
+    return users
+
+
+def expected_order(users):
+    ranked = [user for user in users if user.total_score > 0]
+    return [user.id for user in sorted(ranked, key=lambda u: (u.total_score, u.id), reverse=True)]
+
+
+async def walk_forward(use_case):
+    pages = [await use_case.execute_page(CHAT_ID, RankingType.SCORE, PAGE_SIZE)]
+    while pages[-1].next_cursor():
+        pages.append(
+            await use_case.execute_page(
+                CHAT_ID, RankingType.SCORE, PAGE_SIZE, pages[-1].next_cursor()
+            )
+        )
+    return pages
+
+
+@pytest.mark.parametrize("use_leaderboard", [False, True], ids=["keyset", "leaderboard"])
+async def test_pages_cover_ranking_once_in_order(db, ranked_users, use_leaderboard):
+    async with db.session() as session:
+        leaderboards = LeaderboardRegistry() if use_leaderboard else None
+        use_case = GetRankingUseCase(UserRepository(session), leaderboards)
+        pages = await walk_forward(use_case)
+
+    assert [page.page for page in pages] == [0, 1, 2]
+    assert [page.start_rank for page in pages] == [1, 5, 9]
+    assert [user.id for page in pages for user in page.users] == expected_order(ranked_users)
+    assert not pages[-1].has_next
+
+
+async def test_prev_cursor_returns_same_pages(db, ranked_users):
+    async with db.session() as session:
+        use_case = GetRankingUseCase(UserRepository(session))
+        forward = await walk_forward(use_case)
+
+        page = forward[-1]
+        backward = [page]
+        while page.prev_cursor():
+            page = await use_case.execute_page(
+                CHAT_ID, RankingType.SCORE, PAGE_SIZE, page.prev_cursor()
+            )
+            backward.append(page)
+
+    assert [[u.id for u in p.users] for p in reversed(backward)] == [
+        [u.id for u in p.users] for p in forward
+    ]
+    assert all(page.has_next for page in backward[1:])
+
+
+async def test_cursor_survives_callback_round_trip(db, ranked_users):
+    async with db.session() as session:
+        use_case = GetRankingUseCase(UserRepository(session))
+        first = await use_case.execute_page(CHAT_ID, RankingType.SCORE, PAGE_SIZE)
+
+    cursor = first.next_cursor()
+    packed = RankingPageCallback.from_cursor(RankingType.SCORE, cursor).pack()
+    assert len(packed.encode()) <= 64
+    assert RankingPageCallback.unpack(packed).to_cursor() == cursor
+
+
+def test_cursor_keys_fit_callback_limit_for_large_values():
+    cursor = RankingCursor(page=99_999, key=(2**31 - 1, 2**31 - 1, 2**31 - 1), forward=False)
+    packed = RankingPageCallback.from_cursor(RankingType.CONSECUTIVE_DAYS, cursor).pack()
+    assert len(packed.encode()) <= 64
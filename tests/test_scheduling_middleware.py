@@ -0,0 +1,134 @@
+"""
+UpdateSchedulerMiddleware tests
+"""
+import asyncio
+from types import SimpleNamespace
+from typing import Dict, List
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.middlewares.scheduling_middleware import BUSY_REPLY, UpdateSchedulerMiddleware
+
+pytestmark = pytest.mark.unit
+
+
+def update(update_id: int, user_id: int):
+    return SimpleNamespace(update_id=update_id), {"event_from_user": SimpleNamespace(id=user_id)}
+
+
+class RecordingHandler:
+    """처리 순서를 기록하고, gate가 열릴 때까지 막히는 핸들러"""
+
+    def __init__(self) -> None:
+        self.started: List[int] = []
+        self.finished: List[int] = []
+        self.gates: Dict[int, asyncio.Event] = {}
+
+    def gate(self, update_id: int) -> asyncio.Event:
+        return self.gates.setdefault(update_id, asyncio.Event())
+
+    async def __call__(self, event, data):
+        self.started.append(event.update_id)
+        await self.gate(event.update_id).wait()
+        self.finished.append(event.update_id)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_same_user_updates_run_in_order():
+    scheduler = UpdateSchedulerMiddleware(max_in_flight=4)
+    handler = RecordingHandler()
+    for update_id in (1, 2, 3):
+        await scheduler(handler, *update(update_id, user_id=7))
+
+    await settle()
+    assert handler.started == [1]
+
+    for update_id in (1, 2, 3):
+        handler.gate(update_id).set()
+    await scheduler.drain()
+    assert handler.finished == [1, 2, 3]
+
+
+async def test_waiting_updates_do_not_hold_slots():
+    scheduler = UpdateSchedulerMiddleware(max_in_flight=2)
+    handler = RecordingHandler()
+    for update_id in range(1, 6):
+        await scheduler(handler, *update(update_id, user_id=7))
+
+    # 같은 사용자의 대기 업데이트가 슬롯을 잡고 있으면 여기서 멈춘다
+    await asyncio.wait_for(scheduler(handler, *update(10, user_id=8)), timeout=1)
+    await settle()
+    assert handler.started == [1, 10]
+
+    for gate in (1, 2, 3, 4, 5, 10):
+        handler.gate(gate).set()
+    await scheduler.drain()
+
+
+async def test_intake_waits_for_free_slot():
+    scheduler = UpdateSchedulerMiddleware(max_in_flight=1)
+    handler = RecordingHandler()
+    await scheduler(handler, *update(1, user_id=7))
+
+    blocked = asyncio.create_task(scheduler(handler, *update(2, user_id=8)))
+    await settle()
+    assert not blocked.done()
+
+    handler.gate(1).set()
+    handler.gate(2).set()
+    await blocked
+    await scheduler.drain()
+    assert handler.finished == [1, 2]
+
+
+async def test_updates_over_per_user_cap_are_dropped():
+    scheduler = UpdateSchedulerMiddleware(max_in_flight=4, max_queued_per_user=2)
+    handler = RecordingHandler()
+    for update_id in range(1, 6):
+        await scheduler(handler, *update(update_id, user_id=7))
+
+    for update_id in range(1, 6):
+        handler.gate(update_id).set()
+    await scheduler.drain()
+    assert handler.finished == [1, 2, 3]
+
+
+async def test_dropped_commands_get_one_busy_reply():
+    scheduler = UpdateSchedulerMiddleware(max_in_flight=4, max_queued_per_user=1)
+    handler = RecordingHandler()
+    reply = AsyncMock()
+
+    def command(update_id: int, text: str = "/출첵"):
+        message = SimpleNamespace(text=text, reply=reply)
+        return SimpleNamespace(update_id=update_id, message=message), {
+            "event_from_user": SimpleNamespace(id=7)
+        }
+
+    await scheduler(handler, *command(1))
+    await scheduler(handler, *command(2))
+    await scheduler(handler, *command(3, text="안녕"))
+    await scheduler(handler, *command(4))
+    await scheduler(handler, *command(5))
+    await settle()
+    # 메시지는 조용히 버리고, 명령어는 대기열이 빌 때까지 한 번만 안내한다
+    reply.assert_awaited_once_with(BUSY_REPLY)
+
+    for update_id in (1, 2):
+        handler.gate(update_id).set()
+    await scheduler.drain()
+    assert handler.finished == [1, 2]
+
+    await scheduler(handler, *command(6))
+    await scheduler(handler, *command(7))
+    await scheduler(handler, *command(8))
+    await settle()
+    assert reply.await_count == 2
+
+    for update_id in (6, 7):
+        handler.gate(update_id).set()
+    await scheduler.drain()
@@ -0,0 +1,50 @@
+"""
+ContainerMiddleware tests
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.container import ServiceContainer
+from src.core.exceptions import AlreadyCheckedInError
+from src.infrastructure.cache.user_cache import UserCache
+from src.infrastructure.locks import KeyedLockManager
+from src.middlewares.services_middleware import ContainerMiddleware
+
+pytestmark = pytest.mark.integration
+
+CHAT_ID = -100
+TELEGRAM_ID = 1
+
+
+async def check_in(event, data):
+    usecase = await data["container"].resolve("checkin_usecase")
+    # 다른 업데이트가 끼어들 틈을 만든다
+    await asyncio.sleep(0)
+    return await usecase.execute(TELEGRAM_ID, CHAT_ID, "user")
+
+
+async def test_user_lock_is_held_through_commit_and_publish(db):
+    user_cache = UserCache(maxsize=100, ttl=60, negative_ttl=60)
+    # 등록 전에 보낸 메시지로 캐시에 미등록 표시가 남아 있는 상태
+    user_cache.mark_unregistered(CHAT_ID, TELEGRAM_ID)
+    middleware = ContainerMiddleware(
+        lambda: ServiceContainer(db.session_factory, user_cache=user_cache), KeyedLockManager()
+    )
+
+    def data():
+        return {
+            "event_from_user": SimpleNamespace(id=TELEGRAM_ID),
+            "event_chat": SimpleNamespace(id=CHAT_ID),
+        }
+
+    results = await asyncio.gather(
+        middleware(check_in, SimpleNamespace(update_id=1), data()),
+        middleware(check_in, SimpleNamespace(update_id=2), data()),
+        return_exceptions=True,
+    )
+
+    # 두 번째 업데이트는 첫 업데이트가 커밋하고 캐시에 반영한 사용자를 읽는다
+    assert results[0].is_new_user
+    assert isinstance(results[1], AlreadyCheckedInError)
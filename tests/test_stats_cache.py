@@ -0,0 +1,42 @@
+"""
+Stats cache tests
+"""
+from datetime import date
+
+import pytest
+
+from src.infrastructure.cache.stats_cache import StatsCache
+
+pytestmark = pytest.mark.unit
+
+CHAT_ID = -100
+DAY = date(2026, 1, 2)
+
+
+@pytest.fixture
+def cache() -> StatsCache:
+    return StatsCache(maxsize=16, open_ttl=300)
+
+
+def test_open_period_entry_misses_after_data_version_change(cache):
+    cache.put(CHAT_ID, "day", DAY, "stale", closed=False, version=1)
+
+    assert cache.get(CHAT_ID, "day", DAY, version=1) == "stale"
+    assert cache.get(CHAT_ID, "day", DAY, version=2) is None
+
+    cache.put(CHAT_ID, "day", DAY, "fresh", closed=False, version=2)
+    assert cache.get(CHAT_ID, "day", DAY, version=2) == "fresh"
+
+
+def test_closed_period_entry_ignores_data_version(cache):
+    cache.put(CHAT_ID, "day", DAY, "final", closed=True, version=1)
+
+    assert cache.get(CHAT_ID, "day", DAY, version=5) == "final"
+    assert cache.get(CHAT_ID, "day", DAY) == "final"
+
+
+def test_open_period_without_version_uses_ttl_only(cache):
+    cache.put(CHAT_ID, "day", DAY, "stats", closed=False)
+
+    assert cache.get(CHAT_ID, "day", DAY) == "stats"
+    assert cache.get(CHAT_ID, "day", DAY, version=1) is None
@@ -0,0 +1,36 @@
+"""
+Stats command argument tests
+"""
+from datetime import date, datetime
+
+import pytest
+
+from src.core import clock
+from src.handlers.stats_handler import parse_date_arg, parse_month_arg
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def fixed_now(monkeypatch):
+    monkeypatch.setattr(clock, "now", lambda: datetime(2026, 3, 15, 12, 0))
+
+
+def test_date_arg_defaults_to_today():
+    assert parse_date_arg(None) == date(2026, 3, 15)
+    assert parse_date_arg("2026-02-28") == date(2026, 2, 28)
+
+
+@pytest.mark.parametrize("args", ["2026-03-16", "2026-02-30", "어제", "20260301"])
+def test_future_or_malformed_date_is_rejected(args):
+    assert parse_date_arg(args) is None
+
+
+def test_month_arg_defaults_to_this_month():
+    assert parse_month_arg(None) == (2026, 3)
+    assert parse_month_arg(" 2025-12 ") == (2025, 12)
+
+
+@pytest.mark.parametrize("args", ["2026-04", "2026-13", "2026/01"])
+def test_future_or_malformed_month_is_rejected(args):
+    assert parse_month_arg(args) is None